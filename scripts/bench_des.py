@@ -0,0 +1,226 @@
+"""
+⏱️ Benchmarks DES - CryptoUNS
+===========================
+
+Micro-benchmarks del cifrado DES del sistema.
+
+Uso:
+    python scripts/bench_des.py                 # Todas las secciones
+    python scripts/bench_des.py context         # Solo una sección
+    python scripts/bench_des.py stream --file-mb 1024
+    python scripts/bench_des.py parallel --workers 1 2 4 8
+    python scripts/bench_des.py modes --file-mb 16 --workers 1 8
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import argparse
+import random
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Crypto.Cipher import DES
+from Crypto.Util.Padding import pad, unpad
+
+from src.crypto.modern import DESCipher
+from src.utils.constants import DES_MODES
+
+
+def report(label: str, seconds: float, messages: int, nbytes: int) -> None:
+    """Imprimir una fila de resultados en mensajes/s (si aplica) y MB/s"""
+    rate = f"{messages / seconds:>12,.0f} msg/s" if messages else " " * 18
+    print(f"  {label:<44} {rate} {nbytes / seconds / 1e6:>8.2f} MB/s {seconds * 1e3:>9.1f} ms")
+
+
+def measure(func, repeat: int) -> float:
+    """Mejor tiempo de varias ejecuciones"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _legacy_encrypt(message: bytes, key: str, mode: str, iv: bytes) -> bytes:
+    """Cifrado anterior: valida y codifica la clave y llama a DES.new() en cada mensaje"""
+    if len(key) != 8:
+        raise ValueError("clave")
+    key_bytes = key.encode('utf-8')
+    cipher = DES.new(key_bytes, DES.MODE_ECB) if mode == 'ECB' else DES.new(key_bytes, DES.MODE_CBC, iv)
+    return cipher.encrypt(pad(message, DES.block_size))
+
+
+def _legacy_decrypt(ciphertext: bytes, key: str, mode: str, iv: bytes) -> bytes:
+    """Descifrado anterior, un DES.new() por mensaje"""
+    if len(key) != 8:
+        raise ValueError("clave")
+    key_bytes = key.encode('utf-8')
+    cipher = DES.new(key_bytes, DES.MODE_ECB) if mode == 'ECB' else DES.new(key_bytes, DES.MODE_CBC, iv)
+    return unpad(cipher.decrypt(ciphertext), DES.block_size)
+
+
+def bench_context(args) -> None:
+    """Contexto con la clave expandida y operaciones en lote frente a DES.new() por mensaje"""
+    rng = random.Random(args.seed)
+    key = "clave123"
+    messages = [rng.randbytes(args.message_size) for _ in range(args.messages)]
+    ivs = [rng.randbytes(8) for _ in range(args.messages)]
+    nbytes = args.messages * args.message_size
+    des = DESCipher()
+
+    print(f"== Contexto DES ({args.messages} mensajes de {args.message_size} bytes) ==")
+    for mode in ('ECB', 'CBC'):
+        context = des.context(key, mode)
+        mode_ivs = ivs if mode == 'CBC' else None
+        encrypted = [ciphertext for ciphertext, _ in context.encrypt_many(messages, mode_ivs)]
+
+        rows = [
+            ("cifrar, DES.new() por mensaje",
+             lambda: [_legacy_encrypt(m, key, mode, iv) for m, iv in zip(messages, ivs)]),
+            ("cifrar, contexto por mensaje",
+             lambda: [context.encrypt(m, None if mode_ivs is None else iv) for m, iv in zip(messages, ivs)]),
+            ("cifrar, encrypt_many", lambda: context.encrypt_many(messages, mode_ivs)),
+            ("descifrar, DES.new() por mensaje",
+             lambda: [_legacy_decrypt(c, key, mode, iv) for c, iv in zip(encrypted, ivs)]),
+            ("descifrar, contexto por mensaje",
+             lambda: [context.decrypt(c, None if mode_ivs is None else iv) for c, iv in zip(encrypted, ivs)]),
+            ("descifrar, decrypt_many", lambda: context.decrypt_many(encrypted, mode_ivs)),
+        ]
+        for label, func in rows:
+            report(f"{mode} {label}", measure(func, args.repeat), args.messages, nbytes)
+
+
+def _peak_memory(func) -> int:
+    """Pico de memoria Python (bytes) durante una ejecución"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_stream(args) -> None:
+    """Cifrado de archivos por flujo frente a la API de texto hexadecimal"""
+    rng = random.Random(args.seed)
+    key = "clave123"
+    size = args.file_mb * 1024 * 1024
+    # Texto ASCII para que la API de str pueda procesar los mismos datos
+    text = bytes(rng.randrange(32, 127) for _ in range(1 << 16)) * (size >> 16)
+    des = DESCipher()
+
+    print(f"== Archivos DES ({args.file_mb} MiB, CBC) ==")
+    with tempfile.TemporaryDirectory() as directory:
+        plain = os.path.join(directory, "plano.txt")
+        encrypted = os.path.join(directory, "cifrado.des")
+        restored = os.path.join(directory, "restaurado.txt")
+        with open(plain, 'wb') as f:
+            f.write(text)
+
+        def string_api():
+            with open(plain, 'r', encoding='ascii') as f:
+                ciphertext_hex, iv_hex = des.encrypt_cbc(f.read(), key)
+            with open(encrypted, 'w', encoding='ascii') as f:
+                f.write(iv_hex + ciphertext_hex)
+
+        def string_api_decrypt():
+            with open(encrypted, 'r', encoding='ascii') as f:
+                content = f.read()
+            with open(restored, 'w', encoding='ascii') as f:
+                f.write(des.decrypt_cbc(content[16:], key, content[:16]))
+
+        string_api()
+        report("cifrar, encrypt_cbc (str -> hex)", measure(string_api, args.repeat), 0, size)
+        print(f"    tamaño de salida: {os.path.getsize(encrypted) / size:.2f}x, "
+              f"pico de memoria: {_peak_memory(string_api) / 2**20:.1f} MiB")
+        report("descifrar, decrypt_cbc (hex -> str)", measure(string_api_decrypt, args.repeat), 0, size)
+
+        encrypt_file = lambda: des.encrypt_file(plain, encrypted, key, 'CBC')
+        decrypt_file = lambda: des.decrypt_file(encrypted, restored, key, 'CBC')
+        encrypt_file()
+        report("cifrar, encrypt_file (binario por flujo)", measure(encrypt_file, args.repeat), 0, size)
+        print(f"    tamaño de salida: {os.path.getsize(encrypted) / size:.2f}x, "
+              f"pico de memoria: {_peak_memory(encrypt_file) / 2**20:.1f} MiB")
+        report("descifrar, decrypt_file (binario por flujo)", measure(decrypt_file, args.repeat), 0, size)
+        print(f"    pico de memoria: {_peak_memory(decrypt_file) / 2**20:.1f} MiB")
+
+
+def bench_parallel(args) -> None:
+    """ECB y descifrado CBC por segmentos en un pool de hilos frente a una sola llamada"""
+    size = args.file_mb * 1024 * 1024
+    data = random.Random(args.seed).randbytes(size)
+    key = "clave123"
+    iv = b"12345678"
+    des = DESCipher()
+
+    print(f"== DES en paralelo ({args.file_mb} MiB, {os.cpu_count()} núcleos) ==")
+    ecb, _ = des.encrypt_bytes(data, key, 'ECB')
+    cbc, _ = des.encrypt_bytes(data, key, 'CBC', iv)
+    rows = [
+        ("ECB cifrar", lambda workers: des.encrypt_bytes(data, key, 'ECB', workers=workers)),
+        ("ECB descifrar", lambda workers: des.decrypt_bytes(ecb, key, 'ECB', workers=workers)),
+        ("CBC descifrar", lambda workers: des.decrypt_bytes(cbc, key, 'CBC', iv, workers=workers)),
+    ]
+    for label, func in rows:
+        for workers in args.workers:
+            report(f"{label}, {workers} hilo(s)", measure(lambda: func(workers), args.repeat), 0, size)
+
+
+def bench_modes(args) -> None:
+    """DES y 3DES en cada modo, con uno y varios hilos"""
+    size = args.file_mb * 1024 * 1024
+    data = random.Random(args.seed).randbytes(size)
+    keys = {'DES': b"clave123", '3DES': b"clave123CLAVE456clave789"}
+    des = DESCipher()
+
+    print(f"== Modos DES/3DES ({args.file_mb} MiB, {os.cpu_count()} núcleos) ==")
+    for algorithm, key in keys.items():
+        for mode in DES_MODES:
+            ciphertext, iv = des.encrypt_bytes(data, key, mode)
+            for workers in args.workers:
+                report(f"{algorithm}-{mode} cifrar, {workers} hilo(s)",
+                       measure(lambda: des.encrypt_bytes(data, key, mode, iv, workers), args.repeat), 0, size)
+                report(f"{algorithm}-{mode} descifrar, {workers} hilo(s)",
+                       measure(lambda: des.decrypt_bytes(ciphertext, key, mode, iv, workers), args.repeat), 0, size)
+
+
+SECTIONS = {
+    'context': bench_context,
+    'stream': bench_stream,
+    'parallel': bench_parallel,
+    'modes': bench_modes,
+}
+
+
+def main() -> None:
+    """Punto de entrada de los benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks DES de CryptoUNS")
+    parser.add_argument('sections', nargs='*', help=f"Secciones a ejecutar ({', '.join(SECTIONS)})")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    parser.add_argument('--seed', type=int, default=2025, help="Semilla para datos de prueba")
+    parser.add_argument('--messages', type=int, default=100_000, help="Mensajes por lote")
+    parser.add_argument('--message-size', type=int, default=64, help="Tamaño de cada mensaje en bytes")
+    parser.add_argument('--file-mb', type=int, default=64, help="Tamaño en MiB del archivo a cifrar")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help="Hilos a comparar en 'parallel' y 'modes'")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.sections if name not in SECTIONS]
+    if unknown:
+        parser.error(f"Sección desconocida: {', '.join(unknown)}")
+
+    for name in args.sections or list(SECTIONS):
+        SECTIONS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+⏱️ Benchmarks Hash - CryptoUNS
+============================
+
+Micro-benchmarks de las funciones hash del sistema.
+
+Uso:
+    python scripts/bench_hash.py                # Todas las secciones
+    python scripts/bench_hash.py custom         # Solo una sección
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import os
+import tempfile
+import time
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.crypto import hashing, hash_kernels
+from src.crypto.modern import CustomHash
+from src.crypto.tools import IntegrityVerifier
+
+
+def report(label: str, seconds: float, nbytes: int) -> None:
+    """Imprimir una fila de resultados en MB/s"""
+    print(f"  {label:<44} {nbytes / seconds / 1e6:>10.2f} MB/s {seconds * 1e3:>10.1f} ms")
+
+
+def measure(func, repeat: int) -> float:
+    """Mejor tiempo de varias ejecuciones"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _legacy_256(data: bytes) -> str:
+    """hash_256 anterior: cuatro pasadas byte a byte con enmascarado en cada paso"""
+    hashes = []
+    seeds = [0x811c9dc5, 0x9E3779B9, 0x85ebca6b, 0xc2b2ae35]
+    multipliers = [0x01000193, 0x40014141, 0x27d4eb2d, 0x165667b1]
+    for seed, mult in zip(seeds, multipliers):
+        hash_val = seed
+        for i, byte in enumerate(data):
+            hash_val ^= byte
+            hash_val *= mult
+            hash_val ^= (i * seed) & 0xFF
+            hash_val &= 0xFFFFFFFFFFFFFFFF
+        hash_val ^= hash_val >> 32
+        hash_val ^= hash_val >> 16
+        hash_val &= 0xFFFFFFFFFFFFFFFF
+        hashes.append(f"{hash_val:016x}")
+    return ''.join(hashes)
+
+
+def bench_custom(args) -> None:
+    """Comparar las variantes de los hash personalizados en MB/s"""
+    rng = random.Random(args.seed)
+    print("== Hash personalizados (MB/s) ==")
+    if not hash_kernels.NUMPY_AVAILABLE:
+        print("  NumPy no disponible: se omiten los kernels vectorizados")
+
+    large = rng.randbytes(args.size)
+    batch = [rng.randbytes(args.message_size) for _ in range(args.messages)]
+    batch_bytes = args.messages * args.message_size
+
+    print(f" Un mensaje de {args.size // 1024} KiB")
+    report("custom256 anterior (byte a byte)", measure(lambda: _legacy_256(large), args.repeat), args.size)
+    for name in hashing.CUSTOM_HASHES:
+        report(f"{name} Python (objeto incremental)",
+               measure(lambda: hashing.new(name, large).digest(), args.repeat), args.size)
+        if hash_kernels.NUMPY_AVAILABLE:
+            report(f"{name} NumPy (carriles en bloque)",
+                   measure(lambda: hash_kernels.hash_many(name, [large]), args.repeat), args.size)
+
+    print(f" Lote de {args.messages} mensajes de {args.message_size} bytes")
+    for name in hashing.CUSTOM_HASHES:
+        report(f"{name} Python (uno a uno)",
+               measure(lambda: hashing.hash_many(name, batch, vectorized=False), args.repeat), batch_bytes)
+        if hash_kernels.NUMPY_AVAILABLE:
+            report(f"{name} NumPy (mensajes × carriles)",
+                   measure(lambda: hashing.hash_many(name, batch, vectorized=True), args.repeat), batch_bytes)
+
+
+def _read_per_algorithm(path: str, algorithms) -> dict:
+    """Cálculo anterior: una lectura completa del archivo por algoritmo"""
+    results = {}
+    for name in algorithms:
+        hasher = hashing.new_hash(name)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(4096), b""):
+                hasher.update(chunk)
+        results[name] = hasher.hexdigest()
+    return results
+
+
+def bench_multi(args) -> None:
+    """Comparar una lectura por algoritmo frente al hash múltiple en una pasada"""
+    print("== Hash múltiple en una sola pasada (MB/s de entrada) ==")
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, size, algorithms in (
+            ("hashlib", args.file_mb * 1024 * 1024, ["SHA256", "SHA1", "MD5", "SHA512"]),
+            ("hashlib + Custom256", args.size, ["SHA256", "SHA1", "MD5", "Custom256"]),
+        ):
+            path = os.path.join(temp_dir, "datos.bin")
+            with open(path, 'wb') as f:
+                f.write(rng.randbytes(size))
+
+            print(f" {label}: {', '.join(algorithms)} sobre {size / 1024 / 1024:.2f} MiB")
+            report("una lectura por algoritmo", measure(lambda: _read_per_algorithm(path, algorithms), args.repeat), size)
+            report("MultiHasher sin hilos", measure(
+                lambda: _single_pass(path, algorithms, max_threads=0), args.repeat), size)
+            report("MultiHasher con hilos", measure(
+                lambda: hashing.multi_digest_file(path, algorithms), args.repeat), size)
+
+
+def _single_pass(path: str, algorithms, max_threads: int) -> dict:
+    """Una sola lectura con un número de hilos dado"""
+    with open(path, 'rb') as f, hashing.MultiHasher(algorithms, max_threads=max_threads) as hasher:
+        for chunk in iter(lambda: f.read(hashing.MULTI_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+        return hasher.hexdigests()
+
+
+def bench_cache(args) -> None:
+    """Medir hashes repetidos con y sin la caché de resultados"""
+    print("== Caché de resultados (hashes repetidos) ==")
+    rng = random.Random(args.seed)
+    texts = [rng.randbytes(args.message_size).hex() for _ in range(20)]
+    repeated = texts * 10
+
+    for label, cache in (("sin caché", hashing.DigestCache(enabled=False)),
+                         ("con caché", hashing.DigestCache(enabled=True))):
+        hasher = CustomHash(cache=cache)
+        seconds = measure(lambda: [hasher.hash_256(text) for text in repeated], 1)
+        stats = cache.stats()
+        print(f"  {'Custom256 ' + label:<44} {seconds / len(repeated) * 1e6:>10.1f} µs/op "
+              f"(aciertos {stats['hits']}, fallos {stats['misses']})")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "datos.bin")
+        with open(path, 'wb') as f:
+            f.write(rng.randbytes(args.file_mb * 1024 * 1024))
+        # Fecha en el pasado: el archivo no es "racy" y puede guardarse
+        stamp = os.stat(path).st_mtime - 60
+        os.utime(path, (stamp, stamp))
+
+        for label, cache in (("sin caché", hashing.DigestCache(enabled=False)),
+                             ("con caché", hashing.DigestCache(enabled=True))):
+            verifier = IntegrityVerifier(cache=cache)
+            seconds = measure(lambda: verifier.verify_file_integrity(path, "0" * 64), 1 + args.repeat)
+            print(f"  {f'verify_file_integrity {args.file_mb} MiB ' + label:<44} {seconds * 1e3:>10.2f} ms/op")
+
+
+def bench_registry(args) -> None:
+    """Tabla de rendimiento de todos los algoritmos del registro"""
+    rng = random.Random(args.seed)
+    native_data = rng.randbytes(args.file_mb * 1024 * 1024)
+    python_data = native_data[:args.size]
+
+    print("== Registro de algoritmos (MB/s, objeto incremental por bloques) ==")
+    print(f"  {'algoritmo':<12} {'bits':>5} {'impl.':>7} {'MB/s':>10} {'bytes medidos':>15}")
+    rows = []
+    for name in hashing.available_algorithms():
+        algorithm = hashing.get_algorithm(name)
+        data = native_data if algorithm.native else python_data
+        view = memoryview(data)
+
+        def run():
+            hasher = algorithm.factory()
+            for start in range(0, len(data), hashing.MULTI_CHUNK_SIZE):
+                hasher.update(view[start:start + hashing.MULTI_CHUNK_SIZE])
+            hasher.digest()
+
+        rows.append((len(data) / measure(run, args.repeat) / 1e6, algorithm, len(data)))
+
+    for throughput, algorithm, nbytes in sorted(rows, key=lambda row: row[0], reverse=True):
+        impl = "C" if algorithm.native else "Python"
+        print(f"  {algorithm.name:<12} {algorithm.bits:>5} {impl:>7} {throughput:>10.1f} {nbytes:>15}")
+
+
+SECTIONS = {
+    'registry': bench_registry,
+    'custom': bench_custom,
+    'multi': bench_multi,
+    'cache': bench_cache,
+}
+
+
+def main() -> None:
+    """Punto de entrada de los benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks hash de CryptoUNS")
+    parser.add_argument('sections', nargs='*', help=f"Secciones a ejecutar ({', '.join(SECTIONS)})")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    parser.add_argument('--seed', type=int, default=2025, help="Semilla para datos de prueba")
+    parser.add_argument('--size', type=int, default=256 * 1024, help="Tamaño del mensaje grande en bytes")
+    parser.add_argument('--messages', type=int, default=2000, help="Mensajes por lote")
+    parser.add_argument('--message-size', type=int, default=256, help="Tamaño de cada mensaje del lote")
+    parser.add_argument('--file-mb', type=int, default=64, help="Tamaño en MiB del archivo para hash múltiple")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.sections if name not in SECTIONS]
+    if unknown:
+        parser.error(f"Sección desconocida: {', '.join(unknown)}")
+
+    for name in args.sections or list(SECTIONS):
+        SECTIONS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+⏱️ Benchmarks Huffman - CryptoUNS
+===============================
+
+Micro-benchmarks de la codificación Huffman del sistema.
+
+Uso:
+    python scripts/bench_huffman.py                 # Todas las secciones
+    python scripts/bench_huffman.py encode          # Solo una sección
+    python scripts/bench_huffman.py encode --text-mb 100
+    python scripts/bench_huffman.py decode --table-bits 8 10 12 16
+    python scripts/bench_huffman.py file --text-mb 50
+    python scripts/bench_huffman.py bytes --text-mb 16
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import argparse
+import random
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.crypto import huffman_kernels
+from src.crypto.tools import HuffmanCoding
+
+
+WORDS = ("el la de que y en a los se del las un por con no una su para es al lo como más o pero sus le "
+         "ha me si sin sobre este ya entre cuando todo esta ser son dos también fue había era muy años "
+         "hasta desde está mi porque qué sólo han yo hay vez puede todos así nos ni parte tiene él uno "
+         "donde bien tiempo mismo ese ahora cada e vida otro después te otros aunque esa eso hace otra "
+         "gobierno tan durante siempre día tanto ella tres sí dijo sido gran país según menos año antes "
+         "criptografía cifrado clave mensaje firma compresión árbol código").split()
+
+
+def sample_text(size: int, seed: int) -> str:
+    """Texto en español de `size` caracteres con palabras de frecuencia desigual (Zipf)"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    words = rng.choices(WORDS, weights, k=size // 4)
+    block = " ".join(words)
+    return (block * (size // len(block) + 1))[:size]
+
+
+def report(label: str, seconds: float, nbytes: int, extra: str = "") -> None:
+    """Imprimir una fila de resultados en MB/s"""
+    print(f"  {label:<40} {nbytes / seconds / 1e6:>8.2f} MB/s {seconds * 1e3:>10.1f} ms  {extra}")
+
+
+def measure(func, repeat: int) -> float:
+    """Mejor tiempo de varias ejecuciones"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func) -> int:
+    """Pico de memoria Python (bytes) durante una ejecución"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _legacy_encode(huffman: HuffmanCoding, text: str) -> str:
+    """Codificación anterior: cadena de '0'/'1' construida con +="""
+    root = huffman.build_tree(huffman.build_heap(huffman.build_frequency_table(text)))
+    codes = huffman.build_codes(root)
+    encoded_text = ""
+    for char in text:
+        encoded_text += codes[char]
+    return encoded_text
+
+
+def bench_encode(args) -> None:
+    """Salida empaquetada frente a la cadena de '0'/'1'"""
+    size = args.text_mb * 1024 * 1024
+    text = sample_text(size, args.seed)
+    huffman = HuffmanCoding()
+
+    print(f"== Codificación Huffman ({args.text_mb} MiB de texto) ==")
+    legacy = _legacy_encode(huffman, text)
+    packed, _, _ = huffman.encode(text)
+    print(f"    salida: cadena {len(legacy) / 2**20:.1f} MiB, empaquetada {len(packed.data) / 2**20:.1f} MiB "
+          f"({packed.bit_length} bits)")
+    del legacy
+
+    for label, func in (
+        ("encode anterior (cadena con +=)", lambda: _legacy_encode(huffman, text)),
+        ("encode (bytearray empaquetado)", lambda: huffman.encode(text)),
+        ("encode + to_string (vista)", lambda: huffman.encode(text)[0].to_string()),
+    ):
+        seconds = measure(func, args.repeat)
+        report(label, seconds, size, f"pico {peak_memory(func) / 2**20:>7.1f} MiB")
+
+
+def _legacy_decode(encoded_text: str, root) -> str:
+    """Decodificación anterior: árbol bit a bit sobre la cadena de '0'/'1' y += por carácter"""
+    decoded_text = ""
+    current_node = root
+    for bit in encoded_text:
+        current_node = current_node.left if bit == "0" else current_node.right
+        if current_node.char is not None:
+            decoded_text += current_node.char
+            current_node = root
+    return decoded_text
+
+
+def bench_decode(args) -> None:
+    """Decodificador por tablas de k bits y kernel NumPy frente al recorrido del árbol bit a bit"""
+    size = args.text_mb * 1024 * 1024
+    text = sample_text(size, args.seed)
+    huffman = HuffmanCoding()
+    encoded, _, root = huffman.encode(text)
+    bits = encoded.to_string()
+
+    print(f"== Decodificación Huffman ({args.text_mb} MiB de texto) ==")
+    baseline = measure(lambda: _legacy_decode(bits, root), 1)
+    report("decode anterior (árbol bit a bit, +=)", baseline, size)
+    for table_bits in args.table_bits:
+        # La primera llamada construye la tabla; se mide aparte
+        huffman._decode_table = None
+        start = time.perf_counter()
+        huffman.decode(encoded, root, table_bits, vectorized=False)
+        first = time.perf_counter() - start
+        seconds = measure(lambda: huffman.decode(encoded, root, table_bits, vectorized=False), args.repeat)
+        report(f"decode, tabla de {table_bits} bits", seconds, size,
+               f"{baseline / seconds:>5.1f}x (primera llamada {first * 1e3:.0f} ms)")
+    if huffman_kernels.NUMPY_AVAILABLE:
+        seconds = measure(lambda: huffman.decode(encoded, root, vectorized=True), args.repeat)
+        report("decode, kernel NumPy por segmentos", seconds, size, f"{baseline / seconds:>5.1f}x")
+    assert huffman.decode(encoded, root) == text
+
+
+def bench_file(args) -> None:
+    """Archivos: dos pasadas y bloques de una pasada frente a leer todo en memoria"""
+    size = args.text_mb * 1024 * 1024
+    huffman = HuffmanCoding()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "entrada.txt")
+        packed = os.path.join(directory, "entrada.huf")
+        restored = os.path.join(directory, "salida.txt")
+        with open(source, 'w', encoding='utf-8', newline='') as f:
+            f.write(sample_text(size, args.seed))
+        nbytes = os.path.getsize(source)
+
+        def in_memory():
+            with open(source, encoding='utf-8', newline='') as f:
+                blob = huffman.compress(f.read())
+            with open(packed, 'wb') as f:
+                f.write(blob)
+
+        print(f"== Archivos Huffman ({nbytes / 2**20:.1f} MiB) ==")
+        for label, func in (
+            ("compress en memoria (read() completo)", in_memory),
+            ("encode_file, dos pasadas", lambda: huffman.encode_file(source, packed)),
+            ("encode_file, bloques de una pasada", lambda: huffman.encode_file(source, packed, one_pass=True)),
+            ("decode_file (bloques)", lambda: huffman.decode_file(packed, restored)),
+        ):
+            seconds = measure(func, args.repeat)
+            ratio = os.path.getsize(packed) / nbytes
+            report(label, seconds, nbytes, f"pico {peak_memory(func) / 2**20:>7.1f} MiB  ratio {ratio:.3f}")
+
+        huffman.encode_file(source, packed)
+        seconds = measure(lambda: huffman.decode_file(packed, restored), args.repeat)
+        report("decode_file (dos pasadas)", seconds, nbytes,
+               f"pico {peak_memory(lambda: huffman.decode_file(packed, restored)) / 2**20:>7.1f} MiB")
+
+
+def byte_corpora(size: int, seed: int) -> dict:
+    """Corpus de texto, binario real (el intérprete) y aleatorio uniforme de `size` bytes"""
+    text = sample_text(size, seed).encode('utf-8')[:size]
+    with open(sys.executable, 'rb') as f:
+        binary = f.read()
+    rng = random.Random(seed)
+    return {
+        'texto': text,
+        'binario': (binary * (size // len(binary) + 1))[:size],
+        'aleatorio': rng.randbytes(size),
+    }
+
+
+def bench_bytes(args) -> None:
+    """Modo de bytes: conteo con np.bincount, ratio y MB/s por corpus"""
+    size = args.text_mb * 1024 * 1024
+    huffman = HuffmanCoding()
+
+    print(f"== Huffman por bytes ({args.text_mb} MiB por corpus) ==")
+    for name, data in byte_corpora(size, args.seed).items():
+        print(f"  -- {name} --")
+        seconds = measure(lambda: Counter(data), 1)
+        report("conteo Counter(bytes)", seconds, size)
+        seconds = measure(lambda: huffman.build_byte_frequency_table(data), args.repeat)
+        report("conteo np.bincount(np.frombuffer)", seconds, size)
+
+        blob = huffman.compress_bytes(data)
+        seconds = measure(lambda: huffman.compress_bytes(data), args.repeat)
+        report("compress_bytes", seconds, size, f"ratio {len(blob) / size:.3f}")
+        seconds = measure(lambda: huffman.decompress_bytes(blob), args.repeat)
+        report("decompress_bytes", seconds, size)
+        assert huffman.decompress_bytes(blob) == data
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "datos.bin")
+            packed = os.path.join(directory, "datos.huf")
+            with open(source, 'wb') as f:
+                f.write(data)
+            seconds = measure(lambda: huffman.compress_file(source, packed), args.repeat)
+            report("compress_file (dos pasadas)", seconds, size,
+                   f"pico {peak_memory(lambda: huffman.compress_file(source, packed)) / 2**20:>7.1f} MiB")
+
+
+SECTIONS = {
+    'encode': bench_encode,
+    'decode': bench_decode,
+    'file': bench_file,
+    'bytes': bench_bytes,
+}
+
+
+def main() -> None:
+    """Punto de entrada de los benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks Huffman de CryptoUNS")
+    parser.add_argument('sections', nargs='*', help=f"Secciones a ejecutar ({', '.join(SECTIONS)})")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    parser.add_argument('--seed', type=int, default=2025, help="Semilla para datos de prueba")
+    parser.add_argument('--text-mb', type=int, default=10, help="Tamaño en MiB del texto a codificar")
+    parser.add_argument('--table-bits', type=int, nargs='+', default=[8, 10, 12],
+                        help="Bits de la tabla principal a comparar en 'decode'")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.sections if name not in SECTIONS]
+    if unknown:
+        parser.error(f"Sección desconocida: {', '.join(unknown)}")
+
+    for name in args.sections or list(SECTIONS):
+        SECTIONS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,422 @@
+"""
+⏱️ Benchmarks RSA - CryptoUNS
+===========================
+
+Micro-benchmarks de las operaciones de clave pública del sistema.
+
+Uso:
+    python scripts/bench_rsa.py                 # Todas las secciones
+    python scripts/bench_rsa.py egcd            # Solo una sección
+    python scripts/bench_rsa.py batch --messages 20000 --workers 1 2 4 8
+    python scripts/bench_rsa.py file --file-mb 1024
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import argparse
+import cProfile
+import hashlib
+import pstats
+import random
+import sys
+import os
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.crypto import number_theory, primality
+from src.crypto.keystore import KeyStore
+from src.crypto.modern import RSACipher, DigitalSignature, prepare_public_key
+from src.crypto.random_source import RandomSource
+
+
+def report(label: str, seconds: float, ops: int) -> None:
+    """Imprimir una fila de resultados"""
+    per_op_us = seconds / ops * 1e6
+    print(f"  {label:<40} {per_op_us:>12.2f} µs/op {ops / seconds:>14.0f} ops/s")
+
+
+def _recursive_extended_gcd(a: int, b: int):
+    """Algoritmo extendido de Euclides recursivo (implementación anterior)"""
+    if a == 0:
+        return b, 0, 1
+    gcd, x1, y1 = _recursive_extended_gcd(b % a, a)
+    return gcd, y1 - (b // a) * x1, x1
+
+
+def _recursive_mod_inverse(a: int, m: int) -> int:
+    """Inverso modular anterior basado en la versión recursiva"""
+    gcd, x, _ = _recursive_extended_gcd(a, m)
+    if gcd != 1:
+        raise ValueError("El inverso modular no existe")
+    return (x % m + m) % m
+
+
+def bench_egcd(args) -> None:
+    """Comparar egcd/inverso recursivos frente a los iterativos"""
+    rng = random.Random(args.seed)
+    print("== Teoría de números (egcd / inverso modular) ==")
+
+    for bits in (1024, 2048, 4096):
+        modulus = rng.getrandbits(bits) | 1 | (1 << (bits - 1))
+        values = []
+        while len(values) < 32:
+            a = rng.randrange(2, modulus)
+            if number_theory.gcd(a, modulus) == 1:
+                values.append(a)
+
+        print(f" {bits} bits")
+        for label, func in (
+            ("extended_gcd recursivo", _recursive_extended_gcd),
+            ("extended_gcd iterativo", number_theory.extended_gcd),
+            ("mod_inverse recursivo", _recursive_mod_inverse),
+            ("mod_inverse (pow(a, -1, m))", number_theory.mod_inverse),
+        ):
+            try:
+                seconds = timeit.timeit(lambda: [func(a, modulus) for a in values], number=args.repeat)
+            except RecursionError:
+                print(f"  {label:<40} {'RecursionError':>12}")
+                continue
+            report(label, seconds, args.repeat * len(values))
+
+
+def bench_keystore(args) -> None:
+    """Comparar generación de claves frente a carga desde el almacén"""
+    print("== Almacén de claves (generar vs cargar) ==")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "keystore.bin")
+        for bits in (1024, 2048):
+            rsa = RSACipher(key_size=bits)
+            start = time.perf_counter()
+            rsa.generate_keys()
+            generate_seconds = time.perf_counter() - start
+
+            store = KeyStore(path)
+            # Muchas claves en el archivo: la carga no debe depender de ello
+            for i in range(args.keys):
+                rsa.save_keys(f"key-{bits}-{i}", store)
+            store.close()
+
+            print(f" {bits} bits ({args.keys} claves almacenadas)")
+            report("generate_keys", generate_seconds, 1)
+
+            start = time.perf_counter()
+            store = KeyStore(path)
+            len(store)
+            report("abrir almacén (índice mmap)", time.perf_counter() - start, 1)
+
+            cold = KeyStore(path, cache_size=0)
+            seconds = timeit.timeit(lambda: cold.load(f"key-{bits}-0"), number=args.repeat * 10)
+            report("load (sin caché, mmap)", seconds, args.repeat * 10)
+
+            seconds = timeit.timeit(lambda: store.load(f"key-{bits}-0"), number=args.repeat * 10)
+            report("load (caché LRU)", seconds, args.repeat * 10)
+            store.close()
+            cold.close()
+
+
+def _legacy_verify(hash_func, message: str, signature_hex: str, public_key) -> bool:
+    """Verificación anterior: hash en hexadecimal y comparación de cadenas"""
+    message_hash = hash_func.sha256_wrapper(message)
+    e, n = public_key
+    decrypted_hash = pow(int(signature_hex, 16), e, n)
+    return f"{decrypted_hash:x}" == message_hash
+
+
+def _int_verify(message: str, signature_hex: str, public_key) -> bool:
+    """Verificación con el hash en crudo: entero recuperado == hash como entero"""
+    e, n = public_key
+    digest = int.from_bytes(hashlib.sha256(message.encode('utf-8')).digest(), 'big')
+    return pow(int(signature_hex, 16), e, n) == digest
+
+
+def bench_keygen(args) -> None:
+    """Medir la generación de claves con una fuente determinista"""
+    print(f"== Generación de claves (semilla {args.seed}, reproducible) ==")
+
+    for bits in args.key_sizes:
+        rsa = RSACipher(key_size=bits, rng=RandomSource(args.seed))
+        timings = []
+        for _ in range(args.keygen_runs):
+            start = time.perf_counter()
+            public_key, _ = rsa.generate_keys()
+            timings.append(time.perf_counter() - start)
+
+        fingerprint = f"{public_key[1]:x}"[:16]
+        print(f" {bits} bits (n = {fingerprint}...)")
+        report("generate_keys (media)", sum(timings), len(timings))
+        report("generate_keys (mínimo)", min(timings), 1)
+
+
+def bench_verify(args) -> None:
+    """Medir verificaciones por segundo con y sin clave preparada"""
+    print("== Verificación de firmas (verifies/s) ==")
+
+    for bits in (1024, 2048):
+        signature = DigitalSignature()
+        public_key, private_key = signature.generate_keys(bits)
+        messages = [f"registro {i:06d}" for i in range(args.messages)]
+        signatures = [signature.sign_message(m, private_key) for m in messages]
+        binary = [bytes.fromhex(sig) for sig in signatures]
+        data = [m.encode('utf-8') for m in messages]
+        prepared = prepare_public_key(public_key)
+        # Firmas del hash sin codificar, para los caminos anteriores
+        d, n = private_key
+        raw = [format(pow(int(signature.hash_func.sha256_wrapper(m), 16), d, n), 'x') for m in messages]
+
+        def legacy():
+            for message, sig in zip(messages, raw):
+                _legacy_verify(signature.hash_func, message, sig, public_key)
+
+        def int_compare():
+            for message, sig in zip(messages, raw):
+                _int_verify(message, sig, public_key)
+
+        def bytes_loop():
+            for message, sig in zip(data, binary):
+                prepared.verify_bytes(message, sig)
+
+        def one_by_one():
+            for message, sig in zip(messages, signatures):
+                signature.verify_signature(message, sig, public_key)
+
+        def prepared_loop():
+            for message, sig in zip(messages, signatures):
+                prepared.verify(message, sig)
+
+        print(f" {bits} bits ({len(messages)} firmas)")
+        for label, func in (
+            ("verificación anterior (hex)", legacy),
+            ("hash en crudo (int ==)", int_compare),
+            ("verify_signature", one_by_one),
+            ("PreparedPublicKey.verify_bytes", bytes_loop),
+            ("PreparedPublicKey.verify", prepared_loop),
+            ("verify_batch", lambda: signature.verify_batch(messages, signatures, public_key)),
+        ):
+            seconds = timeit.timeit(func, number=args.repeat)
+            report(label, seconds, args.repeat * len(messages))
+
+
+class _LegacyPrimalityRSA(RSACipher):
+    """RSACipher con el test anterior: 10 rondas fijas y sin división por primos pequeños"""
+
+    def is_prime(self, n: int, k: int = 10) -> bool:
+        if n < 2:
+            return False
+        if n == 2 or n == 3:
+            return True
+        if n % 2 == 0:
+            return False
+
+        r = 0
+        d = n - 1
+        while d % 2 == 0:
+            r += 1
+            d //= 2
+
+        for _ in range(k):
+            a = self.rng.randrange(2, n - 1)
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(r - 1):
+                x = pow(x, 2, n)
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+
+def _pow_stats(profiler: cProfile.Profile):
+    """Extraer llamadas y tiempo acumulado en pow() de un perfil"""
+    stats = pstats.Stats(profiler)
+    for (_, _, name), (_, calls, _, cumulative, _) in stats.stats.items():
+        if name == "<built-in method builtins.pow>":
+            return calls, cumulative
+    return 0, 0.0
+
+
+def bench_primality(args) -> None:
+    """Perfilar la generación de claves: tiempo total y tiempo dentro de pow()"""
+    print(f"== Primalidad en generate_keys (cProfile, semilla {args.seed}) ==")
+
+    for bits in args.key_sizes:
+        print(f" {bits} bits (rondas Miller-Rabin adaptativas: "
+              f"{primality.miller_rabin_rounds(bits // 2)} por primo de {bits // 2} bits)")
+        print(f"  {'variante':<28} {'total s':>10} {'pow s':>10} {'pow %':>7} {'llamadas pow':>14}")
+        for label, factory in (
+            ("anterior (10 rondas)", lambda rng: _LegacyPrimalityRSA(bits, rng=rng)),
+            ("miller-rabin adaptativo", lambda rng: RSACipher(bits, rng=rng)),
+            ("baillie-psw", lambda rng: RSACipher(bits, rng=rng, primality_test=primality.BAILLIE_PSW)),
+        ):
+            rsa = factory(RandomSource(args.seed))
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            for _ in range(args.keygen_runs):
+                rsa.generate_keys()
+            profiler.disable()
+            total = time.perf_counter() - start
+
+            calls, pow_seconds = _pow_stats(profiler)
+            print(f"  {label:<28} {total:>10.3f} {pow_seconds:>10.3f} "
+                  f"{100 * pow_seconds / total:>6.1f}% {calls:>14}")
+
+
+def bench_batch(args) -> None:
+    """sign_batch/verify_batch (hilos para SHA-256, procesos para RSA) frente a un mensaje por llamada"""
+    print(f"== Firma por lotes ({args.messages} mensajes, {os.cpu_count()} núcleos) ==")
+    rng = random.Random(args.seed)
+    messages = [rng.randbytes(256) for _ in range(args.messages)]
+
+    for bits in (1024, 2048):
+        signature = DigitalSignature()
+        public_key, private_key = signature.generate_keys(bits)
+        d, n = private_key
+        size = (n.bit_length() + 7) // 8
+        print(f" {bits} bits")
+
+        def legacy_sign():
+            # Firma anterior: hex del hash, pow(h, d, n) completo y firma en hexadecimal
+            return [format(pow(int(signature.hash_func.sha256_wrapper(m.hex()), 16), d, n), 'x') for m in messages]
+
+        report("firma anterior (pow completo, hex)", timeit.timeit(legacy_sign, number=1), len(messages))
+        report("sign_bytes por mensaje (CRT)",
+               timeit.timeit(lambda: [signature.sign_bytes(m, private_key) for m in messages], number=1),
+               len(messages))
+
+        batch = signature.sign_batch(messages, private_key, workers=1)
+        baseline = {}
+        for workers in args.workers:
+            for label, func in (
+                ("sign_batch", lambda: signature.sign_batch(messages, private_key, workers, workers)),
+                ("verify_batch", lambda: signature.verify_batch(messages, batch, public_key, workers, workers)),
+            ):
+                seconds = timeit.timeit(func, number=1)
+                baseline.setdefault(label, seconds)
+                report(f"{label}, {workers} proceso(s) ({baseline[label] / seconds:.2f}x)", seconds, len(messages))
+        print(f"    salida compacta: {len(batch.signatures) + len(batch.status)} bytes "
+              f"({size} bytes por firma + 1 de estado)")
+
+
+def bench_file(args) -> None:
+    """sign_file/verify_file por flujo frente a leer el archivo entero y firmarlo como texto"""
+    size = args.file_mb * 1024 * 1024
+    signature = DigitalSignature()
+    public_key, private_key = signature.generate_keys(2048)
+
+    print(f"== Firma de archivos ({args.file_mb} MiB, 2048 bits) ==")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "datos.txt")
+        block = bytes(random.Random(args.seed).randrange(32, 127) for _ in range(1 << 16))
+        with open(path, 'wb') as f:
+            for _ in range(size >> 16):
+                f.write(block)
+
+        def whole_file():
+            with open(path, 'r', encoding='ascii') as f:
+                return signature.sign_message(f.read(), private_key)
+
+        rows = [
+            ("sign_message (archivo entero en str)", whole_file),
+            ("sign_file (por bloques)", lambda: signature.sign_file(path, private_key)),
+            ("verify_file (por bloques)", lambda: signature.verify_file(path, public_key)),
+        ]
+        for label, func in rows:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            tracemalloc.start()
+            try:
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            print(f"  {label:<40} {size / seconds / 1e6:>8.1f} MB/s  pico de memoria {peak / 2**20:>8.2f} MiB")
+
+
+def _legacy_demo(signature: DigitalSignature, message: str) -> dict:
+    """Demo anterior por etapas: claves nuevas en cada llamada y el hash calculado dos veces"""
+    timings = {}
+    start = time.perf_counter()
+    public_key, private_key = signature.generate_keys()
+    timings["keys"] = time.perf_counter() - start
+    start = time.perf_counter()
+    signature_hex = signature.sign_message(message, private_key)
+    timings["sign"] = time.perf_counter() - start
+    start = time.perf_counter()
+    signature.verify_signature(message, signature_hex, public_key)
+    timings["verify"] = time.perf_counter() - start
+    start = time.perf_counter()
+    signature.hash_func.sha256_wrapper(message)
+    timings["hash"] = time.perf_counter() - start
+    return {stage: seconds * 1e3 for stage, seconds in timings.items()}
+
+
+def bench_demo(args) -> None:
+    """sign_and_verify_demo por etapas: claves nuevas en cada llamada frente a claves reutilizadas"""
+    print(f"== Demo de firma por etapas (2048 bits, {args.demo_runs} llamadas, ms por llamada) ==")
+    messages = [f"mensaje de demostración {i}" for i in range(args.demo_runs)]
+    stages = ("keys", "hash", "sign", "verify")
+
+    def run(label, demo):
+        totals = dict.fromkeys(stages, 0.0)
+        start = time.perf_counter()
+        for message in messages:
+            for stage, ms in demo(message).items():
+                totals[stage] += ms
+        total = (time.perf_counter() - start) * 1e3 / len(messages)
+        row = " ".join(f"{stage} {totals[stage] / len(messages):>9.3f}" for stage in stages)
+        print(f"  {label:<28} {row}   total {total:>9.3f}")
+
+    legacy = DigitalSignature()
+    run("anterior (claves nuevas)", lambda m: _legacy_demo(legacy, m))
+    fresh = DigitalSignature(key_ttl=0)
+    run("demo, key_ttl=0", lambda m: fresh.sign_and_verify_demo(m)["timings"])
+    cached = DigitalSignature()
+    run("demo, claves en caché", lambda m: cached.sign_and_verify_demo(m)["timings"])
+
+
+SECTIONS = {
+    'egcd': bench_egcd,
+    'keystore': bench_keystore,
+    'keygen': bench_keygen,
+    'verify': bench_verify,
+    'primality': bench_primality,
+    'batch': bench_batch,
+    'file': bench_file,
+    'demo': bench_demo,
+}
+
+
+def main() -> None:
+    """Punto de entrada de los benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks RSA de CryptoUNS")
+    parser.add_argument('sections', nargs='*', help=f"Secciones a ejecutar ({', '.join(SECTIONS)})")
+    parser.add_argument('--repeat', type=int, default=20, help="Repeticiones por medición")
+    parser.add_argument('--seed', type=int, default=2025, help="Semilla para datos de prueba")
+    parser.add_argument('--keys', type=int, default=500, help="Claves en el almacén de prueba")
+    parser.add_argument('--messages', type=int, default=2000, help="Mensajes por lote de firmas")
+    parser.add_argument('--key-sizes', type=int, nargs='+', default=[1024, 2048], help="Tamaños de clave para keygen")
+    parser.add_argument('--keygen-runs', type=int, default=5, help="Claves generadas por tamaño")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="Procesos a comparar en 'batch'")
+    parser.add_argument('--file-mb', type=int, default=64, help="Tamaño en MiB del archivo a firmar en 'file'")
+    parser.add_argument('--demo-runs', type=int, default=10, help="Llamadas a la demo de firma en 'demo'")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.sections if name not in SECTIONS]
+    if unknown:
+        parser.error(f"Sección desconocida: {', '.join(unknown)}")
+
+    for name in args.sections or list(SECTIONS):
+        SECTIONS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+📊 Calidad de Hash - CryptoUNS
+============================
+
+Banco estadístico de los hash personalizados frente a SHA-256:
+avalancha, sesgo de bits, uniformidad de cubetas y colisiones.
+Genera un reporte JSON y, si se indica un reporte anterior, sale con
+código 1 cuando hay regresiones de calidad o de rendimiento.
+
+Uso:
+    python scripts/hash_quality.py                          # 2^20 entradas, todos los núcleos
+    python scripts/hash_quality.py --samples 4000000 -o reporte.json
+    python scripts/hash_quality.py -o nuevo.json --baseline reporte.json
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.crypto import hash_quality
+
+
+def print_summary(report: dict) -> None:
+    """Imprimir una tabla resumida del reporte"""
+    print(f"== Calidad de hash: {report['samples']} entradas de {report['message_length']} bytes "
+          f"por familia, {report['workers']} procesos, {report['elapsed_seconds']:.1f} s ==")
+    print(f"  {'algoritmo':<10} {'familia':<8} {'MB/s':>8} {'avalancha':>10} {'SAC máx':>8} "
+          f"{'sesgo máx':>10} {'cubetas z':>10} {'col32 obs/esp':>15} {'col64':>6}")
+    for name, result in report["algorithms"].items():
+        for family, metrics in result["families"].items():
+            collisions = f"{metrics['collisions_32']}/{metrics['collisions_32_expected']:.1f}"
+            print(f"  {name:<10} {family:<8} {result['throughput_mb_s']:>8.2f} "
+                  f"{metrics['avalanche_mean']:>10.4f} {metrics['sac_max_deviation']:>8.3f} "
+                  f"{metrics['bit_bias_max']:>10.4f} {metrics['bucket_z']:>10.2f} "
+                  f"{collisions:>15} {metrics['collisions_64']:>6}")
+        if result.get("regressions"):
+            print(f"    peor que {report['reference']}: {', '.join(result['regressions'])}")
+
+
+def main() -> None:
+    """Punto de entrada del banco de calidad"""
+    parser = argparse.ArgumentParser(description="Calidad estadística de los hash de CryptoUNS")
+    parser.add_argument('algorithms', nargs='*', help="Algoritmos a evaluar (por defecto los personalizados)")
+    parser.add_argument('--samples', type=int, default=hash_quality.DEFAULT_SAMPLES, help="Entradas por familia")
+    parser.add_argument('--message-size', type=int, default=hash_quality.DEFAULT_MESSAGE_LENGTH,
+                        help="Longitud de cada entrada en bytes")
+    parser.add_argument('--families', nargs='+', default=list(hash_quality.INPUT_FAMILIES),
+                        choices=hash_quality.INPUT_FAMILIES, help="Familias de entradas")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto todos los núcleos)")
+    parser.add_argument('--chunk-size', type=int, default=hash_quality.DEFAULT_CHUNK_SIZE, help="Entradas por bloque")
+    parser.add_argument('--seed', type=int, default=2025, help="Semilla de las entradas aleatorias")
+    parser.add_argument('-o', '--output', help="Archivo JSON de salida ('-' para stdout)")
+    parser.add_argument('--baseline', help="Reporte JSON anterior para detectar regresiones")
+    args = parser.parse_args()
+
+    report = hash_quality.evaluate_quality(
+        algorithms=args.algorithms or None,
+        samples=args.samples,
+        message_length=args.message_size,
+        families=args.families,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_summary(report)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Reporte guardado en {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = hash_quality.compare_reports(report, baseline)
+        for line in regressions:
+            print(f"REGRESIÓN {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
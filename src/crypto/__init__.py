@@ -9,6 +9,13 @@ Componentes:
 - classic: Criptografía clásica (César, Vigenère, Playfair)
 - modern: Criptografía moderna (RSA, Hash, DES, Firma Digital)
 - tools: Herramientas adicionales (Huffman, Kasiski, Blockchain)
+- number_theory: Aritmética modular para RSA (egcd, inverso, λ de Carmichael)
+- keystore: Almacén persistente de claves RSA con caché LRU
+- random_source: Fuentes de aleatoriedad (sistema o con semilla)
+- primality: Tests de primalidad (Miller-Rabin adaptativo, Baillie-PSW)
+- hashing: Objetos hash incrementales para los hash personalizados
+- hash_kernels: Kernels NumPy para hashear lotes de mensajes
+- hash_quality: Banco estadístico de calidad de los hash (avalancha, sesgo, colisiones)
 - utils: Funciones auxiliares para criptografía
 
 Características:
@@ -26,6 +33,13 @@ try:
     from .classic import *
     from .modern import *
     from .tools import *
+    from .number_theory import *
+    from .keystore import *
+    from .random_source import *
+    from .primality import *
+    from .hashing import *
+    from .hash_kernels import *
+    from .hash_quality import *
     from .utils import *
 except ImportError:
     # Los módulos se importarán cuando sean creados
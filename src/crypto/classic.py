@@ -20,6 +20,7 @@ from typing import Optional, Tuple, List, Dict
 try:
     from ..utils.constants import *
     from ..utils.exceptions import *
+    from .random_source import RandomSource, get_default_random
 except ImportError:
     # Importación absoluta para cuando se ejecuta directamente
     import sys
@@ -27,6 +28,7 @@ except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     from utils.constants import *
     from utils.exceptions import *
+    from crypto.random_source import RandomSource, get_default_random
 
 # ===== CIFRADO CÉSAR =====
 class CaesarCipher:
@@ -190,15 +192,17 @@ class VigenereCipher:
     de texto para determinar el desplazamiento de cada letra.
     """
     
-    def __init__(self, alphabet: str = DEFAULT_ALPHABET):
+    def __init__(self, alphabet: str = DEFAULT_ALPHABET, rng: Optional[RandomSource] = None):
         """
         Inicializar cifrado Vigenère
         
         Args:
             alphabet (str): Alfabeto a utilizar (por defecto inglés)
+            rng (Optional[RandomSource]): Fuente de aleatoriedad para generar claves
         """
         self.alphabet = alphabet.upper()
         self.alphabet_size = len(self.alphabet)
+        self.rng = rng if rng is not None else get_default_random()
     
     def validate_key(self, key: str) -> bool:
         """
@@ -406,8 +410,7 @@ class VigenereCipher:
         Returns:
             str: Clave generada
         """
-        import random
-        return ''.join(random.choice(self.alphabet) for _ in range(length))
+        return ''.join(self.rng.choice(self.alphabet) for _ in range(length))
     
     def encrypt_autokey(self, plaintext: str, key: str) -> str:
         """
@@ -505,8 +508,14 @@ class PlayfairCipher:
     para cifrar pares de letras.
     """
     
-    def __init__(self):
-        """Inicializar cifrado Playfair"""
+    def __init__(self, rng: Optional[RandomSource] = None):
+        """
+        Inicializar cifrado Playfair
+        
+        Args:
+            rng (Optional[RandomSource]): Fuente de aleatoriedad para generar claves
+        """
+        self.rng = rng if rng is not None else get_default_random()
         self.alphabet = PLAYFAIR_ALPHABET  # Sin J
         self.matrix = []
         self.char_positions = {}
@@ -770,8 +779,7 @@ class PlayfairCipher:
         Returns:
             str: Clave generada
         """
-        import random
-        return ''.join(random.choice(PLAYFAIR_ALPHABET) for _ in range(length))
+        return ''.join(self.rng.choice(PLAYFAIR_ALPHABET) for _ in range(length))
 
 # ===== MÉTODO DE KASISKI =====
 class KasiskiAnalysis:
@@ -0,0 +1,226 @@
+"""
+🧮 Kernels Vectorizados de Hash - CryptoUNS
+=========================================
+
+Implementación con NumPy de los hash personalizados (custom64,
+custom128, custom256) para lotes de mensajes.
+
+Cada función hash es una recurrencia estrictamente secuencial por
+carril::
+
+    estado = ((estado ^ byte) * multiplicador) ^ ajuste(posición)   (mod 2^64)
+
+por lo que un único mensaje no puede repartirse entre varios núcleos.
+Lo que sí es independiente son los carriles (4 en custom256, la pasada
+directa e inversa en custom128) y los mensajes entre sí: el kernel
+avanza en bloque una matriz ``uint64`` de estados (mensajes × carriles),
+una posición de byte por iteración. La aritmética ``uint64`` de NumPy es
+módulo 2^64, así que no hace falta enmascarar.
+
+NumPy es opcional: sin él ``NUMPY_AVAILABLE`` es False y
+``hashing.hash_many`` usa la implementación en Python puro.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Importar constantes y excepciones
+try:
+    from ..utils.exceptions import *
+    from .hashing import FNV_OFFSET, FNV_PRIME, CUSTOM256_SEEDS, CUSTOM256_MULTIPLIERS
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from utils.exceptions import *
+    from crypto.hashing import FNV_OFFSET, FNV_PRIME, CUSTOM256_SEEDS, CUSTOM256_MULTIPLIERS
+
+# Memoria aproximada por bloque de posiciones convertido a uint64
+BLOCK_BYTES = 8 * 1024 * 1024
+
+
+class KernelSpec(NamedTuple):
+    """Descripción de un hash personalizado como conjunto de carriles"""
+    seeds: Tuple[int, ...]
+    multipliers: Tuple[int, ...]
+    # True si el carril recorre el mensaje desde el final
+    reverse: Tuple[bool, ...]
+    # posiciones (k,) -> ajustes (k, carriles)
+    tweaks: Callable
+    # estados (n, carriles) -> estados finales (in situ)
+    finalize: Callable
+
+
+def _no_tweaks(positions):
+    return np.zeros((len(positions), 1), dtype=np.uint64)
+
+
+def _tweaks_128(positions):
+    return np.stack([positions, positions * np.uint64(3)], axis=1)
+
+
+def _tweaks_256(positions):
+    seed_low = np.array([seed & 0xFF for seed in CUSTOM256_SEEDS], dtype=np.uint64)
+    return (positions[:, None] * seed_low) & np.uint64(0xFF)
+
+
+def _finalize_64(states):
+    states ^= states >> np.uint64(32)
+    states ^= states >> np.uint64(16)
+    states ^= states >> np.uint64(8)
+
+
+def _finalize_128(states):
+    pass
+
+
+def _finalize_256(states):
+    states ^= states >> np.uint64(32)
+    states ^= states >> np.uint64(16)
+
+
+KERNELS: Dict[str, KernelSpec] = {
+    "custom64": KernelSpec((FNV_OFFSET,), (FNV_PRIME,), (False,), _no_tweaks, _finalize_64),
+    "custom128": KernelSpec((FNV_OFFSET, FNV_OFFSET), (FNV_PRIME, FNV_PRIME), (False, True),
+                            _tweaks_128, _finalize_128),
+    "custom256": KernelSpec(CUSTOM256_SEEDS, CUSTOM256_MULTIPLIERS, (False,) * 4,
+                            _tweaks_256, _finalize_256),
+}
+
+
+def _padded(messages: Sequence[bytes], order: List[int], width: int, reverse: bool):
+    """Matriz (mensajes × width) de bytes alineados a la izquierda, en el orden dado"""
+    matrix = np.zeros((len(order), width), dtype=np.uint8)
+    for row, index in enumerate(order):
+        data = np.frombuffer(messages[index], dtype=np.uint8)
+        matrix[row, :len(data)] = data[::-1] if reverse else data
+    return matrix
+
+
+def _spec(name: str) -> KernelSpec:
+    if not NUMPY_AVAILABLE:
+        raise HashError("NumPy no está disponible para los kernels vectorizados", name)
+
+    spec = KERNELS.get(name.lower())
+    if spec is None:
+        raise InvalidInputError(f"Algoritmo no soportado: {name}")
+    return spec
+
+
+def _directions(spec: KernelSpec) -> Tuple[bool, ...]:
+    # Un flujo de bytes si todos los carriles leen en el mismo sentido
+    # (se difunde a todos los carriles); si no, un flujo por carril
+    return spec.reverse if len(set(spec.reverse)) > 1 else spec.reverse[:1]
+
+
+def _run(spec: KernelSpec, streams, lengths: Sequence[int]):
+    """
+    Avanzar los estados de todos los mensajes sobre sus flujos de bytes
+
+    Las filas deben estar ordenadas por longitud descendente para que los
+    mensajes activos en cada posición sean un prefijo.
+
+    Returns:
+        np.ndarray: Estados finales (mensajes × carriles) en uint64
+    """
+    count, width = streams[0].shape
+    states = np.empty((count, len(spec.seeds)), dtype=np.uint64)
+    states[:] = np.array(spec.seeds, dtype=np.uint64)
+    multipliers = np.array(spec.multipliers, dtype=np.uint64)
+
+    block = max(1, BLOCK_BYTES // (8 * count * len(streams)))
+    active = count
+    for start in range(0, width, block):
+        stop = min(width, start + block)
+        # Bloque de posiciones como (posición, mensaje, flujo) en uint64
+        data = np.stack([stream[:, start:stop].T for stream in streams], axis=2).astype(np.uint64)
+        tweaks = spec.tweaks(np.arange(start, stop, dtype=np.uint64))
+
+        for offset in range(stop - start):
+            while lengths[active - 1] <= start + offset:
+                active -= 1
+            lanes = states[:active]
+            lanes ^= data[offset, :active]
+            lanes *= multipliers
+            lanes ^= tweaks[offset]
+
+    spec.finalize(states)
+    return states
+
+
+def hash_many(name: str, messages: Sequence[bytes]) -> List[bytes]:
+    """
+    Calcular un hash personalizado de muchos mensajes en bloque
+
+    Args:
+        name (str): "custom64", "custom128" o "custom256"
+        messages (Sequence[bytes]): Mensajes (de cualquier longitud)
+
+    Returns:
+        List[bytes]: Digests en el mismo orden que los mensajes
+    """
+    spec = _spec(name)
+    if not messages:
+        return []
+
+    messages = [bytes(message) for message in messages]
+    # Ordenar por longitud descendente: los mensajes activos en la
+    # posición j son siempre un prefijo de las filas
+    order = sorted(range(len(messages)), key=lambda index: -len(messages[index]))
+    lengths = [len(messages[index]) for index in order]
+    width = lengths[0]
+
+    streams = [_padded(messages, order, width, reverse) for reverse in _directions(spec)]
+    rows = _run(spec, streams, lengths).astype('>u8')
+
+    digests: List[bytes] = [b""] * len(order)
+    for row, index in enumerate(order):
+        digests[index] = rows[row].tobytes()
+    return digests
+
+
+def hash_matrix(name: str, matrix) -> "np.ndarray":
+    """
+    Calcular un hash personalizado de mensajes de igual longitud
+
+    Evita construir objetos ``bytes`` por mensaje: pensado para lotes de
+    millones de entradas generadas (p. ej. ``hash_quality``).
+
+    Args:
+        name (str): "custom64", "custom128" o "custom256"
+        matrix (np.ndarray): Matriz uint8 (mensajes × longitud)
+
+    Returns:
+        np.ndarray: Digests como matriz uint8 (mensajes × tamaño del digest)
+    """
+    spec = _spec(name)
+    matrix = np.ascontiguousarray(matrix, dtype=np.uint8)
+    if matrix.ndim != 2:
+        raise InvalidInputError("Se esperaba una matriz (mensajes × longitud)")
+
+    count, width = matrix.shape
+    if count == 0:
+        return np.zeros((0, 8 * len(spec.seeds)), dtype=np.uint8)
+
+    streams = [matrix[:, ::-1] if reverse else matrix for reverse in _directions(spec)]
+    states = _run(spec, streams, [width] * count)
+    return states.astype('>u8').view(np.uint8).reshape(count, -1)
+
+# ===== EXPORTAR FUNCIONES =====
+# hash_many no se reexporta: el punto de entrada es hashing.hash_many
+__all__ = [
+    'NUMPY_AVAILABLE',
+    'KernelSpec',
+    'KERNELS'
+]
@@ -0,0 +1,477 @@
+"""
+📊 Calidad Estadística de Hash - CryptoUNS
+=========================================
+
+Banco de pruebas estadístico para los hash personalizados (Custom64,
+Custom128, Custom256), comparados contra SHA-256 como referencia.
+
+Para cada algoritmo y familia de entradas se mide:
+
+- Avalancha: fracción de bits del digest que cambian al invertir un
+  bit de la entrada (ideal 0.5), y el criterio estricto de avalancha
+  (SAC): la probabilidad por par (bit de entrada, bit de salida).
+- Sesgo de bits: frecuencia de unos en cada bit del digest.
+- Uniformidad de cubetas: chi-cuadrado de los bits bajos del digest.
+- Colisiones: en el prefijo de 64 bits y truncado a 32 bits, frente al
+  valor esperado por la paradoja del cumpleaños.
+
+Las entradas se generan en bloques de longitud fija como matrices
+NumPy y se evalúan con ``hash_kernels.hash_matrix`` (sin objetos
+``bytes`` por mensaje). Los bloques son independientes y se reparten
+entre procesos; los contadores parciales se suman al final, por lo que
+el resultado no depende del número de procesos.
+
+Requiere NumPy. ``text_avalanche`` no lo necesita y es la medida que
+muestra la interfaz para un texto concreto.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Importar constantes y excepciones
+try:
+    from ..utils.exceptions import *
+    from . import hash_kernels
+    from .hashing import available_algorithms, canonical_algorithm, get_algorithm, new_hash
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from utils.exceptions import *
+    from crypto import hash_kernels
+    from crypto.hashing import available_algorithms, canonical_algorithm, get_algorithm, new_hash
+
+# Versión del formato del reporte JSON
+REPORT_VERSION = 1
+REFERENCE_ALGORITHM = "SHA256"
+
+# Familias de entradas: bytes aleatorios y contadores decimales ASCII
+# ("000...0042"), que casi no varían entre sí y castigan a los hash débiles
+RANDOM_INPUTS = "random"
+COUNTER_INPUTS = "counter"
+INPUT_FAMILIES = (RANDOM_INPUTS, COUNTER_INPUTS)
+
+DEFAULT_SAMPLES = 1 << 20
+DEFAULT_MESSAGE_LENGTH = 16
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_BUCKET_BITS = 16
+RANDOM_BLOCK_ROWS = 4096
+# Bytes de la entrada que analiza text_avalanche (acota su coste en la GUI)
+AVALANCHE_SAMPLE_BYTES = 4096
+
+# Métricas comparadas con la referencia: (clave, desviación mínima que
+# se considera ruido)
+REGRESSION_METRICS = (
+    ("avalanche_bias", 0.002),
+    ("sac_max_deviation", 0.02),
+    ("bit_bias_max", 0.005),
+    ("bucket_z", 4.0),
+    ("collision_z_32", 4.0),
+    ("collisions_64", 0),
+)
+
+
+# ===== GENERACIÓN DE ENTRADAS =====
+
+def generate_inputs(family: str, start: int, count: int, length: int, seed: int):
+    """
+    Generar un bloque de entradas de longitud fija
+
+    La fila i es siempre la misma para una (family, seed) dada, de modo
+    que todos los algoritmos y repartos de trabajo ven las mismas entradas.
+
+    Returns:
+        np.ndarray: Matriz uint8 (count × length)
+    """
+    if family == RANDOM_INPUTS:
+        # Flujo aleatorio por bloque fijo de filas: el resultado no
+        # depende del tamaño de los bloques de trabajo
+        first = start // RANDOM_BLOCK_ROWS
+        last = (start + count + RANDOM_BLOCK_ROWS - 1) // RANDOM_BLOCK_ROWS
+        blocks = [
+            np.random.default_rng([seed, block]).integers(0, 256, size=(RANDOM_BLOCK_ROWS, length), dtype=np.uint8)
+            for block in range(first, last)
+        ]
+        offset = start - first * RANDOM_BLOCK_ROWS
+        return np.concatenate(blocks)[offset:offset + count]
+
+    if family == COUNTER_INPUTS:
+        matrix = np.full((count, length), ord("0"), dtype=np.uint8)
+        numbers = np.arange(start, start + count, dtype=np.uint64)
+        digits = min(length, 19)
+        powers = np.uint64(10) ** np.arange(digits - 1, -1, -1, dtype=np.uint64)
+        matrix[:, length - digits:] += ((numbers[:, None] // powers) % np.uint64(10)).astype(np.uint8)
+        return matrix
+
+    raise InvalidInputError(f"Familia de entradas no soportada: {family}")
+
+
+def digest_matrix(algorithm: str, matrix):
+    """
+    Calcular los digests de cada fila de una matriz uint8
+
+    Los hash personalizados usan los kernels vectorizados; los nativos
+    (hashlib) recorren las filas, ya que cada llamada es C puro.
+
+    Returns:
+        np.ndarray: Matriz uint8 (filas × tamaño del digest)
+    """
+    spec = get_algorithm(algorithm)
+    if not spec.native:
+        return hash_kernels.hash_matrix(spec.name, matrix)
+
+    count, length = matrix.shape
+    data = matrix.tobytes()
+    digests = b"".join(
+        new_hash(spec.name, data[offset:offset + length]).digest()
+        for offset in range(0, count * length, length)
+    )
+    return np.frombuffer(digests, dtype=np.uint8).reshape(count, -1)
+
+
+def _flip_bits(matrix, start: int):
+    """Copia de la matriz con un bit invertido por fila (posición cíclica)"""
+    count, length = matrix.shape
+    positions = (start + np.arange(count)) % (8 * length)
+    flipped = matrix.copy()
+    rows = np.arange(count)
+    flipped[rows, positions // 8] ^= (np.uint8(0x80) >> (positions % 8).astype(np.uint8))
+    return flipped
+
+
+# ===== EVALUACIÓN POR BLOQUES =====
+
+def evaluate_chunk(task: Tuple[str, str, int, int, int, int, int]) -> Dict[str, Any]:
+    """
+    Evaluar un bloque de entradas y devolver contadores parciales
+
+    Función de nivel de módulo para poder enviarse a otros procesos.
+
+    Args:
+        task: (algoritmo, familia, inicio, cantidad, longitud, semilla, bits de cubeta)
+
+    Returns:
+        Dict[str, Any]: Contadores sumables entre bloques
+    """
+    algorithm, family, start, count, length, seed, bucket_bits = task
+    inputs = generate_inputs(family, start, count, length, seed)
+    flipped = _flip_bits(inputs, start)
+
+    began = time.perf_counter()
+    digests = digest_matrix(algorithm, inputs)
+    changed = digest_matrix(algorithm, flipped)
+    seconds = time.perf_counter() - began
+
+    input_bits = 8 * length
+    bits = np.unpackbits(digests, axis=1)
+    diff = np.unpackbits(digests ^ changed, axis=1)
+    flips = diff.sum(axis=1, dtype=np.int64)
+
+    # La fila i invierte el bit (start + i) % input_bits: las filas de
+    # un mismo bit de entrada forman una progresión aritmética
+    sac = np.zeros((input_bits, diff.shape[1]), dtype=np.int64)
+    sac_rows = np.zeros(input_bits, dtype=np.int64)
+    for offset in range(min(input_bits, count)):
+        position = (start + offset) % input_bits
+        selected = diff[offset::input_bits]
+        sac[position] += selected.sum(axis=0, dtype=np.int64)
+        sac_rows[position] += len(selected)
+
+    low = (digests[:, -2].astype(np.int64) << 8) | digests[:, -1]
+    buckets = np.bincount(low & ((1 << bucket_bits) - 1), minlength=1 << bucket_bits)
+
+    prefix = np.zeros((count, 8), dtype=np.uint8)
+    width = min(8, digests.shape[1])
+    prefix[:, :width] = digests[:, :width]
+
+    return {
+        "algorithm": algorithm,
+        "family": family,
+        "count": count,
+        "bytes": 2 * count * length,
+        "seconds": seconds,
+        "flips_sum": int(flips.sum()),
+        "flips_sq": int((flips * flips).sum()),
+        "flips_min": int(flips.min()),
+        "flips_max": int(flips.max()),
+        "ones": bits.sum(axis=0, dtype=np.int64),
+        "sac": sac,
+        "sac_rows": sac_rows,
+        "buckets": buckets.astype(np.int64),
+        "prefixes": prefix.view('>u8').ravel(),
+    }
+
+
+def _merge(partials: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sumar los contadores parciales de varios bloques"""
+    merged = dict(partials[0])
+    for partial in partials[1:]:
+        for key in ("count", "bytes", "seconds", "flips_sum", "flips_sq", "ones", "sac", "sac_rows", "buckets"):
+            merged[key] = merged[key] + partial[key]
+        merged["flips_min"] = min(merged["flips_min"], partial["flips_min"])
+        merged["flips_max"] = max(merged["flips_max"], partial["flips_max"])
+    merged["prefixes"] = np.concatenate([partial["prefixes"] for partial in partials])
+    return merged
+
+
+def expected_collisions(samples: int, bits: int) -> float:
+    """Colisiones esperadas al lanzar `samples` valores uniformes en 2^bits cubetas"""
+    space = float(2 ** bits)
+    occupied = -space * math.expm1(samples * math.log1p(-1.0 / space))
+    return samples - occupied
+
+
+def _metrics(merged: Dict[str, Any]) -> Dict[str, Any]:
+    """Convertir los contadores acumulados en métricas del reporte"""
+    count = merged["count"]
+    output_bits = len(merged["ones"])
+
+    fractions_mean = merged["flips_sum"] / (count * output_bits)
+    variance = merged["flips_sq"] / count - (merged["flips_sum"] / count) ** 2
+    fractions_std = math.sqrt(max(variance, 0.0)) / output_bits
+
+    rows = np.maximum(merged["sac_rows"], 1)[:, None]
+    sac = merged["sac"] / rows
+    ones = merged["ones"] / count
+
+    buckets = merged["buckets"]
+    expected = count / len(buckets)
+    chi2 = float(((buckets - expected) ** 2).sum() / expected)
+    dof = len(buckets) - 1
+
+    prefixes = merged["prefixes"]
+    collisions_64 = count - len(np.unique(prefixes))
+    collisions_32 = count - len(np.unique(prefixes >> np.uint64(32)))
+    expected_32 = expected_collisions(count, 32)
+
+    return {
+        "samples": count,
+        "avalanche_mean": fractions_mean,
+        "avalanche_std": fractions_std,
+        "avalanche_min": merged["flips_min"] / output_bits,
+        "avalanche_max": merged["flips_max"] / output_bits,
+        "avalanche_bias": abs(fractions_mean - 0.5),
+        "sac_max_deviation": float(np.abs(sac - 0.5).max()),
+        "sac_noise": 0.5 / math.sqrt(float(merged["sac_rows"].min() or 1)),
+        "bit_bias_max": float(np.abs(ones - 0.5).max()),
+        "bit_bias_noise": 0.5 / math.sqrt(count),
+        "bucket_chi2": chi2,
+        "bucket_dof": dof,
+        "bucket_z": abs(chi2 - dof) / math.sqrt(2 * dof),
+        "collisions_32": collisions_32,
+        "collisions_32_expected": expected_32,
+        # Exceso sobre lo esperado en desviaciones de Poisson
+        "collision_z_32": max(collisions_32 - expected_32, 0.0) / math.sqrt(expected_32 + 1.0),
+        "collisions_64": collisions_64,
+    }
+
+
+def find_regressions(report: Dict[str, Any], tolerance: float = 2.0) -> Dict[str, List[str]]:
+    """
+    Métricas en las que cada algoritmo es peor que la referencia
+
+    Una métrica es regresión si supera `tolerance` veces el valor de la
+    referencia en la misma familia y además su umbral de ruido.
+
+    Returns:
+        Dict[str, List[str]]: algoritmo -> ["familia:métrica", ...]
+    """
+    reference = report["algorithms"].get(report["reference"])
+    if reference is None:
+        return {}
+
+    regressions: Dict[str, List[str]] = {}
+    for name, result in report["algorithms"].items():
+        if name == report["reference"]:
+            continue
+        found = []
+        for family, metrics in result["families"].items():
+            baseline = reference["families"][family]
+            for key, noise in REGRESSION_METRICS:
+                if metrics[key] > max(tolerance * baseline[key], noise):
+                    found.append(f"{family}:{key}")
+        regressions[name] = found
+    return regressions
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any],
+                    speed_tolerance: float = 0.2, tolerance: float = 2.0) -> List[str]:
+    """
+    Comparar un reporte con otro anterior del mismo formato
+
+    Señala los algoritmos cuyo rendimiento cae más de `speed_tolerance`
+    (fracción) y las métricas que empeoran más de `tolerance` veces
+    respecto al valor anterior (por encima del umbral de ruido).
+
+    Returns:
+        List[str]: Descripciones de las regresiones encontradas
+    """
+    if baseline.get("version") != current.get("version"):
+        raise InvalidInputError("Los reportes tienen versiones de formato distintas")
+
+    found = []
+    for name, result in current["algorithms"].items():
+        previous = baseline["algorithms"].get(name)
+        if previous is None:
+            continue
+        if result["throughput_mb_s"] < (1 - speed_tolerance) * previous["throughput_mb_s"]:
+            found.append(f"{name}: rendimiento {result['throughput_mb_s']:.2f} MB/s "
+                         f"(antes {previous['throughput_mb_s']:.2f} MB/s)")
+        for family, metrics in result["families"].items():
+            before = previous["families"].get(family)
+            if before is None:
+                continue
+            for key, noise in REGRESSION_METRICS:
+                if metrics[key] > max(tolerance * before[key], noise):
+                    found.append(f"{name}: {family}:{key} {metrics[key]:.4g} (antes {before[key]:.4g})")
+    return found
+
+
+def evaluate_quality(algorithms: Optional[Sequence[str]] = None,
+                     samples: int = DEFAULT_SAMPLES,
+                     message_length: int = DEFAULT_MESSAGE_LENGTH,
+                     families: Sequence[str] = INPUT_FAMILIES,
+                     seed: int = 2025,
+                     workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     bucket_bits: int = DEFAULT_BUCKET_BITS,
+                     reference: str = REFERENCE_ALGORITHM) -> Dict[str, Any]:
+    """
+    Evaluar la calidad estadística de varios algoritmos hash
+
+    Args:
+        algorithms: Algoritmos a evaluar (por defecto todos los personalizados)
+        samples (int): Entradas por algoritmo y familia
+        message_length (int): Longitud fija de cada entrada en bytes
+        families: Familias de entradas (INPUT_FAMILIES)
+        seed (int): Semilla de las entradas aleatorias
+        workers (int): Procesos (por defecto os.cpu_count(); 1 = sin pool)
+        chunk_size (int): Entradas por bloque de trabajo
+        bucket_bits (int): Bits bajos del digest usados como cubeta
+        reference (str): Algoritmo de referencia incluido siempre
+
+    Returns:
+        Dict[str, Any]: Reporte serializable a JSON
+    """
+    if np is None or not hash_kernels.NUMPY_AVAILABLE:
+        raise HashError("NumPy es necesario para el banco de calidad", "quality")
+    if samples <= 0 or message_length <= 0 or chunk_size <= 0:
+        raise InvalidInputError("samples, message_length y chunk_size deben ser positivos")
+    if not 1 <= bucket_bits <= 16:
+        raise InvalidInputError("bucket_bits debe estar entre 1 y 16")
+    for family in families:
+        if family not in INPUT_FAMILIES:
+            raise InvalidInputError(f"Familia de entradas no soportada: {family}")
+
+    names = [canonical_algorithm(name) for name in
+             (algorithms if algorithms is not None else available_algorithms(native=False))]
+    reference = canonical_algorithm(reference)
+    if reference not in names:
+        names.append(reference)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    tasks = [
+        (name, family, start, min(chunk_size, samples - start), message_length, seed, bucket_bits)
+        for name in names
+        for family in families
+        for start in range(0, samples, chunk_size)
+    ]
+
+    began = time.perf_counter()
+    if workers <= 1 or len(tasks) == 1:
+        partials = [evaluate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(evaluate_chunk, tasks))
+    elapsed = time.perf_counter() - began
+
+    grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for partial in partials:
+        grouped.setdefault((partial["algorithm"], partial["family"]), []).append(partial)
+
+    results: Dict[str, Any] = {}
+    for name in names:
+        merged = [_merge(grouped[(name, family)]) for family in families]
+        seconds = sum(item["seconds"] for item in merged)
+        results[name] = {
+            "bits": get_algorithm(name).bits,
+            "throughput_mb_s": sum(item["bytes"] for item in merged) / seconds / 1e6 if seconds else 0.0,
+            "families": {family: _metrics(item) for family, item in zip(families, merged)},
+        }
+
+    report = {
+        "version": REPORT_VERSION,
+        "reference": reference,
+        "samples": samples,
+        "message_length": message_length,
+        "families": list(families),
+        "seed": seed,
+        "workers": workers,
+        "chunk_size": chunk_size,
+        "bucket_bits": bucket_bits,
+        "elapsed_seconds": elapsed,
+        "algorithms": results,
+    }
+    for name, found in find_regressions(report).items():
+        results[name]["regressions"] = found
+    return report
+
+
+# ===== MEDIDA PARA UN TEXTO =====
+
+def text_avalanche(algorithm: str, data: bytes, flips: int = 32,
+                   max_bytes: int = AVALANCHE_SAMPLE_BYTES) -> float:
+    """
+    Fracción media de bits del digest que cambian al invertir bits de `data`
+
+    Invierte hasta `flips` bits repartidos uniformemente por los primeros
+    `max_bytes` bytes de la entrada: el coste (hasta flips + 1 hashes)
+    no crece con textos largos. El valor ideal es 0.5; no requiere NumPy.
+
+    Args:
+        algorithm (str): Nombre del algoritmo registrado
+        data (bytes): Entrada no vacía
+        flips (int): Número máximo de bits a invertir
+        max_bytes (int): Bytes de la entrada que se analizan
+
+    Returns:
+        float: Fracción media de bits cambiados
+    """
+    if not data:
+        raise InvalidInputError("La entrada no puede estar vacía")
+    data = data[:max_bytes]
+
+    original = int.from_bytes(new_hash(algorithm, data).digest(), 'big')
+    output_bits = get_algorithm(algorithm).bits
+    total_bits = 8 * len(data)
+    positions = sorted({index * total_bits // min(flips, total_bits) for index in range(min(flips, total_bits))})
+
+    changed = 0
+    buffer = bytearray(data)
+    for position in positions:
+        buffer[position // 8] ^= 0x80 >> (position % 8)
+        digest = int.from_bytes(new_hash(algorithm, bytes(buffer)).digest(), 'big')
+        buffer[position // 8] ^= 0x80 >> (position % 8)
+        changed += bin(original ^ digest).count("1")
+    return changed / (len(positions) * output_bits)
+
+# ===== EXPORTAR FUNCIONES =====
+__all__ = [
+    'REPORT_VERSION', 'REFERENCE_ALGORITHM',
+    'RANDOM_INPUTS', 'COUNTER_INPUTS', 'INPUT_FAMILIES', 'AVALANCHE_SAMPLE_BYTES',
+    'generate_inputs', 'digest_matrix', 'evaluate_chunk',
+    'expected_collisions', 'find_regressions', 'compare_reports', 'evaluate_quality',
+    'text_avalanche'
+]
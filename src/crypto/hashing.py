@@ -0,0 +1,841 @@
+"""
+#️⃣ Objetos Hash Incrementales - CryptoUNS
+=======================================
+
+Versiones incrementales (al estilo de ``hashlib``) de las funciones hash
+personalizadas de ``CustomHash``:
+- ``Custom64Hash``: FNV de 64 bits con mezcla final
+- ``Custom128Hash``: pasada directa + pasada inversa
+- ``Custom256Hash``: cuatro carriles FNV con semillas distintas
+
+Todos aceptan datos por partes con ``update(bytes)`` y producen
+exactamente el mismo resultado que las funciones de una sola llamada::
+
+    h = new("custom256")
+    for chunk in chunks:
+        h.update(chunk)
+    h.hexdigest()
+
+``MultiHasher`` calcula varios algoritmos de ``HASH_ALGORITHMS`` en una
+sola lectura de los datos; los de ``hashlib`` corren en hilos (liberan
+el GIL) mientras el hilo llamador procesa los personalizados::
+
+    multi_digest_file("datos.bin", ["SHA256", "SHA1", "MD5", "Custom256"])
+
+``DigestCache`` memoriza resultados (LRU acotada por
+``PerformanceConfig.CACHE_SIZE``) para no recalcular el hash de textos
+y archivos que no han cambiado.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import hashlib
+import os
+import queue
+import shutil
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import cycle
+import tempfile
+from typing import Any, BinaryIO, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Importar constantes y excepciones
+try:
+    from ..data.config import PerformanceConfig
+    from ..utils.constants import *
+    from ..utils.exceptions import *
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.config import PerformanceConfig
+    from utils.constants import *
+    from utils.exceptions import *
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# ===== PARÁMETROS =====
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+FNV_OFFSET = 0x811c9dc5
+FNV_PRIME = 0x01000193
+
+CUSTOM256_SEEDS = (0x811c9dc5, 0x9E3779B9, 0x85ebca6b, 0xc2b2ae35)
+CUSTOM256_MULTIPLIERS = (0x01000193, 0x40014141, 0x27d4eb2d, 0x165667b1)
+_TWEAKS_256 = [[(i * seed) & 0xFF for i in range(256)] for seed in CUSTOM256_SEEDS]
+
+# Tamaño de lectura y límite en memoria del búfer de la pasada inversa
+CHUNK_SIZE = PERFORMANCE_LIMITS['chunk_size']
+SPOOL_MAX_SIZE = 1024 * 1024
+
+# Bloque de lectura del hash múltiple: grande para amortizar el paso entre hilos
+MULTI_CHUNK_SIZE = 1024 * 1024
+
+# Lote mínimo para usar los kernels NumPy (por debajo domina el coste por llamada)
+VECTOR_MIN_BATCH = 16
+
+
+def _as_bytes(data: BytesLike) -> bytes:
+    """Validar y normalizar la entrada de update()"""
+    if isinstance(data, str):
+        raise TypeError("Las cadenas deben codificarse antes de hashear")
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+# ===== CLASE BASE =====
+class _CustomHashObject(ABC):
+    """
+    Interfaz común de los objetos hash personalizados
+
+    Admite ``with``: al salir se llama a ``close()``, que libera los
+    recursos que el objeto mantenga (p. ej. el archivo temporal de
+    ``Custom128Hash``).
+    """
+
+    name = ""
+    digest_size = 0
+    block_size = 1
+
+    @abstractmethod
+    def update(self, data: BytesLike) -> None:
+        """
+        Añadir datos al hash
+
+        Args:
+            data (BytesLike): Bytes a procesar
+        """
+
+    @abstractmethod
+    def _final(self) -> int:
+        """Valor final del hash como entero (no modifica el estado)"""
+
+    @abstractmethod
+    def copy(self) -> '_CustomHashObject':
+        """Crear una copia independiente del estado actual"""
+
+    def close(self) -> None:
+        """Liberar recursos (el objeto no puede usarse después)"""
+
+    def __enter__(self) -> '_CustomHashObject':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def digest(self) -> bytes:
+        """
+        Obtener el hash de los datos procesados hasta ahora
+
+        Returns:
+            bytes: Hash de ``digest_size`` bytes
+        """
+        return self._final().to_bytes(self.digest_size, 'big')
+
+    def hexdigest(self) -> str:
+        """
+        Obtener el hash en hexadecimal
+
+        Returns:
+            str: Hash en hexadecimal (minúsculas)
+        """
+        return self.digest().hex()
+
+    def __repr__(self) -> str:
+        return f"<{self.name} hash object @ {id(self):#x}>"
+
+
+# ===== HASH DE 64 BITS =====
+class Custom64Hash(_CustomHashObject):
+    """Hash personalizado de 64 bits (FNV con mezcla final)"""
+
+    name = "custom64"
+    digest_size = 8
+
+    def __init__(self, data: BytesLike = b""):
+        self._state = FNV_OFFSET
+        if data:
+            self.update(data)
+
+    def update(self, data: BytesLike) -> None:
+        state = self._state
+        for byte in _as_bytes(data):
+            state = ((state ^ byte) * FNV_PRIME) & MASK_64
+        self._state = state
+
+    def _final(self) -> int:
+        value = self._state
+        value ^= value >> 32
+        value ^= value >> 16
+        value ^= value >> 8
+        return value & MASK_64
+
+    def copy(self) -> 'Custom64Hash':
+        other = Custom64Hash()
+        other._state = self._state
+        return other
+
+
+# ===== HASH DE 128 BITS =====
+class Custom128Hash(_CustomHashObject):
+    """
+    Hash personalizado de 128 bits
+
+    La segunda mitad recorre los datos desde el final, así que no puede
+    calcularse hasta conocer todo el mensaje: los datos se guardan en un
+    archivo temporal que solo ocupa memoria hasta ``SPOOL_MAX_SIZE`` bytes
+    y se leen hacia atrás por bloques en ``digest()``. El archivo se cierra
+    con ``close()`` (o al salir de un bloque ``with``) y, en último caso,
+    cuando el objeto se destruye.
+    """
+
+    name = "custom128"
+    digest_size = 16
+
+    def __init__(self, data: BytesLike = b""):
+        self._forward = FNV_OFFSET
+        self._length = 0
+        self._spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        if data:
+            self.update(data)
+
+    def update(self, data: BytesLike) -> None:
+        data = _as_bytes(data)
+        state = self._forward
+        for i, byte in enumerate(data, self._length):
+            state = (((state ^ byte) * FNV_PRIME) ^ i) & MASK_64
+        self._forward = state
+        self._length += len(data)
+        self._spool.write(data)
+
+    def _reverse(self) -> int:
+        """Pasada inversa sobre los datos almacenados"""
+        state = FNV_OFFSET
+        index = 0
+        end = self._length
+        try:
+            while end > 0:
+                start = max(0, end - CHUNK_SIZE)
+                self._spool.seek(start)
+                for byte in reversed(self._spool.read(end - start)):
+                    state = (((state ^ byte) * FNV_PRIME) ^ (index * 3)) & MASK_64
+                    index += 1
+                end = start
+        finally:
+            self._spool.seek(0, 2)
+        return state
+
+    def _final(self) -> int:
+        return (self._forward << 64) | self._reverse()
+
+    def copy(self) -> 'Custom128Hash':
+        other = Custom128Hash()
+        other._forward = self._forward
+        other._length = self._length
+        self._spool.seek(0)
+        try:
+            shutil.copyfileobj(self._spool, other._spool)
+        finally:
+            self._spool.seek(0, 2)
+        return other
+
+    def close(self) -> None:
+        self._spool.close()
+
+    def __del__(self) -> None:
+        # __init__ pudo fallar antes de crear el archivo temporal
+        spool = getattr(self, '_spool', None)
+        if spool is not None:
+            spool.close()
+
+
+# ===== HASH DE 256 BITS =====
+class Custom256Hash(_CustomHashObject):
+    """Hash personalizado de 256 bits (cuatro carriles FNV independientes)"""
+
+    name = "custom256"
+    digest_size = 32
+
+    def __init__(self, data: BytesLike = b""):
+        self._lanes = list(CUSTOM256_SEEDS)
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: BytesLike) -> None:
+        data = _as_bytes(data)
+        offset = self._length
+        for lane, mult in enumerate(CUSTOM256_MULTIPLIERS):
+            # (i * seed) & 0xFF tiene periodo 256: recorrer la tabla desde i % 256
+            table = _TWEAKS_256[lane]
+            tweaks = table[offset & 0xFF:] + table[:offset & 0xFF]
+            state = self._lanes[lane]
+            for byte, tweak in zip(data, cycle(tweaks)):
+                state = (((state ^ byte) * mult) ^ tweak) & MASK_64
+            self._lanes[lane] = state
+        self._length += len(data)
+
+    def _final(self) -> int:
+        result = 0
+        for value in self._lanes:
+            value ^= value >> 32
+            value ^= value >> 16
+            result = (result << 64) | (value & MASK_64)
+        return result
+
+    def copy(self) -> 'Custom256Hash':
+        other = Custom256Hash()
+        other._lanes = list(self._lanes)
+        other._length = self._length
+        return other
+
+
+# ===== CONSTRUCTORES =====
+CUSTOM_HASHES = {
+    Custom64Hash.name: Custom64Hash,
+    Custom128Hash.name: Custom128Hash,
+    Custom256Hash.name: Custom256Hash,
+}
+
+
+def new(name: str, data: BytesLike = b"") -> _CustomHashObject:
+    """
+    Crear un objeto hash personalizado por nombre
+
+    Args:
+        name (str): "custom64", "custom128" o "custom256" (sin distinguir mayúsculas)
+        data (BytesLike): Datos iniciales opcionales
+
+    Returns:
+        _CustomHashObject: Objeto hash incremental
+    """
+    factory = CUSTOM_HASHES.get(name.lower())
+    if factory is None:
+        raise InvalidInputError(f"Algoritmo no soportado: {name}")
+    return factory(data)
+
+
+def custom64(data: BytesLike = b"") -> Custom64Hash:
+    """Crear un objeto hash de 64 bits"""
+    return Custom64Hash(data)
+
+
+def custom128(data: BytesLike = b"") -> Custom128Hash:
+    """Crear un objeto hash de 128 bits"""
+    return Custom128Hash(data)
+
+
+def custom256(data: BytesLike = b"") -> Custom256Hash:
+    """Crear un objeto hash de 256 bits"""
+    return Custom256Hash(data)
+
+
+def hash_many(name: str, messages: Sequence[BytesLike], vectorized: Optional[bool] = None) -> List[bytes]:
+    """
+    Calcular un hash personalizado de muchos mensajes
+
+    Con NumPy disponible y lotes de al menos ``VECTOR_MIN_BATCH`` mensajes
+    usa ``hash_kernels`` (carriles y mensajes en bloque); en otro caso
+    procesa los mensajes uno a uno en Python puro. El resultado es el mismo.
+
+    Args:
+        name (str): "custom64", "custom128" o "custom256"
+        messages (Sequence[BytesLike]): Mensajes a hashear
+        vectorized (Optional[bool]): Forzar (True) o desactivar (False) los kernels; None = automático
+
+    Returns:
+        List[bytes]: Digests en el mismo orden que los mensajes
+    """
+    try:
+        from . import hash_kernels
+    except ImportError:
+        from crypto import hash_kernels
+
+    if vectorized is None:
+        vectorized = hash_kernels.NUMPY_AVAILABLE and len(messages) >= VECTOR_MIN_BATCH
+    if vectorized:
+        return hash_kernels.hash_many(name, messages)
+    digests = []
+    for message in messages:
+        with new(name, message) as hasher:
+            digests.append(hasher.digest())
+    return digests
+
+# ===== REGISTRO DE ALGORITMOS =====
+class HashAlgorithm(NamedTuple):
+    """Entrada del registro de algoritmos hash"""
+    name: str
+    bits: int
+    # Crea un objeto incremental con update()/digest()/hexdigest()/copy()
+    factory: Callable[[], Any]
+    # True si está implementado en C (hashlib): libera el GIL y es rápido
+    native: bool
+
+
+def _hashlib_factory(name: str) -> Callable[[], Any]:
+    """Constructor de hashlib resuelto una sola vez"""
+    constructor = getattr(hashlib, name)
+    return lambda: constructor()
+
+
+HASH_REGISTRY: Dict[str, HashAlgorithm] = {}
+
+
+def _normalize(name: str) -> str:
+    return name.replace('-', '').replace('_', '').lower()
+
+
+def register_algorithm(name: str, factory: Callable[[], Any], bits: int, native: bool = False) -> HashAlgorithm:
+    """
+    Registrar un algoritmo hash
+
+    Args:
+        name (str): Nombre canónico (por ejemplo "SHA256")
+        factory (Callable[[], Any]): Crea un objeto hash incremental vacío
+        bits (int): Tamaño del resultado en bits
+        native (bool): True si está implementado en C
+
+    Returns:
+        HashAlgorithm: Entrada registrada
+    """
+    algorithm = HashAlgorithm(name, bits, factory, native)
+    HASH_REGISTRY[name] = algorithm
+    return algorithm
+
+
+def get_algorithm(name: str) -> HashAlgorithm:
+    """
+    Buscar un algoritmo por nombre
+
+    Acepta mayúsculas/minúsculas, guiones y guiones bajos
+    ("sha-256", "custom256", "sha3-256").
+
+    Args:
+        name (str): Nombre del algoritmo
+
+    Returns:
+        HashAlgorithm: Entrada del registro
+    """
+    algorithm = HASH_REGISTRY.get(name)
+    if algorithm is not None:
+        return algorithm
+    wanted = _normalize(name)
+    for algorithm in HASH_REGISTRY.values():
+        if _normalize(algorithm.name) == wanted:
+            return algorithm
+    raise InvalidInputError(f"Algoritmo no soportado: {name}")
+
+
+def canonical_algorithm(name: str) -> str:
+    """
+    Normalizar el nombre de un algoritmo a su clave en el registro
+
+    Args:
+        name (str): Nombre del algoritmo
+
+    Returns:
+        str: Nombre canónico (por ejemplo "SHA256" o "Custom256")
+    """
+    return get_algorithm(name).name
+
+
+def new_hash(name: str, data: BytesLike = b""):
+    """
+    Crear un objeto hash incremental de cualquier algoritmo registrado
+
+    Args:
+        name (str): Nombre del algoritmo
+        data (BytesLike): Datos iniciales opcionales
+
+    Returns:
+        Objeto con update()/digest()/hexdigest()/copy()
+    """
+    hasher = get_algorithm(name).factory()
+    if data:
+        hasher.update(data)
+    return hasher
+
+
+def hash_stream(name: str, stream: BinaryIO, chunk_size: int = CHUNK_SIZE):
+    """
+    Hashear un flujo binario por bloques, en memoria constante
+
+    Args:
+        name (str): Nombre del algoritmo
+        stream (BinaryIO): Flujo abierto en modo binario (se lee hasta el final)
+        chunk_size (int): Tamaño de cada lectura
+
+    Returns:
+        Objeto hash con todo el flujo ya añadido
+    """
+    hasher = new_hash(name)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        hasher.update(chunk)
+    return hasher
+
+
+def available_algorithms(native: Optional[bool] = None) -> List[str]:
+    """
+    Listar los algoritmos registrados
+
+    Args:
+        native (Optional[bool]): Filtrar por implementación en C (True) o en Python (False)
+
+    Returns:
+        List[str]: Nombres canónicos en orden de registro
+    """
+    return [name for name, algorithm in HASH_REGISTRY.items()
+            if native is None or algorithm.native == native]
+
+
+# Algoritmos de HASH_ALGORITHMS más las alternativas modernas de hashlib
+for _name, _module_name in (('MD5', 'md5'), ('SHA1', 'sha1'), ('SHA256', 'sha256'), ('SHA512', 'sha512'),
+                            ('BLAKE2b', 'blake2b'), ('BLAKE2s', 'blake2s'),
+                            ('SHA3_256', 'sha3_256'), ('SHA3_512', 'sha3_512')):
+    register_algorithm(_name, _hashlib_factory(_module_name), HASH_ALGORITHMS[_name], native=True)
+for _factory in (Custom64Hash, Custom128Hash, Custom256Hash):
+    _name = f"Custom{_factory.digest_size * 8}"
+    register_algorithm(_name, _factory, HASH_ALGORITHMS[_name])
+
+
+# ===== HASH MÚLTIPLE EN UNA PASADA =====
+class _HashWorker(threading.Thread):
+    """Hilo que alimenta un grupo de objetos hashlib con los bloques recibidos"""
+
+    def __init__(self, hashers: list):
+        super().__init__(daemon=True)
+        self.hashers = hashers
+        self.chunks = queue.Queue(maxsize=4)
+        self.error = None
+
+    def run(self) -> None:
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                return
+            if self.error is None:
+                try:
+                    for hasher in self.hashers:
+                        hasher.update(chunk)
+                except Exception as e:
+                    self.error = e
+
+
+class MultiHasher:
+    """
+    Varios algoritmos hash alimentados con una única lectura de los datos
+
+    Cada bloque recibido en ``update()`` se reparte a todos los algoritmos.
+    Los de ``hashlib`` se agrupan en hasta ``max_threads`` hilos (cola de
+    tamaño acotado, así que la memoria no depende del tamaño de la entrada);
+    los personalizados, escritos en Python, se calculan en el hilo llamador
+    en paralelo con ellos.
+    """
+
+    def __init__(self, algorithms: Iterable[str], max_threads: int = PERFORMANCE_LIMITS['max_threads']):
+        """
+        Inicializar el hash múltiple
+
+        Args:
+            algorithms (Iterable[str]): Nombres de ``HASH_ALGORITHMS``
+            max_threads (int): Hilos máximos para los algoritmos de hashlib (0 = sin hilos)
+        """
+        names = list(dict.fromkeys(canonical_algorithm(name) for name in algorithms))
+        if not names:
+            raise InvalidInputError("Debe indicar al menos un algoritmo")
+
+        self.hashers = {name: new_hash(name) for name in names}
+        threaded = [name for name in names if HASH_REGISTRY[name].native]
+        self._local = [hasher for name, hasher in self.hashers.items() if name not in threaded]
+
+        # Un solo algoritmo no gana nada con un hilo aparte
+        if len(names) < 2:
+            max_threads = 0
+        workers = min(len(threaded), max_threads)
+        groups = [[self.hashers[name] for name in threaded[i::workers]] for i in range(workers)]
+        if not workers:
+            self._local = list(self.hashers.values())
+        self._workers = [_HashWorker(group) for group in groups]
+        for worker in self._workers:
+            worker.start()
+        self._finished = False
+
+    def update(self, data: BytesLike) -> None:
+        """
+        Añadir un bloque de datos a todos los algoritmos
+
+        Args:
+            data (BytesLike): Bytes a procesar
+        """
+        if self._finished:
+            raise HashError("El hash múltiple ya fue finalizado", "multi")
+        # Los hilos leen el bloque más tarde: debe ser inmutable
+        chunk = _as_bytes(data)
+        for worker in self._workers:
+            worker.chunks.put(chunk)
+        for hasher in self._local:
+            hasher.update(chunk)
+
+    def close(self) -> None:
+        """Detener los hilos (sin calcular los resultados)"""
+        if not self._finished:
+            self._finished = True
+            for worker in self._workers:
+                worker.chunks.put(None)
+            for worker in self._workers:
+                worker.join()
+
+    def hexdigests(self) -> Dict[str, str]:
+        """
+        Finalizar y obtener todos los resultados
+
+        Returns:
+            Dict[str, str]: Hash hexadecimal por nombre canónico de algoritmo
+        """
+        self.close()
+        for worker in self._workers:
+            if worker.error is not None:
+                raise HashError(f"Error al calcular hash: {worker.error}", "multi")
+        return {name: hasher.hexdigest() for name, hasher in self.hashers.items()}
+
+    def __enter__(self) -> 'MultiHasher':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def multi_digest_stream(stream: BinaryIO, algorithms: Iterable[str],
+                        chunk_size: int = MULTI_CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Calcular varios hash de un flujo binario leyéndolo una sola vez
+
+    Args:
+        stream (BinaryIO): Flujo abierto en modo binario
+        algorithms (Iterable[str]): Nombres de ``HASH_ALGORITHMS``
+        chunk_size (int): Tamaño de cada lectura
+
+    Returns:
+        Dict[str, str]: Hash hexadecimal por algoritmo
+    """
+    with MultiHasher(algorithms) as hasher:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            hasher.update(chunk)
+        return hasher.hexdigests()
+
+
+def multi_digest_file(file_path: str, algorithms: Iterable[str],
+                      chunk_size: int = MULTI_CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Calcular varios hash de un archivo leyéndolo una sola vez
+
+    Args:
+        file_path (str): Ruta del archivo
+        algorithms (Iterable[str]): Nombres de ``HASH_ALGORITHMS``
+        chunk_size (int): Tamaño de cada lectura
+
+    Returns:
+        Dict[str, str]: Hash hexadecimal por algoritmo
+    """
+    with open(file_path, 'rb') as f:
+        return multi_digest_stream(f, algorithms, chunk_size)
+
+
+def multi_digest(data: Union[str, BytesLike], algorithms: Iterable[str],
+                 chunk_size: int = MULTI_CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Calcular varios hash de un texto o de bytes codificándolos una sola vez
+
+    Args:
+        data (Union[str, BytesLike]): Texto (se codifica en UTF-8) o bytes
+        algorithms (Iterable[str]): Nombres de ``HASH_ALGORITHMS``
+        chunk_size (int): Tamaño de los bloques repartidos a los hilos
+
+    Returns:
+        Dict[str, str]: Hash hexadecimal por algoritmo
+    """
+    data = data.encode('utf-8') if isinstance(data, str) else _as_bytes(data)
+    view = memoryview(data)
+    with MultiHasher(algorithms) as hasher:
+        for start in range(0, len(data), chunk_size):
+            hasher.update(view[start:start + chunk_size])
+        return hasher.hexdigests()
+
+# ===== CACHÉ DE RESULTADOS =====
+class DigestCache:
+    """
+    Caché LRU de hashes calculados
+
+    Las claves identifican el contenido sin guardarlo:
+    - Texto: ``(algoritmo, "text", longitud, pre-hash)``, con un BLAKE2b
+      de 128 bits como pre-hash (mucho más rápido que los hash en Python
+      y sin colisiones prácticas).
+    - Archivo: ``(algoritmo, "file", ruta, tamaño, mtime_ns, inodo)``; si
+      el archivo cambia cambia la clave y el valor se recalcula. Igual que
+      git con los archivos "racy", un archivo modificado hace menos de
+      ``RACY_WINDOW_NS`` no se guarda: otra escritura dentro de la
+      resolución del reloj del sistema de archivos no cambiaría mtime.
+    """
+
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, max_size: Optional[int] = None, enabled: Optional[bool] = None):
+        """
+        Inicializar la caché
+
+        Args:
+            max_size (Optional[int]): Capacidad (por defecto ``PerformanceConfig.CACHE_SIZE``)
+            enabled (Optional[bool]): Activar la caché (por defecto ``PerformanceConfig.ENABLE_CACHE``)
+        """
+        self.max_size = PerformanceConfig.CACHE_SIZE if max_size is None else max_size
+        self.enabled = PerformanceConfig.ENABLE_CACHE if enabled is None else enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def text_key(algorithm: str, data: Union[str, BytesLike]) -> Tuple:
+        """
+        Clave de caché para un texto o bloque de bytes
+
+        Args:
+            algorithm (str): Nombre del algoritmo
+            data (Union[str, BytesLike]): Contenido
+
+        Returns:
+            Tuple: Clave de la caché
+        """
+        data = data.encode('utf-8') if isinstance(data, str) else data
+        fingerprint = hashlib.blake2b(data, digest_size=16).digest()
+        return (algorithm, "text", len(data), fingerprint)
+
+    @classmethod
+    def file_key(cls, algorithm: str, file_path: str) -> Optional[Tuple]:
+        """
+        Clave de caché para un archivo según sus metadatos
+
+        Args:
+            algorithm (str): Nombre del algoritmo
+            file_path (str): Ruta del archivo
+
+        Returns:
+            Optional[Tuple]: Clave de la caché, o None si el archivo es demasiado reciente
+        """
+        info = os.stat(file_path)
+        if time.time_ns() - info.st_mtime_ns < cls.RACY_WINDOW_NS:
+            return None
+        return (algorithm, "file", os.path.abspath(file_path), info.st_size, info.st_mtime_ns, info.st_ino)
+
+    def get(self, key: Optional[Hashable]) -> Optional[Any]:
+        """Obtener un valor (None si no está) actualizando los contadores"""
+        # Una caché desactivada no registra aciertos ni fallos
+        if not self.enabled:
+            return None
+        with self._lock:
+            value = self._entries.get(key) if key is not None else None
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Optional[Hashable], value: Any) -> None:
+        """Guardar un valor expulsando el menos usado si se supera la capacidad"""
+        if not self.enabled or self.max_size <= 0 or key is None:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Optional[Hashable], compute: Callable[[], Any]) -> Any:
+        """
+        Devolver el valor guardado o calcularlo y guardarlo
+
+        Args:
+            key (Optional[Hashable]): Clave (ver ``text_key``/``file_key``); None = no guardar
+            compute (Callable[[], Any]): Función que calcula el valor
+
+        Returns:
+            Any: Valor guardado o recién calculado
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Vaciar la caché y reiniciar los contadores"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtener estadísticas de uso
+
+        Returns:
+            Dict[str, Any]: Aciertos, fallos, tasa de aciertos y ocupación
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[DigestCache] = None
+
+
+def get_default_digest_cache() -> DigestCache:
+    """
+    Obtener la caché de hashes compartida por la aplicación
+
+    Returns:
+        DigestCache: Caché por defecto
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DigestCache()
+    return _default_cache
+
+# ===== EXPORTAR CLASES =====
+__all__ = [
+    'Custom64Hash',
+    'Custom128Hash',
+    'Custom256Hash',
+    'CUSTOM_HASHES',
+    'custom64',
+    'custom128',
+    'custom256',
+    'hash_many',
+    'HashAlgorithm',
+    'HASH_REGISTRY',
+    'register_algorithm',
+    'get_algorithm',
+    'canonical_algorithm',
+    'new_hash',
+    'hash_stream',
+    'available_algorithms',
+    'MultiHasher',
+    'multi_digest',
+    'multi_digest_file',
+    'multi_digest_stream',
+    'DigestCache',
+    'get_default_digest_cache'
+]
@@ -0,0 +1,221 @@
+"""
+🧮 Kernel Vectorizado de Huffman - CryptoUNS
+==========================================
+
+Decodificación con NumPy de flujos Huffman empaquetados grandes y
+conteo de bytes para el modo binario.
+
+Decodificar un flujo Huffman es secuencial: dónde empieza cada código
+depende de todos los anteriores. Los códigos Huffman, sin embargo, se
+resincronizan enseguida: si se empieza a decodificar en un bit
+cualquiera, tras unos pocos símbolos erróneos el recorrido cae en una
+frontera de código real y desde ahí coincide con el recorrido correcto.
+
+El kernel corta el flujo en segmentos de ``SEGMENT_BITS`` bits y los
+recorre todos a la vez (un paso = un símbolo por segmento, con una
+única tabla de ``2^longitud_máxima`` entradas). La entrada correcta de
+cada segmento es la salida del anterior; si esa posición aparece en el
+recorrido del segmento, sus símbolos a partir de ella son válidos. Los
+segmentos que no se sincronizaron (raros) se vuelven a recorrer desde su
+entrada correcta hasta que todo el bloque es consistente.
+
+NumPy es opcional: sin él ``NUMPY_AVAILABLE`` es False y
+``HuffmanCoding.decode`` usa el decodificador por tablas en Python puro.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+from typing import Dict, NamedTuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Importar excepciones
+try:
+    from ..utils.exceptions import *
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from utils.exceptions import *
+
+# Longitud máxima de código admitida (tabla de 2^20 entradas; ventana de 32 bits por byte)
+MAX_CODE_BITS = 20
+# Bits por segmento recorrido en paralelo
+SEGMENT_BITS = 1024
+# Bits que cada segmento empieza antes de su frontera para resincronizarse
+OVERLAP_BITS = 128
+# Segmentos por bloque (acota las matrices de pasos × segmentos)
+BLOCK_SEGMENTS = 8192
+
+
+class KernelTable(NamedTuple):
+    """Tabla de decodificación de una sola consulta por símbolo"""
+    # Ventana de `width` bits -> (símbolo << 5) | longitud del código
+    entries: "np.ndarray"
+    # Punto de código Unicode de cada símbolo
+    chars: "np.ndarray"
+    width: int
+    min_length: int
+
+
+def supported(codes: Dict[str, str]) -> bool:
+    """
+    Indicar si el kernel puede decodificar con estos códigos
+
+    Requiere un árbol completo (toda ventana de bits empieza por un
+    código) y códigos de a lo sumo ``MAX_CODE_BITS`` bits.
+    """
+    if not NUMPY_AVAILABLE or len(codes) < 2:
+        return False
+    lengths = [len(code) for code in codes.values()]
+    return max(lengths) <= MAX_CODE_BITS and sum(2.0 ** -length for length in lengths) == 1.0
+
+
+def build_table(codes: Dict[str, str]) -> KernelTable:
+    """
+    Construir la tabla del kernel
+
+    Args:
+        codes (Dict[str, str]): Código de cada carácter (árbol completo)
+
+    Returns:
+        KernelTable: Tabla indexada por los siguientes ``width`` bits
+    """
+    if not supported(codes):
+        raise InvalidInputError("Códigos no soportados por el kernel vectorizado")
+
+    width = max(len(code) for code in codes.values())
+    entries = np.zeros(1 << width, dtype=np.int32)
+    chars = np.empty(len(codes), dtype=np.uint32)
+    for symbol, (char, code) in enumerate(codes.items()):
+        span = width - len(code)
+        start = int(code, 2) << span
+        entries[start:start + (1 << span)] = (symbol << 5) | len(code)
+        chars[symbol] = ord(char)
+    return KernelTable(entries, chars, width, min(len(code) for code in codes.values()))
+
+
+def byte_histogram(data) -> "np.ndarray":
+    """
+    Contar los 256 valores de byte con np.bincount
+
+    Args:
+        data: Objeto con protocolo de búfer (bytes, bytearray, memoryview);
+            np.frombuffer lo ve sin copiarlo
+
+    Returns:
+        np.ndarray: 256 frecuencias
+    """
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+
+def _walk(table: KernelTable, windows, starts, ends):
+    """
+    Recorrer en paralelo los segmentos desde `starts` hasta pasar de `ends`
+
+    Returns:
+        Tuple: (posiciones (pasos × segmentos), entradas de tabla, posiciones de salida);
+        un segmento ya recorrido sigue decodificando más allá de su final
+    """
+    positions, found = [], []
+    position = starts.copy()
+    shift_base = 64 - table.width
+    mask = (1 << table.width) - 1
+    entries = table.entries
+    while (position < ends).any():
+        window = (windows[position >> 3] >> (shift_base - (position & 7))) & mask
+        entry = entries[window]
+        positions.append(position.copy())
+        found.append(entry)
+        position += entry & 31
+    positions = np.array(positions)
+    # Salida: la primera posición en o más allá del final del segmento
+    taken = (positions < ends).sum(axis=0)
+    exits = np.where(taken < len(positions),
+                     np.take_along_axis(positions, np.minimum(taken, len(positions) - 1)[None], axis=0)[0],
+                     position)
+    return positions, np.array(found), exits
+
+
+def decode(table: KernelTable, data: bytes, bit_length: int) -> str:
+    """
+    Decodificar un flujo empaquetado (primer bit en el más significativo)
+
+    Args:
+        table (KernelTable): Tabla de ``build_table``
+        data (bytes): Bits empaquetados
+        bit_length (int): Bits válidos
+
+    Returns:
+        str: Texto decodificado
+    """
+    if not bit_length:
+        return ""
+
+    # Relleno: un segmento terminado sigue avanzando mientras otros no acaben
+    padding = (SEGMENT_BITS + OVERLAP_BITS) * MAX_CODE_BITS // 8 + 8
+    raw = bytes(data) + bytes(padding)
+    size = len(raw) - 3
+    # Bytes b..b+3 de cada posición b en los bits altos de un int64 (sin conversiones por paso)
+    windows = np.empty(size, dtype=np.int64)
+    for offset in range(4):
+        count = (size - offset + 3) // 4
+        windows[offset::4] = np.frombuffer(raw, dtype='>u4', count=count, offset=offset)
+    windows <<= 32
+    del raw
+
+    bounds = np.arange(0, bit_length, SEGMENT_BITS, dtype=np.int64)
+    pieces = []
+    entry = 0
+    for first in range(0, len(bounds), BLOCK_SEGMENTS):
+        block = bounds[first:first + BLOCK_SEGMENTS]
+        starts = np.maximum(block - OVERLAP_BITS, 0)
+        ends = np.minimum(block + SEGMENT_BITS, bit_length)
+        starts[0] = entry
+        positions, found, exits = _walk(table, windows, starts, ends)
+
+        while True:
+            # Entrada correcta de cada segmento: la salida del anterior
+            entries = np.concatenate(([entry], exits[:-1]))
+            synced = (starts == entries) | (positions == entries).any(axis=0)
+            stale = np.flatnonzero(~synced)
+            if not len(stale):
+                break
+            # Volver a recorrer desde la entrada correcta (raro)
+            starts[stale] = entries[stale]
+            again, again_found, exits[stale] = _walk(table, windows, starts[stale], ends[stale])
+            steps = max(len(positions), len(again))
+            positions, found = _extend(positions, steps), _extend(found, steps)
+            positions[:, stale] = _extend(again, steps)
+            found[:, stale] = _extend(again_found, steps)
+
+        keep = (positions >= entries) & (positions < ends)
+        pieces.append(found.T[keep.T])
+        entry = int(exits[-1])
+
+    if entry != bit_length:
+        raise InvalidInputError("Secuencia de bits inválida para este árbol")
+    symbols = np.concatenate(pieces) >> 5
+    return table.chars[symbols].astype('<u4').tobytes().decode('utf-32-le')
+
+
+def _extend(matrix, steps: int):
+    """Completar una matriz de pasos con filas de -1 (fuera de todo segmento)"""
+    if len(matrix) >= steps:
+        return matrix
+    padding = np.full((steps - len(matrix), matrix.shape[1]), -1, dtype=matrix.dtype)
+    return np.concatenate([matrix, padding])
+
+
+__all__ = [
+    'NUMPY_AVAILABLE', 'MAX_CODE_BITS', 'SEGMENT_BITS', 'BLOCK_SEGMENTS',
+    'KernelTable', 'supported', 'build_table', 'decode', 'byte_histogram',
+]
@@ -0,0 +1,424 @@
+"""
+🗝️ Almacén de Claves - CryptoUNS
+==============================
+
+Almacén persistente de pares de claves RSA con nombre.
+
+Las claves se guardan en un único archivo binario de solo anexado bajo
+``PathConfig.KEYS_DIR``. Cada registro tiene la forma::
+
+    b"KREC" | longitud_nombre (u16) | longitud_cuerpo (u32) | nombre | cuerpo
+
+y el cuerpo contiene el tamaño de clave y los enteros (e, n, d[, p, q])
+en big-endian con prefijo de longitud. Un cuerpo vacío marca una clave
+eliminada; si un nombre aparece varias veces, prevalece el último registro.
+
+El archivo se abre con ``mmap`` la primera vez que se necesita y solo se
+recorren las cabeceras para construir el índice nombre → desplazamiento,
+de modo que abrir el almacén no decodifica ninguna clave. Delante del
+archivo hay una caché LRU en memoria con las claves ya decodificadas.
+
+El archivo se crea con permisos 0o600. Un registro final incompleto (p. ej.
+tras una caída a mitad de escritura) se ignora al leer y se trunca antes
+del siguiente anexado. Cuando los registros reemplazados o eliminados
+superan a los vigentes, el archivo se compacta reescribiendo solo las
+claves vigentes en un temporal que sustituye al original con ``os.replace``.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# Importar configuración y excepciones
+try:
+    from ..data.config import PathConfig, PerformanceConfig
+    from ..utils.exceptions import *
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.config import PathConfig, PerformanceConfig
+    from utils.exceptions import *
+
+PublicKey = Tuple[int, int]
+PrivateKey = Tuple[int, int]
+KeyPair = Tuple[PublicKey, PrivateKey]
+
+# ===== FORMATO DEL ARCHIVO =====
+FILE_MAGIC = b"CUNSKS01"
+RECORD_TAG = b"KREC"
+RECORD_HEADER = struct.Struct(">4sHI")
+BODY_HEADER = struct.Struct(">HB")
+INT_HEADER = struct.Struct(">I")
+# Permisos del archivo del almacén (solo el propietario)
+FILE_MODE = 0o600
+# Bytes muertos mínimos antes de compactar automáticamente
+COMPACT_MIN_BYTES = 64 * 1024
+
+
+def encode_key_pair(public_key: PublicKey, private_key: PrivateKey, key_size: int = 0,
+                    primes: Optional[Tuple[int, int]] = None) -> bytes:
+    """
+    Serializar un par de claves RSA en formato binario compacto
+
+    Args:
+        public_key (PublicKey): Clave pública (e, n)
+        private_key (PrivateKey): Clave privada (d, n)
+        key_size (int): Tamaño nominal de la clave en bits
+        primes (Optional[Tuple[int, int]]): Factores (p, q) si se conocen
+
+    Returns:
+        bytes: Cuerpo del registro
+    """
+    e, n = public_key
+    d, n_private = private_key
+    if n != n_private:
+        raise InvalidKeyError("Las claves pública y privada no comparten el módulo", "rsa")
+
+    values = [e, n, d] + list(primes or ())
+    parts = [BODY_HEADER.pack(key_size or n.bit_length(), len(values))]
+    for value in values:
+        raw = value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')
+        parts.append(INT_HEADER.pack(len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def decode_key_pair(body: Union[bytes, memoryview]) -> Dict[str, object]:
+    """
+    Deserializar un cuerpo de registro
+
+    Args:
+        body (Union[bytes, memoryview]): Cuerpo generado por encode_key_pair
+
+    Returns:
+        Dict: Claves, tamaño y factores primos (si existen)
+    """
+    try:
+        key_size, count = BODY_HEADER.unpack_from(body, 0)
+        offset = BODY_HEADER.size
+        values = []
+        for _ in range(count):
+            (length,) = INT_HEADER.unpack_from(body, offset)
+            offset += INT_HEADER.size
+            values.append(int.from_bytes(body[offset:offset + length], 'big'))
+            offset += length
+    except struct.error:
+        raise FileFormatError("Registro de clave corrupto", expected_format="rsa-key")
+
+    if count not in (3, 5) or offset != len(body):
+        raise FileFormatError("Registro de clave corrupto", expected_format="rsa-key")
+
+    e, n, d = values[:3]
+    return {
+        "key_size": key_size,
+        "public_key": (e, n),
+        "private_key": (d, n),
+        "primes": tuple(values[3:]) or None
+    }
+
+
+# ===== ALMACÉN DE CLAVES =====
+class KeyStore:
+    """
+    Almacén persistente de pares de claves RSA con caché LRU
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, cache_size: Optional[int] = None):
+        """
+        Inicializar almacén de claves
+
+        El archivo no se abre hasta la primera operación.
+
+        Args:
+            path (Optional[Union[str, Path]]): Archivo del almacén
+            cache_size (Optional[int]): Capacidad de la caché LRU
+        """
+        self.path = Path(path) if path is not None else PathConfig.KEYSTORE_FILE
+        self.cache_size = PerformanceConfig.CACHE_SIZE if cache_size is None else cache_size
+        self._cache: "OrderedDict[str, Dict[str, object]]" = OrderedDict()
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        # Fin del último registro completo (lo que sigue es una cola incompleta)
+        self._end = 0
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.RLock()
+
+    # ----- Gestión del archivo -----
+    def _ensure_map(self) -> Optional[mmap.mmap]:
+        """Mapear el archivo en memoria (solo lectura) si aún no lo está"""
+        if self._map is None and self.path.exists() and self.path.stat().st_size > 0:
+            self._file = open(self.path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _build_index(self) -> None:
+        """
+        Construir el índice recorriendo solo las cabeceras de los registros
+
+        Un registro final cortado (cabecera o cuerpo incompletos) no entra
+        en el índice; ``self._end`` marca dónde termina el último completo.
+        """
+        self._index = {}
+        self._end = 0
+        if self._ensure_map() is None:
+            return
+
+        size = len(self._map)
+        head = self._map[:len(FILE_MAGIC)]
+        if head != FILE_MAGIC:
+            if size < len(FILE_MAGIC) and FILE_MAGIC.startswith(head):
+                # Caída mientras se escribía la cabecera del archivo
+                return
+            self.close()
+            raise FileFormatError("El archivo no es un almacén de claves válido",
+                                  str(self.path), "CUNSKS01")
+
+        offset = len(FILE_MAGIC)
+        while offset + RECORD_HEADER.size <= size:
+            tag, name_len, body_len = RECORD_HEADER.unpack_from(self._map, offset)
+            if tag != RECORD_TAG:
+                raise FileFormatError("Registro de clave corrupto", str(self.path), "KREC")
+            name_start = offset + RECORD_HEADER.size
+            body_start = name_start + name_len
+            if body_start + body_len > size:
+                break
+            name = self._map[name_start:body_start].decode('utf-8')
+            if body_len:
+                self._index[name] = (body_start, body_len)
+            else:
+                self._index.pop(name, None)
+            offset = body_start + body_len
+        self._end = offset
+
+    def _ensure_index(self) -> Dict[str, Tuple[int, int]]:
+        """Obtener el índice, abriendo el archivo si es necesario"""
+        if self._index is None:
+            self._build_index()
+        return self._index
+
+    def _append(self, name: str, body: bytes) -> None:
+        """Anexar un registro, actualizar el índice y compactar si hace falta"""
+        name_bytes = name.encode('utf-8')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Cerrar el mapeo: se volverá a abrir con el nuevo tamaño
+        index = self._ensure_index()
+        self._unmap()
+
+        # Descartar una cola incompleta antes de anexar detrás de ella
+        if self.path.exists() and self.path.stat().st_size > self._end:
+            os.truncate(self.path, self._end)
+
+        fd = os.open(self.path, os.O_CREAT | os.O_APPEND | os.O_WRONLY, FILE_MODE)
+        with os.fdopen(fd, 'ab') as f:
+            if self._end == 0:
+                f.write(FILE_MAGIC)
+            f.write(RECORD_HEADER.pack(RECORD_TAG, len(name_bytes), len(body)))
+            f.write(name_bytes)
+            f.write(body)
+            self._end = f.tell()
+
+        if body:
+            index[name] = (self._end - len(body), len(body))
+        else:
+            index.pop(name, None)
+
+        dead = self._end - self._live_bytes()
+        if dead > COMPACT_MIN_BYTES and dead > self._end - dead:
+            self.compact()
+
+    def _live_bytes(self) -> int:
+        """Bytes que ocuparía el archivo con solo los registros vigentes"""
+        return len(FILE_MAGIC) + sum(
+            RECORD_HEADER.size + len(name.encode('utf-8')) + length
+            for name, (_, length) in self._index.items()
+        )
+
+    def compact(self) -> None:
+        """
+        Reescribir el archivo con solo los registros vigentes
+
+        Los registros se copian a un temporal del mismo directorio (creado
+        con permisos 0o600) que sustituye al original con ``os.replace``; una
+        caída durante la compactación deja intacto el archivo anterior.
+        """
+        with self._lock:
+            index = self._ensure_index()
+            source = self._ensure_map()
+            if source is None:
+                return
+
+            fd, temp_path = tempfile.mkstemp(prefix=".keystore-", dir=self.path.parent)
+            new_index = {}
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(FILE_MAGIC)
+                    for name, (start, length) in index.items():
+                        name_bytes = name.encode('utf-8')
+                        f.write(RECORD_HEADER.pack(RECORD_TAG, len(name_bytes), length))
+                        f.write(name_bytes)
+                        new_index[name] = (f.tell(), length)
+                        f.write(source[start:start + length])
+                    f.flush()
+                    os.fsync(f.fileno())
+                    end = f.tell()
+                self._unmap()
+                os.replace(temp_path, self.path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            self._index = new_index
+            self._end = end
+
+    def _unmap(self) -> None:
+        """Liberar el mapeo en memoria conservando el índice"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        """Cerrar el archivo (el índice se reconstruye en el próximo acceso)"""
+        with self._lock:
+            self._unmap()
+            self._index = None
+
+    # ----- Caché LRU -----
+    def _cache_get(self, name: str) -> Optional[Dict[str, object]]:
+        entry = self._cache.get(name)
+        if entry is not None:
+            self._cache.move_to_end(name)
+        return entry
+
+    def _cache_put(self, name: str, entry: Dict[str, object]) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[name] = entry
+        self._cache.move_to_end(name)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ----- API pública -----
+    def save(self, name: str, public_key: PublicKey, private_key: PrivateKey,
+             key_size: int = 0, primes: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Guardar un par de claves con nombre (reemplaza una clave existente)
+
+        Args:
+            name (str): Nombre de la clave
+            public_key (PublicKey): Clave pública (e, n)
+            private_key (PrivateKey): Clave privada (d, n)
+            key_size (int): Tamaño nominal en bits
+            primes (Optional[Tuple[int, int]]): Factores (p, q) si se conocen
+        """
+        if not name:
+            raise InvalidInputError("El nombre de la clave no puede estar vacío")
+
+        body = encode_key_pair(public_key, private_key, key_size, primes)
+        with self._lock:
+            self._append(name, body)
+            self._cache_put(name, decode_key_pair(body))
+
+    def load_entry(self, name: str) -> Dict[str, object]:
+        """
+        Cargar la entrada completa de una clave (claves, tamaño y factores)
+
+        Args:
+            name (str): Nombre de la clave
+
+        Returns:
+            Dict: Entrada decodificada
+
+        Raises:
+            RSAError: Si la clave no existe
+        """
+        with self._lock:
+            entry = self._cache_get(name)
+            if entry is not None:
+                return entry
+
+            location = self._ensure_index().get(name)
+            if location is None:
+                raise RSAError(f"Clave no encontrada: {name}", "load")
+
+            start, length = location
+            entry = decode_key_pair(self._ensure_map()[start:start + length])
+            self._cache_put(name, entry)
+            return entry
+
+    def load(self, name: str) -> KeyPair:
+        """
+        Cargar un par de claves con nombre
+
+        Args:
+            name (str): Nombre de la clave
+
+        Returns:
+            KeyPair: (clave_pública, clave_privada)
+        """
+        entry = self.load_entry(name)
+        return entry["public_key"], entry["private_key"]
+
+    def delete(self, name: str) -> None:
+        """
+        Eliminar una clave del almacén
+
+        Args:
+            name (str): Nombre de la clave
+        """
+        with self._lock:
+            if name not in self._ensure_index():
+                raise RSAError(f"Clave no encontrada: {name}", "delete")
+            self._append(name, b"")
+            self._cache.pop(name, None)
+
+    def names(self) -> List[str]:
+        """Listar los nombres de las claves almacenadas"""
+        with self._lock:
+            return sorted(self._ensure_index())
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._cache or name in self._ensure_index()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ensure_index())
+
+
+_default_keystore: Optional[KeyStore] = None
+
+
+def get_default_keystore() -> KeyStore:
+    """
+    Obtener el almacén de claves compartido de la aplicación
+
+    Returns:
+        KeyStore: Almacén ubicado en PathConfig.KEYSTORE_FILE
+    """
+    global _default_keystore
+    if _default_keystore is None:
+        _default_keystore = KeyStore()
+    return _default_keystore
+
+# ===== EXPORTAR CLASES =====
+__all__ = [
+    'KeyStore',
+    'encode_key_pair',
+    'decode_key_pair',
+    'get_default_keystore'
+]
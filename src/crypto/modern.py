@@ -13,12 +13,17 @@ Fecha: 06 de julio, 2025
 Versión: 1.0.0
 """
 
-import random
 import math
-from typing import Optional, Tuple, Dict, List, Any
+import os
+import tempfile
+import time
+from typing import Optional, Tuple, Dict, List, Any, Sequence, Union, BinaryIO, NamedTuple
 import hashlib
+import hmac
 import struct
-from Crypto.Cipher import DES
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from Crypto.Cipher import DES, DES3
 from Crypto.Util.Padding import pad, unpad
 import secrets
 
@@ -26,6 +31,11 @@ import secrets
 try:
     from ..utils.constants import *
     from ..utils.exceptions import *
+    from . import number_theory
+    from . import primality
+    from . import hashing
+    from .keystore import KeyStore, get_default_keystore
+    from .random_source import RandomSource, get_default_random
 except ImportError:
     # Importación absoluta para cuando se ejecuta directamente
     import sys
@@ -33,6 +43,20 @@ except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     from utils.constants import *
     from utils.exceptions import *
+    from crypto import number_theory
+    from crypto import primality
+    from crypto import hashing
+    from crypto.keystore import KeyStore, get_default_keystore
+    from crypto.random_source import RandomSource, get_default_random
+
+BytesLike = hashing.BytesLike
+
+
+def _byte_view(data: BytesLike) -> memoryview:
+    """Vista de bytes sin copia de cualquier objeto con protocolo de buffer"""
+    if isinstance(data, str):
+        raise InvalidInputError("Los textos deben codificarse a bytes antes de procesarse")
+    return memoryview(data).cast('B')
 
 # ===== ALGORITMO RSA =====
 class RSACipher:
@@ -43,58 +67,41 @@ class RSACipher:
     (pública y privada) para cifrar y descifrar datos.
     """
     
-    def __init__(self, key_size: int = RSA_DEFAULT_KEY_SIZE):
+    def __init__(self, key_size: int = RSA_DEFAULT_KEY_SIZE, rng: Optional[RandomSource] = None,
+                 primality_test: str = "miller-rabin"):
         """
         Inicializar cifrado RSA
         
         Args:
             key_size (int): Tamaño de la clave en bits
+            rng (Optional[RandomSource]): Fuente de aleatoriedad (por defecto la del sistema)
+            primality_test (str): Test de primalidad ("miller-rabin" o "baillie-psw")
         """
+        if primality_test not in primality.PRIMALITY_TESTS:
+            raise InvalidInputError(f"Test de primalidad no soportado: {primality_test}")
+        
         self.key_size = key_size
+        self.rng = rng if rng is not None else get_default_random()
+        self.primality_test = primality_test
         self.public_key = None
         self.private_key = None
+        self.primes = None
         
-    def is_prime(self, n: int, k: int = 10) -> bool:
+    def is_prime(self, n: int, k: Optional[int] = None) -> bool:
         """
-        Test de primalidad de Miller-Rabin
+        Test de primalidad (Miller-Rabin o Baillie-PSW)
+        
+        Los números pequeños se resuelven por división entre SMALL_PRIMES y
+        Miller-Rabin con bases fijas; el resto con el test configurado.
         
         Args:
             n (int): Número a verificar
-            k (int): Número de rondas del test
+            k (Optional[int]): Rondas de Miller-Rabin (None = según el tamaño de n)
             
         Returns:
             bool: True si es probablemente primo, False si es compuesto
         """
-        if n < 2:
-            return False
-        if n == 2 or n == 3:
-            return True
-        if n % 2 == 0:
-            return False
-        
-        # Escribir n-1 como d * 2^r
-        r = 0
-        d = n - 1
-        while d % 2 == 0:
-            r += 1
-            d //= 2
-        
-        # Test de Miller-Rabin
-        for _ in range(k):
-            a = random.randrange(2, n - 1)
-            x = pow(a, d, n)
-            
-            if x == 1 or x == n - 1:
-                continue
-            
-            for _ in range(r - 1):
-                x = pow(x, 2, n)
-                if x == n - 1:
-                    break
-            else:
-                return False
-        
-        return True
+        return primality.is_probable_prime(n, k, self.rng, self.primality_test)
     
     def generate_prime(self, bits: int) -> int:
         """
@@ -108,7 +115,7 @@ class RSACipher:
         """
         while True:
             # Generar número aleatorio impar
-            n = random.getrandbits(bits)
+            n = self.rng.getrandbits(bits)
             n |= (1 << bits - 1) | 1  # Asegurar que sea impar y del tamaño correcto
             
             # Verificar si es primo
@@ -126,9 +133,7 @@ class RSACipher:
         Returns:
             int: MCD de a y b
         """
-        while b:
-            a, b = b, a % b
-        return a
+        return number_theory.gcd(a, b)
     
     def extended_gcd(self, a: int, b: int) -> Tuple[int, int, int]:
         """
@@ -141,14 +146,7 @@ class RSACipher:
         Returns:
             Tuple[int, int, int]: (gcd, x, y) donde ax + by = gcd
         """
-        if a == 0:
-            return b, 0, 1
-        
-        gcd, x1, y1 = self.extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        
-        return gcd, x, y
+        return number_theory.extended_gcd(a, b)
     
     def mod_inverse(self, a: int, m: int) -> int:
         """
@@ -164,10 +162,7 @@ class RSACipher:
         Raises:
             ValueError: Si el inverso no existe
         """
-        gcd, x, _ = self.extended_gcd(a, m)
-        if gcd != 1:
-            raise ValueError("El inverso modular no existe")
-        return (x % m + m) % m
+        return number_theory.mod_inverse(a, m)
     
     def generate_keys(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """
@@ -185,31 +180,130 @@ class RSACipher:
         while p == q:
             q = self.generate_prime(bits)
         
-        # Calcular n y φ(n)
+        # Calcular n y λ(n) = mcm(p - 1, q - 1)
         n = p * q
-        phi_n = (p - 1) * (q - 1)
+        lambda_n = number_theory.carmichael_lambda(p, q)
         
         # Elegir e (exponente público)
         e = 65537  # Valor comúnmente usado
-        while self.gcd(e, phi_n) != 1:
+        while self.gcd(e, lambda_n) != 1:
             e += 2
         
         # Calcular d (exponente privado)
-        d = self.mod_inverse(e, phi_n)
+        d = self.mod_inverse(e, lambda_n)
         
         # Almacenar claves
         self.public_key = (e, n)
         self.private_key = (d, n)
+        self.primes = (p, q)
+        
+        return self.public_key, self.private_key
+    
+    def save_keys(self, name: str, keystore: Optional[KeyStore] = None) -> None:
+        """
+        Guardar el par de claves actual en el almacén de claves
+        
+        Args:
+            name (str): Nombre del par de claves
+            keystore (Optional[KeyStore]): Almacén a usar (por defecto el de la aplicación)
+        """
+        if not self.public_key or not self.private_key:
+            raise KeyGenerationError("No hay claves generadas para guardar")
+        
+        if keystore is None:
+            keystore = get_default_keystore()
+        keystore.save(name, self.public_key, self.private_key, self.key_size, self.primes)
+    
+    def load_keys(self, name: str, keystore: Optional[KeyStore] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Cargar un par de claves con nombre desde el almacén en lugar de generarlo
+        
+        Args:
+            name (str): Nombre del par de claves
+            keystore (Optional[KeyStore]): Almacén a usar (por defecto el de la aplicación)
+            
+        Returns:
+            Tuple: ((e, n), (d, n)) - (clave_pública, clave_privada)
+        """
+        if keystore is None:
+            keystore = get_default_keystore()
+        entry = keystore.load_entry(name)
+        
+        self.key_size = entry["key_size"]
+        self.public_key = entry["public_key"]
+        self.private_key = entry["private_key"]
+        self.primes = entry["primes"]
         
         return self.public_key, self.private_key
     
+    def prepare_public_key(self, public_key: Optional[Tuple[int, int]] = None) -> 'PreparedPublicKey':
+        """
+        Obtener la versión preparada (cacheada) de una clave pública
+        
+        Args:
+            public_key (Optional[Tuple[int, int]]): Clave pública (e, n)
+            
+        Returns:
+            PreparedPublicKey: Clave con su precomputación por módulo
+        """
+        if isinstance(public_key, PreparedPublicKey):
+            return public_key
+        if public_key:
+            return prepare_public_key(tuple(public_key))
+        if self.public_key:
+            return prepare_public_key(self.public_key)
+        raise KeyGenerationError("No hay clave pública disponible")
+    
+    def _private_key(self, private_key: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        """Clave privada proporcionada o la generada"""
+        if private_key:
+            return private_key
+        if self.private_key:
+            return self.private_key
+        raise KeyGenerationError("No hay clave privada disponible")
+    
+    def encrypt_bytes(self, data: BytesLike, public_key: Optional[Tuple[int, int]] = None) -> bytes:
+        """
+        Cifrar datos binarios usando RSA
+        
+        Args:
+            data (BytesLike): Datos a cifrar (bytes, bytearray o memoryview)
+            public_key (Optional[Tuple[int, int]]): Clave pública (e, n) o PreparedPublicKey
+            
+        Returns:
+            bytes: Bloques cifrados de byte_length bytes cada uno
+        """
+        key = self.prepare_public_key(public_key)
+        return key.encrypt_bytes(data)
+    
+    def decrypt_bytes(self, ciphertext: BytesLike, private_key: Optional[Tuple[int, int]] = None) -> bytes:
+        """
+        Descifrar datos producidos por encrypt_bytes
+        
+        Args:
+            ciphertext (BytesLike): Bloques cifrados de byte_length bytes
+            private_key (Optional[Tuple[int, int]]): Clave privada (d, n)
+            
+        Returns:
+            bytes: Datos originales
+        """
+        d, n = self._private_key(private_key)
+        length = (n.bit_length() + 7) // 8
+        view = _byte_view(ciphertext)
+        if not len(view) or len(view) % length:
+            raise DecryptionError(f"El texto cifrado debe ser un múltiplo no vacío de {length} bytes", "rsa")
+        
+        from_bytes = int.from_bytes
+        return self._decrypt_blocks((from_bytes(view[i:i + length], 'big') for i in range(0, len(view), length)),
+                                    (d, n))
+    
     def encrypt(self, message: str, public_key: Optional[Tuple[int, int]] = None) -> List[int]:
         """
         Cifrar mensaje usando RSA
         
         Args:
             message (str): Mensaje a cifrar
-            public_key (Optional[Tuple[int, int]]): Clave pública (e, n)
+            public_key (Optional[Tuple[int, int]]): Clave pública (e, n) o PreparedPublicKey
             
         Returns:
             List[int]: Lista de bloques cifrados
@@ -218,35 +312,9 @@ class RSACipher:
             raise InvalidInputError("El mensaje no puede estar vacío")
         
         # Usar clave pública proporcionada o la generada
-        if public_key:
-            e, n = public_key
-        elif self.public_key:
-            e, n = self.public_key
-        else:
-            raise KeyGenerationError("No hay clave pública disponible")
+        key = self.prepare_public_key(public_key)
         
-        # Convertir mensaje a bytes
-        message_bytes = message.encode('utf-8')
-        
-        # Calcular tamaño máximo de bloque
-        block_size = (n.bit_length() - 1) // 8
-        
-        # Cifrar en bloques
-        encrypted_blocks = []
-        for i in range(0, len(message_bytes), block_size):
-            block = message_bytes[i:i + block_size]
-            # Convertir bytes a entero
-            block_int = int.from_bytes(block, 'big')
-            
-            # Verificar que el bloque sea menor que n
-            if block_int >= n:
-                raise EncryptionError("El bloque es demasiado grande para la clave")
-            
-            # Cifrar bloque
-            encrypted_block = pow(block_int, e, n)
-            encrypted_blocks.append(encrypted_block)
-        
-        return encrypted_blocks
+        return key.encrypt_blocks(message.encode('utf-8'))
     
     def decrypt(self, encrypted_blocks: List[int], private_key: Optional[Tuple[int, int]] = None) -> str:
         """
@@ -262,29 +330,40 @@ class RSACipher:
         if not encrypted_blocks:
             raise InvalidInputError("No hay bloques para descifrar")
         
-        # Usar clave privada proporcionada o la generada
-        if private_key:
-            d, n = private_key
-        elif self.private_key:
-            d, n = self.private_key
-        else:
-            raise KeyGenerationError("No hay clave privada disponible")
+        plaintext = self._decrypt_blocks(encrypted_blocks, self._private_key(private_key))
+        try:
+            return plaintext.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise DecryptionError(f"El mensaje descifrado no es texto UTF-8: {str(e)}", "rsa")
+    
+    @staticmethod
+    def _decrypt_blocks(encrypted_blocks, private_key: Tuple[int, int]) -> bytes:
+        """
+        Descifrar bloques con el formato de PreparedPublicKey.encrypt_blocks
         
-        # Calcular tamaño máximo de bloque
+        Los bloques completos ocupan block_size bytes; el último lleva un
+        byte 0x01 delante del resto, para conservar sus ceros iniciales.
+        """
+        d, n = private_key
         block_size = (n.bit_length() - 1) // 8
-        
-        # Descifrar bloques
-        decrypted_bytes = bytearray()
-        for encrypted_block in encrypted_blocks:
-            # Descifrar bloque
-            decrypted_block = pow(encrypted_block, d, n)
-            
-            # Convertir a bytes
-            block_bytes = decrypted_block.to_bytes((decrypted_block.bit_length() + 7) // 8, 'big')
-            decrypted_bytes.extend(block_bytes)
-        
-        # Convertir a string
-        return decrypted_bytes.decode('utf-8')
+        limit = 1 << (8 * block_size)
+        
+        blocks = [pow(block, d, n) for block in encrypted_blocks]
+        if not blocks or any(block >= limit for block in blocks[:-1]):
+            raise DecryptionError("Bloques RSA inválidos para esta clave", "rsa")
+        
+        last = blocks.pop()
+        tail_length = (last.bit_length() - 1) // 8
+        if last < 1 or tail_length >= block_size or last >> (8 * tail_length) != 1:
+            raise DecryptionError("Bloques RSA inválidos para esta clave", "rsa")
+        
+        plaintext = bytearray(block_size * len(blocks) + tail_length)
+        offset = 0
+        for block in blocks:
+            plaintext[offset:offset + block_size] = block.to_bytes(block_size, 'big')
+            offset += block_size
+        plaintext[offset:] = (last - (1 << (8 * tail_length))).to_bytes(tail_length, 'big')
+        return bytes(plaintext)
     
     def validate_key_size(self, key_size: int) -> bool:
         """
@@ -327,48 +406,284 @@ class RSACipher:
             "d_hex": hex(d)
         }
 
+# ===== CODIFICACIÓN DE FIRMAS =====
+SHA256_DIGEST_SIZE = 32  # bytes
+# DigestInfo DER de SHA-256 que precede al hash (RFC 8017, sección 9.2)
+SHA256_DIGEST_INFO = bytes.fromhex("3031300d060960864801650304020105000420")
+# Relleno mínimo de 0xFF en EMSA-PKCS1-v1_5
+PKCS1_MIN_PADDING = 8
+
+
+@lru_cache(maxsize=PERFORMANCE_LIMITS['cache_size'])
+def _pkcs1_prefix(size: int) -> bytes:
+    """0x00 0x01 || 0xFF... || 0x00 || DigestInfo para un bloque de `size` bytes"""
+    padding = size - 3 - len(SHA256_DIGEST_INFO) - SHA256_DIGEST_SIZE
+    if padding < PKCS1_MIN_PADDING:
+        raise SignatureError("La clave es demasiado pequeña para firmar un hash SHA-256")
+    return b"\x00\x01" + b"\xff" * padding + b"\x00" + SHA256_DIGEST_INFO
+
+
+def pkcs1_encode(digest: BytesLike, size: int) -> bytes:
+    """
+    Codificar un hash SHA-256 en un bloque de firma EMSA-PKCS1-v1_5
+    
+    Args:
+        digest (BytesLike): Hash SHA-256 de 32 bytes
+        size (int): Longitud en bytes de n
+        
+    Returns:
+        bytes: Bloque de `size` bytes a exponenciar con la clave privada
+    """
+    digest = _byte_view(digest)
+    if len(digest) != SHA256_DIGEST_SIZE:
+        raise InvalidInputError(f"El hash debe tener {SHA256_DIGEST_SIZE} bytes")
+    return _pkcs1_prefix(size) + digest
+
+# ===== CLAVE PÚBLICA PREPARADA =====
+class PreparedPublicKey:
+    """
+    Clave pública RSA con su precomputación por módulo
+    
+    Cifrar y verificar repetidamente con la misma clave vuelve a calcular en
+    cada llamada el tamaño de bloque, la longitud en bytes de n y la
+    validación de la clave. Esta clase hace ese trabajo una sola vez.
+    
+    La exponenciación se delega en pow(), que en CPython ya aplica ventanas
+    deslizantes en C; una cadena explícita de cuadrados para e = 2^k + 1 en
+    Python resultó igual o más lenta, por lo que no se usa.
+    """
+    
+    def __init__(self, public_key: Tuple[int, int]):
+        """
+        Preparar clave pública
+        
+        Args:
+            public_key (Tuple[int, int]): Clave pública (e, n)
+        """
+        e, n = public_key
+        if n < 3 or not 1 < e < n:
+            raise InvalidKeyError("Clave pública RSA inválida", "rsa")
+        
+        self.e = e
+        self.n = n
+        self.bit_length = n.bit_length()
+        self.byte_length = (self.bit_length + 7) // 8
+        self.block_size = (self.bit_length - 1) // 8  # Bytes de mensaje por bloque
+    
+    @property
+    def key(self) -> Tuple[int, int]:
+        """Clave pública como tupla (e, n)"""
+        return self.e, self.n
+    
+    def apply(self, value: int) -> int:
+        """
+        Aplicar la operación pública value^e mod n
+        
+        Args:
+            value (int): Entero en el rango [0, n)
+            
+        Returns:
+            int: Resultado de la exponenciación
+        """
+        return pow(value, self.e, self.n)
+    
+    def encrypt_blocks(self, data: BytesLike) -> List[int]:
+        """
+        Cifrar bytes en bloques
+        
+        Los bloques completos tienen block_size bytes; el resto final se
+        cifra precedido de un byte 0x01, de modo que el descifrado conserve
+        la longitud exacta aunque los datos empiecen con ceros.
+        
+        Args:
+            data (BytesLike): Datos a cifrar
+            
+        Returns:
+            List[int]: Lista de bloques cifrados
+        """
+        e, n, block_size = self.e, self.n, self.block_size
+        from_bytes = int.from_bytes
+        view = _byte_view(data)
+        full = len(view) - len(view) % block_size
+        
+        encrypted_blocks = []
+        for i in range(0, full, block_size):
+            # Un bloque de block_size bytes siempre es menor que n
+            block_int = from_bytes(view[i:i + block_size], 'big')
+            encrypted_blocks.append(pow(block_int, e, n))
+        
+        tail = view[full:]
+        encrypted_blocks.append(pow((1 << (8 * len(tail))) | from_bytes(tail, 'big'), e, n))
+        return encrypted_blocks
+    
+    def encrypt_bytes(self, data: BytesLike) -> bytes:
+        """
+        Cifrar bytes y serializar los bloques
+        
+        Args:
+            data (BytesLike): Datos a cifrar
+            
+        Returns:
+            bytes: Bloques cifrados de byte_length bytes cada uno
+        """
+        length = self.byte_length
+        return b"".join(block.to_bytes(length, 'big') for block in self.encrypt_blocks(data))
+    
+    def verify_digest(self, digest: BytesLike, signature: BytesLike) -> bool:
+        """
+        Verificar una firma sobre un hash SHA-256 ya calculado
+        
+        Se recupera el bloque firmado y se compara en tiempo constante,
+        byte a byte, con la codificación PKCS#1 v1.5 del hash.
+        
+        Args:
+            digest (BytesLike): Hash SHA-256 de 32 bytes
+            signature (BytesLike): Firma de byte_length bytes
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        signature = _byte_view(signature)
+        if len(signature) != self.byte_length:
+            return False
+        value = int.from_bytes(signature, 'big')
+        if not 0 < value < self.n:
+            return False
+        recovered = pow(value, self.e, self.n).to_bytes(self.byte_length, 'big')
+        return hmac.compare_digest(recovered, pkcs1_encode(digest, self.byte_length))
+    
+    def verify_bytes(self, message: BytesLike, signature: BytesLike) -> bool:
+        """
+        Verificar la firma SHA-256 binaria de un mensaje binario
+        
+        Args:
+            message (BytesLike): Mensaje original
+            signature (BytesLike): Firma de byte_length bytes
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        return self.verify_digest(hashlib.sha256(_byte_view(message)).digest(), signature)
+    
+    def verify(self, message: Union[str, bytes], signature_hex: str) -> bool:
+        """
+        Verificar la firma SHA-256 de un mensaje
+        
+        Args:
+            message (Union[str, bytes]): Mensaje original
+            signature_hex (str): Firma en hexadecimal
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        return self.verify_batch([message], [signature_hex])[0]
+    
+    def verify_batch(self, messages: Sequence[Union[str, bytes]], signatures: Sequence[str]) -> List[bool]:
+        """
+        Verificar muchas firmas SHA-256 con esta clave
+        
+        La firma se lee de hexadecimal a bytes una vez; el bloque
+        recuperado se compara en bytes con la codificación PKCS#1 v1.5 del
+        hash, sin pasar nunca de entero a cadena.
+        
+        Args:
+            messages (Sequence[Union[str, bytes]]): Mensajes originales
+            signatures (Sequence[str]): Firmas en hexadecimal
+            
+        Returns:
+            List[bool]: Resultado de la verificación de cada firma
+        """
+        if len(messages) != len(signatures):
+            raise InvalidInputError("Debe haber una firma por mensaje")
+        
+        e, n, size = self.e, self.n, self.byte_length
+        prefix = _pkcs1_prefix(size)
+        sha256 = hashlib.sha256
+        from_bytes = int.from_bytes
+        compare = hmac.compare_digest
+        
+        results = []
+        for message, signature_hex in zip(messages, signatures):
+            try:
+                if isinstance(message, str):
+                    message = message.encode('utf-8')
+                signature = bytes.fromhex(signature_hex)
+            except (AttributeError, TypeError, ValueError):
+                results.append(False)
+                continue
+            
+            value = from_bytes(signature, 'big')
+            if not message or len(signature) != size or not 0 < value < n:
+                results.append(False)
+                continue
+            
+            results.append(compare(pow(value, e, n).to_bytes(size, 'big'), prefix + sha256(message).digest()))
+        
+        return results
+
+
+@lru_cache(maxsize=PERFORMANCE_LIMITS['cache_size'])
+def prepare_public_key(public_key: Tuple[int, int]) -> PreparedPublicKey:
+    """
+    Obtener una clave pública preparada, reutilizando la de llamadas previas
+    
+    Args:
+        public_key (Tuple[int, int]): Clave pública (e, n)
+        
+    Returns:
+        PreparedPublicKey: Clave preparada
+    """
+    return PreparedPublicKey(public_key)
+
 # ===== FUNCIONES HASH PERSONALIZADAS =====
 class CustomHash:
     """
     Implementación de funciones hash personalizadas
     """
     
-    def __init__(self):
-        """Inicializar generador de hash"""
-        pass
+    # Nombres cortos históricos de verify_integrity
+    ALIASES = {"64": "Custom64", "128": "Custom128", "256": "Custom256"}
     
-    def hash_64(self, data: str) -> str:
+    def __init__(self, cache: Optional[hashing.DigestCache] = None):
         """
-        Función hash personalizada de 64 bits
+        Inicializar generador de hash
+        
+        Args:
+            cache (Optional[DigestCache]): Caché de resultados (por defecto la compartida)
+        """
+        self.cache = cache if cache is not None else hashing.get_default_digest_cache()
+    
+    def _custom_digest(self, algorithm: str, data: str) -> str:
+        """
+        Calcular un hash personalizado usando la caché de resultados
         
         Args:
+            algorithm (str): "Custom64", "Custom128" o "Custom256"
             data (str): Datos a hashear
             
         Returns:
-            str: Hash de 64 bits en hexadecimal
+            str: Hash en hexadecimal
         """
         if not data:
             raise InvalidInputError("Los datos no pueden estar vacíos")
         
-        # Convertir a bytes
         data_bytes = data.encode('utf-8')
+        compute = lambda: hashing.new(algorithm, data_bytes).hexdigest()
+        if not self.cache.enabled:
+            return compute()
+        return self.cache.get_or_compute(self.cache.text_key(algorithm, data_bytes), compute)
+    
+    def hash_64(self, data: str) -> str:
+        """
+        Función hash personalizada de 64 bits
         
-        # Inicializar valor hash
-        hash_val = 0x811c9dc5  # Valor inicial FNV
-        
-        # Procesar cada byte
-        for byte in data_bytes:
-            hash_val ^= byte
-            hash_val *= 0x01000193  # Multiplicador FNV
-            hash_val &= 0xFFFFFFFFFFFFFFFF  # Mantener 64 bits
-        
-        # Mezclar bits adicional
-        hash_val ^= hash_val >> 32
-        hash_val ^= hash_val >> 16
-        hash_val ^= hash_val >> 8
-        hash_val &= 0xFFFFFFFFFFFFFFFF
-        
-        return f"{hash_val:016x}"
+        Args:
+            data (str): Datos a hashear
+            
+        Returns:
+            str: Hash de 64 bits en hexadecimal
+        """
+        return self._custom_digest("Custom64", data)
     
     def hash_128(self, data: str) -> str:
         """
@@ -380,29 +695,8 @@ class CustomHash:
         Returns:
             str: Hash de 128 bits en hexadecimal
         """
-        if not data:
-            raise InvalidInputError("Los datos no pueden estar vacíos")
-        
-        # Usar dos funciones hash de 64 bits con semillas diferentes
-        data_bytes = data.encode('utf-8')
-        
-        # Primera mitad
-        hash1 = 0x811c9dc5
-        for i, byte in enumerate(data_bytes):
-            hash1 ^= byte
-            hash1 *= 0x01000193
-            hash1 ^= i  # Añadir posición como variación
-            hash1 &= 0xFFFFFFFFFFFFFFFF
-        
-        # Segunda mitad (procesamiento inverso)
-        hash2 = 0x811c9dc5
-        for i, byte in enumerate(reversed(data_bytes)):
-            hash2 ^= byte
-            hash2 *= 0x01000193
-            hash2 ^= (i * 3)  # Diferente factor
-            hash2 &= 0xFFFFFFFFFFFFFFFF
-        
-        return f"{hash1:016x}{hash2:016x}"
+        # Dos funciones hash de 64 bits: pasada directa e inversa
+        return self._custom_digest("Custom128", data)
     
     def hash_256(self, data: str) -> str:
         """
@@ -414,33 +708,31 @@ class CustomHash:
         Returns:
             str: Hash de 256 bits en hexadecimal
         """
-        if not data:
-            raise InvalidInputError("Los datos no pueden estar vacíos")
-        
-        # Usar cuatro funciones hash de 64 bits con diferentes semillas
-        data_bytes = data.encode('utf-8')
+        # Cuatro funciones hash de 64 bits con diferentes semillas
+        return self._custom_digest("Custom256", data)
+    
+    def hash_many(self, texts: Sequence[str], algorithm: str = "256") -> List[str]:
+        """
+        Calcular un hash personalizado de muchos textos a la vez
         
-        # Cuatro hashes con diferentes procesamiento
-        hashes = []
-        seeds = [0x811c9dc5, 0x9E3779B9, 0x85ebca6b, 0xc2b2ae35]
-        multipliers = [0x01000193, 0x40014141, 0x27d4eb2d, 0x165667b1]
+        Con NumPy los carriles y los textos se procesan en bloque
+        (ver ``hash_kernels``); el resultado es el mismo que llamar a
+        hash_64/hash_128/hash_256 con cada texto.
         
-        for seed, mult in zip(seeds, multipliers):
-            hash_val = seed
-            for i, byte in enumerate(data_bytes):
-                hash_val ^= byte
-                hash_val *= mult
-                hash_val ^= (i * seed) & 0xFF
-                hash_val &= 0xFFFFFFFFFFFFFFFF
-            
-            # Mezclar bits
-            hash_val ^= hash_val >> 32
-            hash_val ^= hash_val >> 16
-            hash_val &= 0xFFFFFFFFFFFFFFFF
+        Args:
+            texts (Sequence[str]): Textos a hashear
+            algorithm (str): "64", "128" o "256"
             
-            hashes.append(f"{hash_val:016x}")
+        Returns:
+            List[str]: Hashes en hexadecimal, en el mismo orden
+        """
+        if algorithm not in ("64", "128", "256"):
+            raise InvalidInputError(f"Algoritmo no soportado: {algorithm}")
+        if any(not text for text in texts):
+            raise InvalidInputError("Los datos no pueden estar vacíos")
         
-        return ''.join(hashes)
+        messages = [text.encode('utf-8') for text in texts]
+        return [digest.hex() for digest in hashing.hash_many(f"custom{algorithm}", messages)]
     
     def sha256_wrapper(self, data: str) -> str:
         """
@@ -455,7 +747,26 @@ class CustomHash:
         if not data:
             raise InvalidInputError("Los datos no pueden estar vacíos")
         
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+        return hashing.new_hash("SHA256", data.encode('utf-8')).hexdigest()
+    
+    def hash_text(self, data: str, algorithm: str = "SHA256") -> str:
+        """
+        Calcular el hash de un texto con cualquier algoritmo registrado
+        
+        Args:
+            data (str): Datos a hashear
+            algorithm (str): Nombre en hashing.HASH_REGISTRY (SHA512, BLAKE2b, Custom256...)
+            
+        Returns:
+            str: Hash en hexadecimal
+        """
+        entry = hashing.get_algorithm(self.ALIASES.get(algorithm, algorithm))
+        if not entry.native:
+            return self._custom_digest(entry.name, data)
+        
+        if not data:
+            raise InvalidInputError("Los datos no pueden estar vacíos")
+        return hashing.new_hash(entry.name, data.encode('utf-8')).hexdigest()
     
     def verify_integrity(self, data: str, expected_hash: str, algorithm: str = "256") -> bool:
         """
@@ -464,46 +775,613 @@ class CustomHash:
         Args:
             data (str): Datos originales
             expected_hash (str): Hash esperado
-            algorithm (str): Algoritmo hash a usar
+            algorithm (str): "64", "128", "256" o cualquier nombre del registro
             
         Returns:
             bool: True si coinciden los hashes
         """
-        if algorithm == "64":
-            calculated_hash = self.hash_64(data)
-        elif algorithm == "128":
-            calculated_hash = self.hash_128(data)
-        elif algorithm == "256":
-            calculated_hash = self.hash_256(data)
-        elif algorithm == "sha256":
-            calculated_hash = self.sha256_wrapper(data)
-        else:
-            raise InvalidInputError(f"Algoritmo no soportado: {algorithm}")
+        calculated_hash = self.hash_text(data, algorithm)
         
         return calculated_hash.lower() == expected_hash.lower()
 
 # ===== ALGORITMO DES =====
-class DESCipher:
+# Por debajo de este número de mensajes CBC se cifra mensaje a mensaje
+DES_BATCH_MIN_MESSAGES = 16
+# Tamaño de lectura para flujos y archivos (múltiplo del bloque DES)
+DES_STREAM_CHUNK_SIZE = 1024 * 1024
+# Segmento por hilo en ECB y en el descifrado CBC paralelos (múltiplo del bloque DES);
+# por debajo de dos segmentos se procesa en una sola llamada
+DES_PARALLEL_SEGMENT_SIZE = 256 * 1024
+# Modos con relleno PKCS#7; CTR y EAX cifran como flujo y conservan la longitud
+DES_PADDED_MODES = ('ECB', 'CBC')
+# En CTR el IV de 8 bytes es nonce (4 bytes) + contador inicial (4 bytes)
+DES_CTR_NONCE_SIZE = 4
+# Contextos DES en caché: cada uno conserva la clave en memoria, así que el límite es pequeño
+DES_CONTEXT_CACHE_SIZE = 8
+
+
+def _xor_bytes(left: bytes, right: bytes) -> bytes:
+    """XOR de dos secuencias de igual longitud en una sola operación"""
+    return (int.from_bytes(left, 'big') ^ int.from_bytes(right, 'big')).to_bytes(len(left), 'big')
+
+
+def _des_blocks(data: BytesLike) -> Tuple[memoryview, bytes]:
+    """
+    Separar un mensaje en sus bloques completos (vista, sin copia) y el
+    último bloque con el relleno PKCS#7 (siempre 8 bytes)
     """
-    Implementación del algoritmo DES (Data Encryption Standard)
+    view = _byte_view(data)
+    full = len(view) - len(view) % DES_BLOCK_SIZE
+    return view[:full], pad(view[full:].tobytes(), DES_BLOCK_SIZE)
+
+
+class DESContext:
     """
+    Cifrador DES o 3DES con la clave ya validada y expandida
     
-    def __init__(self):
-        """Inicializar cifrado DES"""
-        pass
+    Una clave de 8 bytes usa DES; una de 16 o 24 bytes, 3DES EDE
+    (cifrar-descifrar-cifrar con dos o tres subclaves DES). Los modos son
+    ECB y CBC con relleno PKCS#7, CTR (flujo, misma longitud que la
+    entrada) y EAX (CTR autenticado con una etiqueta de 8 bytes al final
+    del texto cifrado). GCM no existe para bloques de 64 bits.
     
-    def validate_key(self, key: str) -> bool:
+    ``DESCipher`` codificaba la clave y llamaba a ``DES.new()`` (expansión
+    de las 16 subclaves) en cada operación. El contexto lo hace una vez y
+    reutiliza un único cifrador ECB, que no guarda estado entre llamadas.
+    
+    En lote, ECB cifra todos los mensajes con una sola llamada. CBC es
+    secuencial dentro de cada mensaje pero independiente entre mensajes:
+    se cifra la columna j (el bloque j de todos los mensajes) con una
+    llamada ECB, tras combinarla con la columna anterior. El descifrado
+    CBC no tiene dependencia entre bloques y se hace en una llamada.
+    
+    Con ``workers`` > 1, el cifrado ECB y CTR y el descifrado ECB, CBC y
+    CTR de mensajes grandes se reparten en segmentos alineados a bloque
+    entre hilos (el núcleo de pycryptodome libera el GIL); en CBC cada
+    segmento usa como IV el último bloque cifrado del segmento anterior y
+    en CTR empieza con el contador desplazado. EAX es secuencial. Los segmentos se
+    escriben directamente en un único búfer de salida.
+    
+    Acepta cualquier objeto con protocolo de buffer (bytes, bytearray,
+    memoryview) sin copiarlo; los textos se codifican fuera (ver
+    ``src.gui.presentation``).
+    """
+    
+    def __init__(self, key: bytes, mode: str = DES_DEFAULT_MODE):
         """
-        Validar clave DES
+        Preparar contexto DES
         
         Args:
-            key (str): Clave a validar
-            
-        Returns:
-            bool: True si es válida
+            key (bytes): Clave de 8 bytes (DES) o de 16/24 bytes (3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
         """
-        # DES requiere clave de 8 bytes (64 bits)
-        return len(key) == 8
+        mode = mode.upper()
+        if mode not in DES_MODES:
+            raise InvalidInputError(f"Modo DES no soportado: {mode}")
+        if len(key) == DES_KEY_SIZE:
+            self.algorithm, self._module = 'DES', DES
+        elif len(key) in TRIPLE_DES_KEY_SIZES:
+            self.algorithm, self._module = '3DES', DES3
+        else:
+            raise InvalidKeyError("La clave DES debe tener 8 bytes (16 o 24 para 3DES)", "des")
+        
+        self.key = bytes(key)
+        self.mode = mode
+        try:
+            self._ecb = self._module.new(self.key, DES.MODE_ECB)
+        except ValueError as e:
+            # 3DES rechaza claves cuyas subclaves se reducen a DES simple
+            raise InvalidKeyError(f"Clave 3DES inválida: {str(e)}", "des")
+    
+    def _check_iv(self, iv: bytes) -> bytes:
+        if len(iv) != DES_BLOCK_SIZE:
+            raise InvalidInputError("El IV debe tener exactamente 8 bytes")
+        return bytes(iv)
+    
+    def _new_iv(self) -> bytes:
+        """IV aleatorio; en CTR, nonce aleatorio con el contador en cero"""
+        if self.mode == 'CTR':
+            return secrets.token_bytes(DES_CTR_NONCE_SIZE) + bytes(DES_BLOCK_SIZE - DES_CTR_NONCE_SIZE)
+        return secrets.token_bytes(DES_BLOCK_SIZE)
+    
+    def encrypt(self, plaintext: BytesLike, iv: Optional[bytes] = None,
+                workers: Optional[int] = 1) -> Tuple[Union[bytes, bytearray], Optional[bytes]]:
+        """
+        Cifrar un mensaje
+        
+        Args:
+            plaintext (BytesLike): Texto plano no vacío
+            iv (Optional[bytes]): IV de 8 bytes para CBC, CTR y EAX (aleatorio si no se indica)
+            workers (Optional[int]): Hilos para ECB y CTR (None = todos los núcleos)
+            
+        Returns:
+            Tuple[Union[bytes, bytearray], Optional[bytes]]: (texto_cifrado, iv); iv es None en ECB.
+            En paralelo el texto cifrado es el bytearray de salida, sin copia final.
+        """
+        view = _byte_view(plaintext)
+        if not len(view):
+            raise InvalidInputError("El texto no puede estar vacío")
+        
+        if self.mode != 'ECB' and iv is None:
+            iv = self._new_iv()
+        cipher = self._cipher(iv)
+        
+        if self.mode == 'EAX':
+            ciphertext, tag = cipher.encrypt_and_digest(view)
+            return ciphertext + tag, bytes(iv)
+        
+        if self.mode == 'CTR':
+            body, final = view, None
+        else:
+            body, final = _des_blocks(view)
+        
+        workers = self._workers(workers, len(body))
+        if self.mode == 'CBC' or workers == 1:
+            if final is None:
+                return cipher.encrypt(body), bytes(iv)
+            return self._encrypt_blocks(cipher, body, final), None if iv is None else bytes(iv)
+        
+        ciphertext = bytearray(len(body) + (0 if final is None else DES_BLOCK_SIZE))
+        output = memoryview(ciphertext)
+        self._run_segments(body, output, workers, decrypt=False, iv=iv)
+        if final is not None:
+            cipher.encrypt(final, output=output[len(body):])
+        return ciphertext, None if iv is None else bytes(iv)
+    
+    def decrypt(self, ciphertext: BytesLike, iv: Optional[bytes] = None,
+                workers: Optional[int] = 1) -> Union[bytes, bytearray]:
+        """
+        Descifrar un mensaje
+        
+        Args:
+            ciphertext (BytesLike): Texto cifrado
+            iv (Optional[bytes]): IV usado al cifrar (obligatorio salvo en ECB)
+            workers (Optional[int]): Hilos para ECB, CBC y CTR (None = todos los núcleos)
+            
+        Returns:
+            Union[bytes, bytearray]: Texto plano. En paralelo es el bytearray de
+            salida, recortado sin copia.
+        """
+        view = _byte_view(ciphertext)
+        if self.mode in DES_PADDED_MODES:
+            if not len(view) or len(view) % DES_BLOCK_SIZE:
+                raise DecryptionError("El texto cifrado debe ser un múltiplo no vacío de 8 bytes")
+        elif len(view) <= (DES_TAG_SIZE if self.mode == 'EAX' else 0):
+            raise DecryptionError("El texto cifrado está vacío o incompleto")
+        if self.mode != 'ECB' and iv is None:
+            raise InvalidInputError(f"Se necesita el IV en modo {self.mode}")
+        
+        cipher = self._cipher(iv)
+        if self.mode == 'EAX':
+            try:
+                return cipher.decrypt_and_verify(view[:-DES_TAG_SIZE], view[-DES_TAG_SIZE:])
+            except ValueError:
+                raise DecryptionError("Etiqueta de autenticación inválida: datos alterados o clave incorrecta")
+        
+        workers = self._workers(workers, len(view))
+        if workers == 1:
+            plaintext = cipher.decrypt(view)
+        else:
+            plaintext = bytearray(len(view))
+            with memoryview(plaintext) as output:
+                self._run_segments(view, output, workers, decrypt=True, iv=iv)
+        if self.mode == 'CTR':
+            return plaintext
+        
+        try:
+            length = len(view) - DES_BLOCK_SIZE + len(unpad(plaintext[-DES_BLOCK_SIZE:], DES_BLOCK_SIZE))
+        except ValueError as e:
+            raise DecryptionError(f"Error al descifrar: {str(e)}")
+        if workers == 1:
+            return plaintext[:length]
+        del plaintext[length:]
+        return plaintext
+    
+    @staticmethod
+    def _workers(workers: Optional[int], size: int) -> int:
+        """Hilos a usar para `size` bytes: uno si no hay al menos dos segmentos"""
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise InvalidInputError("El número de hilos debe ser positivo")
+        return min(workers, size // DES_PARALLEL_SEGMENT_SIZE) or 1
+    
+    def _run_segments(self, source: memoryview, output: memoryview, workers: int,
+                      decrypt: bool, iv: Optional[bytes] = None) -> None:
+        """Procesar `source` por segmentos alineados a bloque en un pool de hilos, escribiendo en `output`"""
+        
+        def run(start: int) -> None:
+            end = min(start + DES_PARALLEL_SEGMENT_SIZE, len(source))
+            if self.mode == 'CBC':
+                # El IV de cada segmento es el bloque cifrado que lo precede
+                cipher = self._cipher(iv if start == 0 else source[start - DES_BLOCK_SIZE:start])
+            elif self.mode == 'CTR':
+                cipher = self._cipher(iv, start // DES_BLOCK_SIZE)
+            else:
+                cipher = self._module.new(self.key, DES.MODE_ECB)
+            operation = cipher.decrypt if decrypt else cipher.encrypt
+            operation(source[start:end], output=output[start:end])
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, range(0, len(source), DES_PARALLEL_SEGMENT_SIZE)))
+    
+    def encrypt_many(self, plaintexts: Sequence[BytesLike],
+                     ivs: Optional[Sequence[bytes]] = None) -> List[Tuple[bytes, Optional[bytes]]]:
+        """
+        Cifrar muchos mensajes con la misma clave
+        
+        Args:
+            plaintexts (Sequence[BytesLike]): Textos planos no vacíos
+            ivs (Optional[Sequence[bytes]]): Un IV por mensaje salvo en ECB (aleatorios si no se indican)
+            
+        Returns:
+            List[Tuple[bytes, Optional[bytes]]]: (texto_cifrado, iv) por mensaje
+        """
+        if self.mode not in DES_PADDED_MODES:
+            # CTR y EAX no tienen columnas de bloques que agrupar: un mensaje por llamada
+            if ivs is not None and len(ivs) != len(plaintexts):
+                raise InvalidInputError("Se necesita un IV por mensaje")
+            return [self.encrypt(plaintext, None if ivs is None else ivs[index])
+                    for index, plaintext in enumerate(plaintexts)]
+        
+        messages = []
+        for plaintext in plaintexts:
+            view = _byte_view(plaintext)
+            if not len(view):
+                raise InvalidInputError("El texto no puede estar vacío")
+            messages.append(_des_blocks(view))
+        
+        if self.mode == 'ECB':
+            if ivs is not None:
+                raise InvalidInputError("El modo ECB no usa IV")
+            # join acepta las vistas: la única copia es el búfer del lote
+            ciphertext = self._ecb.encrypt(b"".join(part for message in messages for part in message))
+            lengths = [len(body) + DES_BLOCK_SIZE for body, _ in messages]
+            return [(piece, None) for piece in self._split(ciphertext, lengths)]
+        
+        if ivs is None:
+            ivs = [secrets.token_bytes(DES_BLOCK_SIZE) for _ in messages]
+        elif len(ivs) != len(messages):
+            raise InvalidInputError("Se necesita un IV por mensaje")
+        ivs = [self._check_iv(iv) for iv in ivs]
+        
+        if len(messages) < DES_BATCH_MIN_MESSAGES:
+            return [(self._encrypt_blocks(self._cipher(iv), body, final), iv)
+                    for (body, final), iv in zip(messages, ivs)]
+        return list(zip(self._encrypt_cbc_columns(messages, ivs), ivs))
+    
+    @staticmethod
+    def _encrypt_blocks(cipher, body: memoryview, final: bytes) -> bytes:
+        """Cifrar los bloques completos desde la vista (sin copiar la entrada) y el bloque final"""
+        ciphertext = bytearray(len(body) + DES_BLOCK_SIZE)
+        output = memoryview(ciphertext)
+        if len(body):
+            cipher.encrypt(body, output=output[:len(body)])
+        cipher.encrypt(final, output=output[len(body):])
+        return bytes(ciphertext)
+    
+    def _encrypt_cbc_columns(self, messages: List[Tuple[memoryview, bytes]], ivs: List[bytes]) -> List[bytes]:
+        """CBC por columnas de bloques: una llamada ECB por posición de bloque"""
+        # Orden por número de bloques descendente: los mensajes que aún
+        # tienen bloque j son siempre un prefijo
+        blocks = [len(body) // DES_BLOCK_SIZE + 1 for body, _ in messages]
+        order = sorted(range(len(messages)), key=lambda index: -blocks[index])
+        
+        def block(index: int, column: int):
+            body, final = messages[index]
+            offset = column * DES_BLOCK_SIZE
+            return body[offset:offset + DES_BLOCK_SIZE] if offset < len(body) else final
+        
+        previous = b"".join(ivs[index] for index in order)
+        columns = []
+        active = len(order)
+        for column in range(blocks[order[0]]):
+            while blocks[order[active - 1]] <= column:
+                active -= 1
+            plain = b"".join(block(index, column) for index in order[:active])
+            previous = self._ecb.encrypt(_xor_bytes(plain, previous[:len(plain)]))
+            columns.append(previous)
+        
+        ciphertexts: List[bytes] = [b""] * len(order)
+        for row, index in enumerate(order):
+            start = row * DES_BLOCK_SIZE
+            ciphertexts[index] = b"".join(columns[column][start:start + DES_BLOCK_SIZE]
+                                          for column in range(blocks[index]))
+        return ciphertexts
+    
+    def decrypt_many(self, ciphertexts: Sequence[BytesLike], ivs: Optional[Sequence[bytes]] = None) -> List[bytes]:
+        """
+        Descifrar muchos mensajes con la misma clave
+        
+        Args:
+            ciphertexts (Sequence[BytesLike]): Textos cifrados
+            ivs (Optional[Sequence[bytes]]): Un IV por mensaje (obligatorio salvo en ECB)
+            
+        Returns:
+            List[bytes]: Textos planos sin relleno
+        """
+        if self.mode not in DES_PADDED_MODES:
+            if ivs is None or len(ivs) != len(ciphertexts):
+                raise InvalidInputError(f"Se necesita un IV por mensaje en modo {self.mode}")
+            return [self.decrypt(ciphertext, iv) for ciphertext, iv in zip(ciphertexts, ivs)]
+        
+        views = [_byte_view(ciphertext) for ciphertext in ciphertexts]
+        for view in views:
+            if not len(view) or len(view) % DES_BLOCK_SIZE:
+                raise DecryptionError("El texto cifrado debe ser un múltiplo no vacío de 8 bytes")
+        
+        decrypted = self._ecb.decrypt(b"".join(views))
+        if self.mode == 'CBC':
+            if ivs is None or len(ivs) != len(views):
+                raise InvalidInputError("Se necesita un IV por mensaje en modo CBC")
+            # P_i = D(C_i) ^ C_{i-1}, con C_0 = IV: una XOR para todo el lote
+            previous = b"".join(part for iv, view in zip(ivs, views)
+                                for part in (self._check_iv(iv), view[:-DES_BLOCK_SIZE]))
+            decrypted = _xor_bytes(decrypted, previous)
+        elif ivs is not None:
+            raise InvalidInputError("El modo ECB no usa IV")
+        
+        plaintexts = []
+        for index, padded in enumerate(self._split(decrypted, [len(view) for view in views])):
+            try:
+                plaintexts.append(unpad(padded, DES_BLOCK_SIZE))
+            except ValueError as e:
+                raise DecryptionError(f"Error al descifrar el mensaje {index}: {str(e)}")
+        return plaintexts
+    
+    @staticmethod
+    def _split(data: bytes, lengths: Sequence[int]) -> List[bytes]:
+        """Separar `data` en trozos de las longitudes dadas"""
+        pieces = []
+        offset = 0
+        for length in lengths:
+            pieces.append(data[offset:offset + length])
+            offset += length
+        return pieces
+    
+    def _cipher(self, iv: Optional[bytes], block: int = 0):
+        """
+        Cifrador para un mensaje o flujo: el ECB compartido o uno nuevo que
+        arrastra el encadenamiento; en CTR, con el contador avanzado `block` bloques
+        """
+        if self.mode == 'ECB':
+            if iv is not None:
+                raise InvalidInputError("El modo ECB no usa IV")
+            return self._ecb
+        iv = self._check_iv(iv)
+        if self.mode == 'CBC':
+            return self._module.new(self.key, DES.MODE_CBC, iv)
+        if self.mode == 'CTR':
+            # El contador de 32 bits da la vuelta igual que en el cifrado secuencial
+            counter_bits = 8 * (DES_BLOCK_SIZE - DES_CTR_NONCE_SIZE)
+            counter = (int.from_bytes(iv[DES_CTR_NONCE_SIZE:], 'big') + block) % (1 << counter_bits)
+            return self._module.new(self.key, DES.MODE_CTR, nonce=iv[:DES_CTR_NONCE_SIZE], initial_value=counter)
+        return self._module.new(self.key, DES.MODE_EAX, nonce=iv, mac_len=DES_TAG_SIZE)
+    
+    def encrypt_stream(self, source: BinaryIO, destination: BinaryIO, iv: Optional[bytes] = None,
+                       chunk_size: int = DES_STREAM_CHUNK_SIZE) -> int:
+        """
+        Cifrar un flujo binario por bloques con memoria constante
+        
+        Los bloques completos se cifran a medida que se leen; el relleno
+        PKCS#7 (ECB, CBC) solo se añade al final. Salvo en ECB la salida
+        empieza con el IV y el encadenamiento se conserva entre lecturas;
+        en EAX termina con la etiqueta de autenticación.
+        
+        Args:
+            source (BinaryIO): Flujo de entrada con readinto()
+            destination (BinaryIO): Flujo de salida binario
+            iv (Optional[bytes]): IV salvo en ECB (aleatorio si no se indica)
+            chunk_size (int): Tamaño de lectura (múltiplo de 8)
+            
+        Returns:
+            int: Bytes escritos en destination
+        """
+        if chunk_size <= 0 or chunk_size % DES_BLOCK_SIZE:
+            raise InvalidInputError("El tamaño de bloque de lectura debe ser un múltiplo de 8")
+        
+        written = 0
+        if self.mode != 'ECB':
+            iv = iv if iv is not None else self._new_iv()
+            destination.write(self._check_iv(iv))
+            written += DES_BLOCK_SIZE
+        cipher = self._cipher(iv)
+        
+        buffer, output = bytearray(chunk_size), bytearray(chunk_size)
+        data, out = memoryview(buffer), memoryview(output)
+        filled = 0
+        while True:
+            read = source.readinto(data[filled:])
+            if not read:
+                break
+            filled += read
+            usable = filled - filled % DES_BLOCK_SIZE
+            if usable:
+                cipher.encrypt(data[:usable], output=out[:usable])
+                destination.write(out[:usable])
+                written += usable
+                # Conservar el bloque incompleto (lecturas cortas) al inicio
+                data[:filled - usable] = data[usable:filled]
+                filled -= usable
+        
+        if self.mode in DES_PADDED_MODES:
+            final = cipher.encrypt(pad(bytes(data[:filled]), DES_BLOCK_SIZE))
+        else:
+            final = cipher.encrypt(bytes(data[:filled])) if filled else b""
+            if self.mode == 'EAX':
+                final += cipher.digest()
+        destination.write(final)
+        return written + len(final)
+    
+    def decrypt_stream(self, source: BinaryIO, destination: BinaryIO,
+                       chunk_size: int = DES_STREAM_CHUNK_SIZE) -> int:
+        """
+        Descifrar un flujo producido por encrypt_stream con memoria constante
+        
+        Salvo en ECB el IV se lee de los primeros 8 bytes. El último bloque
+        (relleno) o los últimos 8 bytes (etiqueta EAX) se retienen hasta el
+        final del flujo. En EAX el texto plano se escribe antes de verificar
+        la etiqueta: si la verificación falla, la salida debe descartarse
+        (``DESCipher.decrypt_file`` lo hace).
+        
+        Args:
+            source (BinaryIO): Flujo cifrado con readinto()
+            destination (BinaryIO): Flujo de salida binario
+            chunk_size (int): Tamaño de lectura (múltiplo de 8)
+            
+        Returns:
+            int: Bytes de texto plano escritos en destination
+        """
+        if chunk_size <= 0 or chunk_size % DES_BLOCK_SIZE:
+            raise InvalidInputError("El tamaño de bloque de lectura debe ser un múltiplo de 8")
+        
+        iv = None
+        if self.mode != 'ECB':
+            iv = b""
+            while len(iv) < DES_BLOCK_SIZE:
+                piece = source.read(DES_BLOCK_SIZE - len(iv))
+                if not piece:
+                    break
+                iv += piece
+            if len(iv) != DES_BLOCK_SIZE:
+                raise DecryptionError("El flujo cifrado no contiene el IV")
+        cipher = self._cipher(iv)
+        # Bytes a retener: uno (el último bloque lleva el relleno) o la etiqueta EAX
+        hold = {'CTR': 0, 'EAX': DES_TAG_SIZE}.get(self.mode, 1)
+        
+        # Un bloque extra para que lo retenido nunca llene el búfer
+        buffer, output = bytearray(chunk_size + DES_BLOCK_SIZE), bytearray(chunk_size + DES_BLOCK_SIZE)
+        data, out = memoryview(buffer), memoryview(output)
+        filled = 0
+        written = 0
+        while True:
+            read = source.readinto(data[filled:])
+            if not read:
+                break
+            filled += read
+            usable = max(filled - hold, 0) // DES_BLOCK_SIZE * DES_BLOCK_SIZE
+            if usable:
+                cipher.decrypt(data[:usable], output=out[:usable])
+                destination.write(out[:usable])
+                written += usable
+                data[:filled - usable] = data[usable:filled]
+                filled -= usable
+        
+        if self.mode == 'CTR':
+            final = cipher.decrypt(bytes(data[:filled])) if filled else b""
+        elif self.mode == 'EAX':
+            if filled < DES_TAG_SIZE:
+                raise DecryptionError("El flujo cifrado no contiene la etiqueta de autenticación")
+            body = filled - DES_TAG_SIZE
+            final = cipher.decrypt(bytes(data[:body])) if body else b""
+            try:
+                cipher.verify(bytes(data[body:filled]))
+            except ValueError:
+                raise DecryptionError("Etiqueta de autenticación inválida: datos alterados o clave incorrecta")
+        else:
+            if filled != DES_BLOCK_SIZE:
+                raise DecryptionError("El texto cifrado debe ser un múltiplo no vacío de 8 bytes")
+            try:
+                final = unpad(cipher.decrypt(bytes(data[:filled])), DES_BLOCK_SIZE)
+            except ValueError as e:
+                raise DecryptionError(f"Error al descifrar: {str(e)}")
+        destination.write(final)
+        return written + len(final)
+
+
+@lru_cache(maxsize=DES_CONTEXT_CACHE_SIZE)
+def des_context(key: bytes, mode: str = DES_DEFAULT_MODE) -> DESContext:
+    """
+    Obtener un contexto DES, reutilizando el de llamadas previas
+    
+    La caché guarda la clave en claro junto a su expansión; solo se
+    conservan los ``DES_CONTEXT_CACHE_SIZE`` contextos usados más
+    recientemente y ``des_context.cache_clear()`` los descarta todos.
+    
+    Args:
+        key (bytes): Clave de 8 bytes (16 o 24 para 3DES)
+        mode (str): "ECB", "CBC", "CTR" o "EAX"
+        
+    Returns:
+        DESContext: Contexto con la clave expandida
+    """
+    return DESContext(key, mode)
+
+
+class DESCipher:
+    """
+    Implementación del algoritmo DES (Data Encryption Standard) y 3DES EDE
+    """
+    
+    def __init__(self):
+        """Inicializar cifrado DES"""
+        pass
+    
+    def validate_key(self, key: str) -> bool:
+        """
+        Validar clave DES
+        
+        Args:
+            key (str): Clave a validar
+            
+        Returns:
+            bool: True si es válida
+        """
+        # DES requiere clave de 8 bytes (64 bits); 3DES, de 16 o 24
+        return len(key) == DES_KEY_SIZE or len(key) in TRIPLE_DES_KEY_SIZES
+    
+    def context(self, key: Union[str, bytes], mode: str = DES_DEFAULT_MODE) -> DESContext:
+        """
+        Contexto reutilizable para cifrar muchos mensajes con una clave
+        
+        Args:
+            key (Union[str, bytes]): Clave de 8 caracteres o bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            
+        Returns:
+            DESContext: Contexto (compartido entre llamadas con la misma clave y modo)
+        """
+        if isinstance(key, str):
+            if not self.validate_key(key):
+                raise InvalidKeyError("La clave DES debe tener 8 caracteres (16 o 24 para 3DES)")
+            key = key.encode('utf-8')
+        return des_context(bytes(key), mode.upper())
+    
+    def encrypt_bytes(self, data: BytesLike, key: Union[str, bytes], mode: str = DES_DEFAULT_MODE,
+                      iv: Optional[bytes] = None,
+                      workers: Optional[int] = 1) -> Tuple[Union[bytes, bytearray], Optional[bytes]]:
+        """
+        Cifrar datos binarios
+        
+        Args:
+            data (BytesLike): Datos no vacíos (bytes, bytearray o memoryview)
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            iv (Optional[bytes]): IV salvo en ECB (aleatorio si no se indica)
+            workers (Optional[int]): Hilos para ECB y CTR (None = todos los núcleos)
+            
+        Returns:
+            Tuple[Union[bytes, bytearray], Optional[bytes]]: (texto_cifrado, iv); iv es None en ECB
+            (bytearray sin copia final si se cifra en paralelo)
+        """
+        return self.context(key, mode).encrypt(data, iv, workers)
+    
+    def decrypt_bytes(self, ciphertext: BytesLike, key: Union[str, bytes], mode: str = DES_DEFAULT_MODE,
+                      iv: Optional[bytes] = None, workers: Optional[int] = 1) -> Union[bytes, bytearray]:
+        """
+        Descifrar datos binarios
+        
+        Args:
+            ciphertext (BytesLike): Texto cifrado
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            iv (Optional[bytes]): IV usado al cifrar (obligatorio salvo en ECB)
+            workers (Optional[int]): Hilos a usar (None = todos los núcleos)
+            
+        Returns:
+            Union[bytes, bytearray]: Datos originales (bytearray sin copia final en paralelo)
+        """
+        return self.context(key, mode).decrypt(ciphertext, iv, workers)
     
     def encrypt_ecb(self, plaintext: str, key: str) -> str:
         """
@@ -516,61 +1394,34 @@ class DESCipher:
         Returns:
             str: Texto cifrado en hexadecimal
         """
-        if not self.validate_key(key):
-            raise InvalidKeyError("La clave DES debe tener exactamente 8 caracteres")
+        context = self.context(key, 'ECB')
         
         if not plaintext:
             raise InvalidInputError("El texto no puede estar vacío")
         
-        # Convertir clave a bytes
-        key_bytes = key.encode('utf-8')
-        
-        # Crear cifrador DES
-        cipher = DES.new(key_bytes, DES.MODE_ECB)
-        
-        # Rellenar texto para que sea múltiplo de 8
-        plaintext_bytes = plaintext.encode('utf-8')
-        padded_text = pad(plaintext_bytes, DES.block_size)
-        
-        # Cifrar
-        ciphertext = cipher.encrypt(padded_text)
+        ciphertext, _ = context.encrypt(plaintext.encode('utf-8'))
         
         return ciphertext.hex()
     
-    def decrypt_ecb(self, ciphertext_hex: str, key: str) -> str:
+    def decrypt_ecb(self, ciphertext_hex: str, key: str, workers: Optional[int] = 1) -> str:
         """
         Descifrar usando DES en modo ECB
         
         Args:
             ciphertext_hex (str): Texto cifrado en hexadecimal
             key (str): Clave de 8 bytes
+            workers (Optional[int]): Hilos a usar (None = todos los núcleos)
             
         Returns:
             str: Texto descifrado
         """
-        if not self.validate_key(key):
-            raise InvalidKeyError("La clave DES debe tener exactamente 8 caracteres")
+        context = self.context(key, 'ECB')
         
         if not ciphertext_hex:
             raise InvalidInputError("El texto cifrado no puede estar vacío")
         
         try:
-            # Convertir hex a bytes
-            ciphertext = bytes.fromhex(ciphertext_hex)
-            
-            # Convertir clave a bytes
-            key_bytes = key.encode('utf-8')
-            
-            # Crear cifrador DES
-            cipher = DES.new(key_bytes, DES.MODE_ECB)
-            
-            # Descifrar
-            padded_plaintext = cipher.decrypt(ciphertext)
-            
-            # Quitar padding
-            plaintext = unpad(padded_plaintext, DES.block_size)
-            
-            return plaintext.decode('utf-8')
+            return context.decrypt(bytes.fromhex(ciphertext_hex), workers=workers).decode('utf-8')
         
         except Exception as e:
             raise DecryptionError(f"Error al descifrar: {str(e)}")
@@ -587,37 +1438,16 @@ class DESCipher:
         Returns:
             Tuple[str, str]: (texto_cifrado_hex, iv_hex)
         """
-        if not self.validate_key(key):
-            raise InvalidKeyError("La clave DES debe tener exactamente 8 caracteres")
+        context = self.context(key, 'CBC')
         
         if not plaintext:
             raise InvalidInputError("El texto no puede estar vacío")
         
-        # Generar IV si no se proporciona
-        if iv is None:
-            iv = secrets.token_bytes(8)
-        else:
-            iv = iv.encode('utf-8')
-        
-        if len(iv) != 8:
-            raise InvalidInputError("El IV debe tener exactamente 8 bytes")
+        ciphertext, iv_bytes = context.encrypt(plaintext.encode('utf-8'), None if iv is None else iv.encode('utf-8'))
         
-        # Convertir clave a bytes
-        key_bytes = key.encode('utf-8')
-        
-        # Crear cifrador DES
-        cipher = DES.new(key_bytes, DES.MODE_CBC, iv)
-        
-        # Rellenar texto
-        plaintext_bytes = plaintext.encode('utf-8')
-        padded_text = pad(plaintext_bytes, DES.block_size)
-        
-        # Cifrar
-        ciphertext = cipher.encrypt(padded_text)
-        
-        return ciphertext.hex(), iv.hex()
+        return ciphertext.hex(), iv_bytes.hex()
     
-    def decrypt_cbc(self, ciphertext_hex: str, key: str, iv_hex: str) -> str:
+    def decrypt_cbc(self, ciphertext_hex: str, key: str, iv_hex: str, workers: Optional[int] = 1) -> str:
         """
         Descifrar usando DES en modo CBC
         
@@ -625,48 +1455,230 @@ class DESCipher:
             ciphertext_hex (str): Texto cifrado en hexadecimal
             key (str): Clave de 8 bytes
             iv_hex (str): IV en hexadecimal
+            workers (Optional[int]): Hilos a usar (None = todos los núcleos)
             
         Returns:
             str: Texto descifrado
         """
-        if not self.validate_key(key):
-            raise InvalidKeyError("La clave DES debe tener exactamente 8 caracteres")
+        context = self.context(key, 'CBC')
         
         if not ciphertext_hex or not iv_hex:
             raise InvalidInputError("El texto cifrado y el IV no pueden estar vacíos")
         
         try:
-            # Convertir hex a bytes
-            ciphertext = bytes.fromhex(ciphertext_hex)
-            iv = bytes.fromhex(iv_hex)
-            
-            # Convertir clave a bytes
-            key_bytes = key.encode('utf-8')
-            
-            # Crear cifrador DES
-            cipher = DES.new(key_bytes, DES.MODE_CBC, iv)
-            
-            # Descifrar
-            padded_plaintext = cipher.decrypt(ciphertext)
+            return context.decrypt(bytes.fromhex(ciphertext_hex), bytes.fromhex(iv_hex), workers).decode('utf-8')
+        
+        except Exception as e:
+            raise DecryptionError(f"Error al descifrar: {str(e)}")
+    
+    def encrypt_many(self, plaintexts: Sequence[str], key: Union[str, bytes],
+                     mode: str = DES_DEFAULT_MODE) -> List[Tuple[str, Optional[str]]]:
+        """
+        Cifrar muchos textos con la misma clave
+        
+        Args:
+            plaintexts (Sequence[str]): Textos planos
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
             
-            # Quitar padding
-            plaintext = unpad(padded_plaintext, DES.block_size)
+        Returns:
+            List[Tuple[str, Optional[str]]]: (texto_cifrado_hex, iv_hex) por texto; iv_hex es None en ECB
+        """
+        encoded = [plaintext.encode('utf-8') for plaintext in plaintexts]
+        return [(ciphertext.hex(), None if iv is None else iv.hex())
+                for ciphertext, iv in self.context(key, mode).encrypt_many(encoded)]
+    
+    def decrypt_many(self, ciphertexts_hex: Sequence[str], key: Union[str, bytes],
+                     mode: str = DES_DEFAULT_MODE, ivs_hex: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Descifrar muchos textos con la misma clave
+        
+        Args:
+            ciphertexts_hex (Sequence[str]): Textos cifrados en hexadecimal
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            ivs_hex (Optional[Sequence[str]]): IV de cada texto (obligatorio salvo en ECB)
             
-            return plaintext.decode('utf-8')
+        Returns:
+            List[str]: Textos descifrados
+        """
+        context = self.context(key, mode)
+        try:
+            ciphertexts = [bytes.fromhex(ciphertext) for ciphertext in ciphertexts_hex]
+            ivs = None if ivs_hex is None else [bytes.fromhex(iv) for iv in ivs_hex]
+            return [plaintext.decode('utf-8') for plaintext in context.decrypt_many(ciphertexts, ivs)]
         
+        except DecryptionError:
+            raise
         except Exception as e:
             raise DecryptionError(f"Error al descifrar: {str(e)}")
+    
+    def encrypt_file(self, input_path: str, output_path: str, key: Union[str, bytes],
+                     mode: str = DES_DEFAULT_MODE, iv: Optional[bytes] = None) -> int:
+        """
+        Cifrar un archivo de cualquier tamaño a binario
+        
+        Args:
+            input_path (str): Archivo a cifrar
+            output_path (str): Archivo cifrado (salvo en ECB empieza con el IV)
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            iv (Optional[bytes]): IV salvo en ECB (aleatorio si no se indica)
+            
+        Returns:
+            int: Tamaño del archivo cifrado en bytes
+        """
+        context = self.context(key, mode)
+        return self._transform_file(input_path, output_path,
+                                    lambda source, destination: context.encrypt_stream(source, destination, iv))
+    
+    def decrypt_file(self, input_path: str, output_path: str, key: Union[str, bytes],
+                     mode: str = DES_DEFAULT_MODE) -> int:
+        """
+        Descifrar un archivo producido por encrypt_file
+        
+        Args:
+            input_path (str): Archivo cifrado
+            output_path (str): Archivo descifrado
+            key (Union[str, bytes]): Clave de 8 bytes (16 o 24 para 3DES)
+            mode (str): "ECB", "CBC", "CTR" o "EAX"
+            
+        Returns:
+            int: Tamaño del archivo descifrado en bytes
+        """
+        context = self.context(key, mode)
+        return self._transform_file(input_path, output_path, context.decrypt_stream)
+    
+    @staticmethod
+    def _transform_file(input_path: str, output_path: str, transform) -> int:
+        """Escribir en un temporal junto al destino y reemplazarlo solo si todo fue bien"""
+        if not os.path.isfile(input_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {input_path}", input_path)
+        
+        directory = os.path.dirname(os.path.abspath(output_path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with open(input_path, 'rb') as source, os.fdopen(descriptor, 'wb') as destination:
+                written = transform(source, destination)
+            os.replace(temporary, output_path)
+            return written
+        except BaseException:
+            os.unlink(temporary)
+            raise
 
 # ===== FIRMA DIGITAL =====
+# Mensajes por tarea al hashear en hilos y al firmar/verificar en procesos
+SIGNATURE_BATCH_CHUNK = 256
+# Tamaño de lectura al firmar flujos y archivos
+SIGNATURE_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class SignatureBatch(NamedTuple):
+    """
+    Resultado de sign_batch: firmas contiguas de `size` bytes en el orden
+    de los mensajes y un byte de estado por mensaje (1 = firmado, 0 = el
+    mensaje no era texto ni un buffer y su firma queda en ceros)
+    """
+    signatures: bytearray
+    status: bytearray
+    size: int
+    
+    def signature(self, index: int) -> Optional[bytes]:
+        """Firma del mensaje `index`, o None si no se pudo firmar"""
+        if not self.status[index]:
+            return None
+        return bytes(self.signatures[index * self.size:(index + 1) * self.size])
+
+
+def _hash_batch(messages: Sequence[Union[str, BytesLike]], workers: int) -> Tuple[bytearray, bytearray]:
+    """
+    SHA-256 de cada mensaje, por tramos en un pool de hilos (hashlib libera
+    el GIL): digests contiguos de 32 bytes y estado (0 si el mensaje no es
+    texto ni un buffer)
+    """
+    count = len(messages)
+    digests = bytearray(SHA256_DIGEST_SIZE * count)
+    status = bytearray(b"\x01") * count
+    sha256 = hashlib.sha256
+    
+    def run(start: int) -> None:
+        for index in range(start, min(start + SIGNATURE_BATCH_CHUNK, count)):
+            message = messages[index]
+            try:
+                data = message.encode('utf-8') if isinstance(message, str) else memoryview(message).cast('B')
+            except (AttributeError, TypeError, ValueError):
+                status[index] = 0
+                continue
+            offset = index * SHA256_DIGEST_SIZE
+            digests[offset:offset + SHA256_DIGEST_SIZE] = sha256(data).digest()
+    
+    starts = range(0, count, SIGNATURE_BATCH_CHUNK)
+    if workers <= 1 or len(starts) <= 1:
+        for start in starts:
+            run(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, starts))
+    return digests, status
+
+
+def _sign_chunk(task: Tuple[bytes, int, int, Optional[number_theory.CRTParams]]) -> bytes:
+    """Firmar digests contiguos (tarea de proceso): firmas contiguas de byte_length bytes"""
+    digests, d, n, crt = task
+    size = (n.bit_length() + 7) // 8
+    prefix = _pkcs1_prefix(size)
+    from_bytes = int.from_bytes
+    crt_pow = number_theory.crt_pow
+    signatures = bytearray(len(digests) // SHA256_DIGEST_SIZE * size)
+    for index, offset in enumerate(range(0, len(digests), SHA256_DIGEST_SIZE)):
+        value = from_bytes(prefix + digests[offset:offset + SHA256_DIGEST_SIZE], 'big')
+        signature = crt_pow(value, crt) if crt else pow(value, d, n)
+        signatures[index * size:(index + 1) * size] = signature.to_bytes(size, 'big')
+    return bytes(signatures)
+
+
+def _verify_chunk(task: Tuple[bytes, List[int], int, int]) -> bytes:
+    """Verificar digests contiguos contra firmas enteras (tarea de proceso): un byte 1/0 por firma"""
+    digests, signatures, e, n = task
+    size = (n.bit_length() + 7) // 8
+    prefix = _pkcs1_prefix(size)
+    compare = hmac.compare_digest
+    status = bytearray(len(signatures))
+    for index, signature in enumerate(signatures):
+        offset = index * SHA256_DIGEST_SIZE
+        if 0 < signature < n and compare(pow(signature, e, n).to_bytes(size, 'big'),
+                                         prefix + digests[offset:offset + SHA256_DIGEST_SIZE]):
+            status[index] = 1
+    return bytes(status)
+
+
+def _run_chunks(function, tasks: List[tuple], workers: int) -> List[bytes]:
+    """Ejecutar tareas en un pool de procesos, o en este proceso si solo hay un núcleo o una tarea"""
+    if workers <= 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, tasks))
+
+
 class DigitalSignature:
     """
     Implementación de firma digital usando RSA
     """
     
-    def __init__(self):
-        """Inicializar sistema de firma digital"""
-        self.rsa = RSACipher()
+    def __init__(self, rng: Optional[RandomSource] = None, key_ttl: float = SIGNATURE_KEY_TTL):
+        """
+        Inicializar sistema de firma digital
+        
+        Args:
+            rng (Optional[RandomSource]): Fuente de aleatoriedad para generar claves
+            key_ttl (float): Segundos que cached_keys reutiliza el par de
+                claves actual (0 = generar siempre, math.inf = no rotar)
+        """
+        self.rsa = RSACipher(rng=rng)
         self.hash_func = CustomHash()
+        self.key_ttl = key_ttl
+        self._keys_created: Optional[float] = None
+        self._crt: Optional[Tuple[Tuple[int, int], number_theory.CRTParams]] = None
     
     def generate_keys(self, key_size: int = 2048) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """
@@ -679,25 +1691,77 @@ class DigitalSignature:
             Tuple: (clave_pública, clave_privada)
         """
         self.rsa.key_size = key_size
-        return self.rsa.generate_keys()
+        keys = self.rsa.generate_keys()
+        self._keys_created = time.monotonic()
+        return keys
     
-    def sign_message(self, message: str, private_key: Optional[Tuple[int, int]] = None) -> str:
+    def cached_keys(self, key_size: int = 2048, ttl: Optional[float] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """
-        Firmar un mensaje
+        Par de claves actual si es del tamaño pedido y no ha caducado; si
+        no, uno nuevo
         
         Args:
-            message (str): Mensaje a firmar
-            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            key_size (int): Tamaño de clave en bits
+            ttl (Optional[float]): Vigencia en segundos (por defecto key_ttl)
             
         Returns:
-            str: Firma digital en hexadecimal
+            Tuple: (clave_pública, clave_privada)
         """
-        if not message:
-            raise InvalidInputError("El mensaje no puede estar vacío")
+        ttl = self.key_ttl if ttl is None else ttl
+        if self.key_age() < ttl and self.rsa.key_size == key_size:
+            return self.rsa.public_key, self.rsa.private_key
+        return self.generate_keys(key_size)
+    
+    def key_age(self) -> float:
+        """
+        Segundos desde que se generó o cargó el par de claves actual
+        
+        Returns:
+            float: Antigüedad (math.inf si no hay claves)
+        """
+        if self._keys_created is None or not self.rsa.private_key:
+            return math.inf
+        return time.monotonic() - self._keys_created
+    
+    def rotate_keys(self, key_size: Optional[int] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Reemplazar el par de claves actual aunque no haya caducado
         
-        # Generar hash del mensaje
-        message_hash = self.hash_func.sha256_wrapper(message)
+        Args:
+            key_size (Optional[int]): Tamaño de clave (por defecto el actual)
+            
+        Returns:
+            Tuple: (clave_pública, clave_privada)
+        """
+        return self.generate_keys(key_size or self.rsa.key_size)
+    
+    def load_keys(self, name: str, keystore: Optional[KeyStore] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Cargar un par de claves de firma guardado
         
+        Args:
+            name (str): Nombre del par de claves
+            keystore (Optional[KeyStore]): Almacén a usar (por defecto el de la aplicación)
+            
+        Returns:
+            Tuple: (clave_pública, clave_privada)
+        """
+        keys = self.rsa.load_keys(name, keystore)
+        self._keys_created = time.monotonic()
+        return keys
+    
+    def save_keys(self, name: str, keystore: Optional[KeyStore] = None) -> None:
+        """
+        Guardar el par de claves de firma actual
+        
+        Args:
+            name (str): Nombre del par de claves
+            keystore (Optional[KeyStore]): Almacén a usar (por defecto el de la aplicación)
+        """
+        self.rsa.save_keys(name, keystore)
+    
+    def _signing_key(self, private_key: Optional[Tuple[int, int]]) -> Tuple[int, int, Optional[number_theory.CRTParams]]:
+        """(d, n, parámetros CRT) de la clave indicada o la generada; CRT solo si se conocen los primos de n"""
         # Usar clave privada proporcionada o la generada
         if private_key:
             d, n = private_key
@@ -706,17 +1770,233 @@ class DigitalSignature:
         else:
             raise KeyGenerationError("No hay clave privada disponible")
         
-        # Convertir hash a entero
-        hash_int = int(message_hash, 16)
+        # El bloque PKCS#1 v1.5 (hash + DigestInfo + relleno) debe caber en n
+        _pkcs1_prefix((n.bit_length() + 7) // 8)
+        
+        primes = self.rsa.primes
+        if not primes or primes[0] * primes[1] != n:
+            return d, n, None
+        # Los parámetros CRT se derivan una vez por clave
+        if self._crt is None or self._crt[0] != (d, n):
+            self._crt = ((d, n), number_theory.crt_params(d, *primes))
+        return d, n, self._crt[1]
+    
+    def sign_bytes(self, data: BytesLike, private_key: Optional[Tuple[int, int]] = None) -> bytes:
+        """
+        Firmar datos binarios
+        
+        Args:
+            data (BytesLike): Datos a firmar (bytes, bytearray o memoryview)
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            
+        Returns:
+            bytes: Firma de la longitud en bytes de n
+        """
+        return self.sign_digest(hashing.new_hash("SHA256", _byte_view(data)).digest(), private_key)
+    
+    def sign_digest(self, digest: BytesLike, private_key: Optional[Tuple[int, int]] = None) -> bytes:
+        """
+        Firmar un hash SHA-256 ya calculado
+        
+        Args:
+            digest (BytesLike): Hash SHA-256 de 32 bytes
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            
+        Returns:
+            bytes: Firma de la longitud en bytes de n
+        """
+        d, n, crt = self._signing_key(private_key)
+        size = (n.bit_length() + 7) // 8
         
-        # Verificar que el hash sea menor que n
-        if hash_int >= n:
-            raise SignatureError("El hash es demasiado grande para la clave")
+        # Codificar el hash en un bloque PKCS#1 v1.5 y firmarlo, por CRT si se conocen p y q
+        value = int.from_bytes(pkcs1_encode(digest, size), 'big')
+        signature = number_theory.crt_pow(value, crt) if crt else pow(value, d, n)
         
-        # Firmar (cifrar hash con clave privada)
-        signature = pow(hash_int, d, n)
+        return signature.to_bytes(size, 'big')
+    
+    def sign_stream(self, stream: BinaryIO, private_key: Optional[Tuple[int, int]] = None,
+                    chunk_size: int = SIGNATURE_STREAM_CHUNK_SIZE) -> bytes:
+        """
+        Firmar un flujo binario de cualquier tamaño en memoria constante
+        
+        El flujo se hashea por bloques y solo el hash final pasa por RSA;
+        la firma es idéntica a la de sign_bytes sobre el mismo contenido.
         
-        return f"{signature:x}"
+        Args:
+            stream (BinaryIO): Flujo abierto en modo binario (se lee hasta el final)
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            chunk_size (int): Tamaño de cada lectura
+            
+        Returns:
+            bytes: Firma de la longitud en bytes de n
+        """
+        # Validar la clave antes de leer todo el flujo
+        self._signing_key(private_key)
+        return self.sign_digest(hashing.hash_stream("SHA256", stream, chunk_size).digest(), private_key)
+    
+    def verify_stream(self, stream: BinaryIO, signature: BytesLike,
+                      public_key: Optional[Tuple[int, int]] = None,
+                      chunk_size: int = SIGNATURE_STREAM_CHUNK_SIZE) -> bool:
+        """
+        Verificar la firma de un flujo binario en memoria constante
+        
+        Args:
+            stream (BinaryIO): Flujo abierto en modo binario (se lee hasta el final)
+            signature (BytesLike): Firma producida por sign_stream o sign_bytes
+            public_key (Optional[Tuple[int, int]]): Clave pública para verificar
+            chunk_size (int): Tamaño de cada lectura
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        key = self.rsa.prepare_public_key(public_key)
+        if len(_byte_view(signature)) != key.byte_length:
+            return False
+        return key.verify_digest(hashing.hash_stream("SHA256", stream, chunk_size).digest(), signature)
+    
+    def sign_file(self, file_path: str, private_key: Optional[Tuple[int, int]] = None,
+                  signature_path: Optional[str] = None) -> str:
+        """
+        Firmar un archivo y guardar la firma separada junto a él
+        
+        Args:
+            file_path (str): Archivo a firmar
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            signature_path (Optional[str]): Archivo de firma (por defecto
+                file_path + SIGNATURE_FILE_EXTENSION)
+            
+        Returns:
+            str: Ruta del archivo de firma (firma binaria de byte_length bytes)
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {file_path}", file_path)
+        signature_path = signature_path or file_path + SIGNATURE_FILE_EXTENSION
+        
+        with open(file_path, 'rb') as f:
+            signature = self.sign_stream(f, private_key)
+        
+        # Escribir en un temporal y reemplazar: nunca queda una firma a medias
+        directory = os.path.dirname(os.path.abspath(signature_path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(signature)
+            os.replace(temporary, signature_path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return signature_path
+    
+    def verify_file(self, file_path: str, public_key: Optional[Tuple[int, int]] = None,
+                    signature_path: Optional[str] = None) -> bool:
+        """
+        Verificar un archivo contra su firma separada
+        
+        Args:
+            file_path (str): Archivo firmado
+            public_key (Optional[Tuple[int, int]]): Clave pública para verificar
+            signature_path (Optional[str]): Archivo de firma (por defecto
+                file_path + SIGNATURE_FILE_EXTENSION)
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        signature_path = signature_path or file_path + SIGNATURE_FILE_EXTENSION
+        for path in (file_path, signature_path):
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"Archivo no encontrado: {path}", path)
+        
+        key = self.rsa.prepare_public_key(public_key)
+        with open(signature_path, 'rb') as f:
+            # Una firma válida ocupa byte_length bytes; leer uno más detecta basura al final
+            signature = f.read(key.byte_length + 1)
+        with open(file_path, 'rb') as f:
+            return self.verify_stream(f, signature, key)
+    
+    def sign_batch(self, messages: Sequence[Union[str, BytesLike]], private_key: Optional[Tuple[int, int]] = None,
+                   workers: Optional[int] = None, hash_workers: Optional[int] = None) -> SignatureBatch:
+        """
+        Firmar muchos mensajes con la misma clave
+        
+        Los mensajes se hashean por tramos en un pool de hilos y las
+        exponenciaciones (CRT si se conocen los primos) se reparten por
+        tramos en un pool de procesos. Los textos se codifican en UTF-8.
+        
+        Args:
+            messages (Sequence[Union[str, BytesLike]]): Mensajes a firmar
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            workers (Optional[int]): Procesos para RSA (None = todos los núcleos)
+            hash_workers (Optional[int]): Hilos para SHA-256 (None = todos los núcleos)
+            
+        Returns:
+            SignatureBatch: Firmas contiguas y estado por mensaje
+        """
+        d, n, crt = self._signing_key(private_key)
+        digests, status = _hash_batch(messages, self._workers(hash_workers))
+        
+        step = SIGNATURE_BATCH_CHUNK * SHA256_DIGEST_SIZE
+        tasks = [(bytes(digests[start:start + step]), d, n, crt) for start in range(0, len(digests), step)]
+        signatures = bytearray().join(_run_chunks(_sign_chunk, tasks, self._workers(workers)))
+        
+        size = (n.bit_length() + 7) // 8
+        for index in range(len(status)):
+            if not status[index]:
+                signatures[index * size:(index + 1) * size] = bytes(size)
+        return SignatureBatch(signatures, status, size)
+    
+    @staticmethod
+    def _workers(workers: Optional[int]) -> int:
+        if workers is None:
+            return os.cpu_count() or 1
+        if workers < 1:
+            raise InvalidInputError("El número de procesos o hilos debe ser positivo")
+        return workers
+    
+    def verify_bytes(self, data: BytesLike, signature: BytesLike,
+                     public_key: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Verificar una firma binaria de datos binarios
+        
+        Args:
+            data (BytesLike): Datos originales
+            signature (BytesLike): Firma producida por sign_bytes
+            public_key (Optional[Tuple[int, int]]): Clave pública para verificar
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        return self.rsa.prepare_public_key(public_key).verify_bytes(data, signature)
+    
+    def verify_digest(self, digest: BytesLike, signature: BytesLike,
+                      public_key: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Verificar una firma sobre un hash SHA-256 ya calculado
+        
+        Args:
+            digest (BytesLike): Hash SHA-256 de 32 bytes
+            signature (BytesLike): Firma producida por sign_digest o sign_bytes
+            public_key (Optional[Tuple[int, int]]): Clave pública para verificar
+            
+        Returns:
+            bool: True si la firma es válida
+        """
+        return self.rsa.prepare_public_key(public_key).verify_digest(digest, signature)
+    
+    def sign_message(self, message: str, private_key: Optional[Tuple[int, int]] = None) -> str:
+        """
+        Firmar un mensaje
+        
+        Args:
+            message (str): Mensaje a firmar
+            private_key (Optional[Tuple[int, int]]): Clave privada para firmar
+            
+        Returns:
+            str: Firma digital en hexadecimal
+        """
+        if not message:
+            raise InvalidInputError("El mensaje no puede estar vacío")
+        
+        return self.sign_bytes(message.encode('utf-8'), private_key).hex()
     
     def verify_signature(self, message: str, signature_hex: str, public_key: Optional[Tuple[int, int]] = None) -> bool:
         """
@@ -734,54 +2014,115 @@ class DigitalSignature:
             raise InvalidInputError("El mensaje y la firma no pueden estar vacíos")
         
         try:
-            # Generar hash del mensaje
-            message_hash = self.hash_func.sha256_wrapper(message)
-            
             # Usar clave pública proporcionada o la generada
-            if public_key:
-                e, n = public_key
-            elif self.rsa.public_key:
-                e, n = self.rsa.public_key
-            else:
-                raise KeyGenerationError("No hay clave pública disponible")
+            key = self.rsa.prepare_public_key(public_key)
             
-            # Convertir firma a entero
-            signature = int(signature_hex, 16)
-            
-            # Verificar firma (descifrar con clave pública)
-            decrypted_hash = pow(signature, e, n)
-            
-            # Comparar hashes
-            return f"{decrypted_hash:x}" == message_hash
+            # Descifrar la firma con la clave pública y comparar con el hash
+            return key.verify(message, signature_hex)
         
         except Exception:
             return False
     
-    def sign_and_verify_demo(self, message: str) -> Dict[str, Any]:
+    def verify_batch(self, messages: Sequence[Union[str, BytesLike]],
+                     signatures: Union[SignatureBatch, Sequence[Union[str, BytesLike]]],
+                     public_key: Optional[Tuple[int, int]] = None, workers: Optional[int] = None,
+                     hash_workers: Optional[int] = None) -> bytearray:
+        """
+        Verificar muchas firmas hechas con la misma clave
+        
+        Como sign_batch: SHA-256 en un pool de hilos y exponenciaciones en
+        un pool de procesos.
+        
+        Args:
+            messages (Sequence[Union[str, BytesLike]]): Mensajes originales
+            signatures: Resultado de sign_batch, o una firma por mensaje en
+                bytes (byte_length bytes) o en hexadecimal
+            public_key (Optional[Tuple[int, int]]): Clave pública para verificar
+            workers (Optional[int]): Procesos para RSA (None = todos los núcleos)
+            hash_workers (Optional[int]): Hilos para SHA-256 (None = todos los núcleos)
+            
+        Returns:
+            bytearray: Un byte por mensaje: 1 si la firma es válida, 0 si no
+            lo es o la entrada está mal formada
+        """
+        key = self.rsa.prepare_public_key(public_key)
+        if isinstance(signatures, SignatureBatch):
+            values = [int.from_bytes(signatures.signatures[i * signatures.size:(i + 1) * signatures.size], 'big')
+                      if signatures.status[i] else 0 for i in range(len(signatures.status))]
+        else:
+            values = [self._signature_value(signature, key.byte_length) for signature in signatures]
+        if len(messages) != len(values):
+            raise InvalidInputError("Debe haber una firma por mensaje")
+        
+        digests, status = _hash_batch(messages, self._workers(hash_workers))
+        step = SIGNATURE_BATCH_CHUNK * SHA256_DIGEST_SIZE
+        tasks = [(bytes(digests[start:start + step]), values[start // SHA256_DIGEST_SIZE:(start + step) // SHA256_DIGEST_SIZE],
+                  key.e, key.n) for start in range(0, len(digests), step)]
+        results = bytearray().join(_run_chunks(_verify_chunk, tasks, self._workers(workers)))
+        
+        for index in range(len(status)):
+            results[index] &= status[index]
+        return results
+    
+    @staticmethod
+    def _signature_value(signature: Union[str, BytesLike], size: int) -> int:
+        """Firma como entero; 0 (nunca válida) si no es hexadecimal ni un buffer de `size` bytes"""
+        try:
+            if isinstance(signature, str):
+                return int(signature, 16)
+            view = memoryview(signature).cast('B')
+        except (TypeError, ValueError):
+            return 0
+        return int.from_bytes(view, 'big') if len(view) == size else 0
+    
+    def sign_and_verify_demo(self, message: str, key_size: int = 2048,
+                             ttl: Optional[float] = None) -> Dict[str, Any]:
         """
         Demostración completa de firma y verificación
         
+        Reutiliza el par de claves mientras no caduque (ver cached_keys) y
+        calcula el hash una sola vez para firmar, verificar y mostrarlo.
+        
         Args:
             message (str): Mensaje a firmar
+            key_size (int): Tamaño de clave en bits
+            ttl (Optional[float]): Vigencia de las claves (por defecto key_ttl)
             
         Returns:
-            Dict: Información completa del proceso
+            Dict: Información completa del proceso, con el tiempo en
+            milisegundos de cada etapa en "timings"
         """
-        # Generar claves
-        public_key, private_key = self.generate_keys()
+        if not message:
+            raise InvalidInputError("El mensaje no puede estar vacío")
+        
+        timings = {}
+        clock = time.perf_counter
+        
+        # Claves (reutilizadas si no han caducado)
+        start = clock()
+        created = self._keys_created
+        public_key, private_key = self.cached_keys(key_size, ttl)
+        reused = self._keys_created == created
+        timings["keys"] = (clock() - start) * 1e3
+        
+        # Hash del mensaje, compartido por las etapas siguientes
+        start = clock()
+        digest = hashlib.sha256(message.encode('utf-8')).digest()
+        timings["hash"] = (clock() - start) * 1e3
         
         # Firmar mensaje
-        signature = self.sign_message(message, private_key)
+        start = clock()
+        signature = self.sign_digest(digest, private_key)
+        timings["sign"] = (clock() - start) * 1e3
         
         # Verificar firma
-        is_valid = self.verify_signature(message, signature, public_key)
-        
-        # Generar hash del mensaje
-        message_hash = self.hash_func.sha256_wrapper(message)
+        start = clock()
+        is_valid = self.rsa.prepare_public_key(public_key).verify_digest(digest, signature)
+        timings["verify"] = (clock() - start) * 1e3
         
         return {
             "message": message,
-            "message_hash": message_hash,
+            "message_hash": digest.hex(),
             "public_key": {
                 "e": public_key[0],
                 "n": public_key[1]
@@ -790,20 +2131,30 @@ class DigitalSignature:
                 "d": private_key[0],
                 "n": private_key[1]
             },
-            "signature": signature,
+            "signature": signature.hex(),
             "verification": is_valid,
+            "keys_reused": reused,
+            "key_age": self.key_age(),
+            "timings": timings,
             "process_steps": [
                 "1. Generar hash SHA-256 del mensaje",
-                "2. Cifrar hash con clave privada (firmar)",
-                "3. Descifrar firma con clave pública",
-                "4. Comparar hash original con hash descifrado"
+                "2. Codificar el hash en un bloque PKCS#1 v1.5 del tamaño de n",
+                "3. Cifrar el bloque con clave privada (firmar)",
+                "4. Descifrar firma con clave pública",
+                "5. Comparar en bytes el bloque descifrado con el esperado"
             ]
         }
 
 # ===== EXPORTAR CLASES =====
 __all__ = [
     'RSACipher',
+    'PreparedPublicKey',
+    'prepare_public_key',
+    'pkcs1_encode',
     'CustomHash',
+    'DESContext',
+    'des_context',
     'DESCipher',
+    'SignatureBatch',
     'DigitalSignature'
 ]
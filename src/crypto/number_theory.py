@@ -0,0 +1,189 @@
+"""
+🔢 Teoría de Números - CryptoUNS
+==============================
+
+Funciones de aritmética modular sobre enteros grandes usadas por RSA
+y la firma digital:
+- Máximo común divisor y mínimo común múltiplo
+- Algoritmo extendido de Euclides (iterativo, sin recursión)
+- Inverso modular
+- Función de Carmichael λ(n)
+- Exponenciación privada por el teorema chino del resto (CRT)
+
+Todas las funciones son iterativas: el número de marcos de pila no crece
+con el tamaño de los operandos, por lo que módulos de 4096 bits no se
+acercan al límite de recursión de Python.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import math
+from typing import Tuple
+
+# (p, q, d mod (p - 1), d mod (q - 1), q⁻¹ mod p)
+CRTParams = Tuple[int, int, int, int, int]
+
+
+def gcd(a: int, b: int) -> int:
+    """
+    Calcular el máximo común divisor
+
+    Args:
+        a (int): Primer número
+        b (int): Segundo número
+
+    Returns:
+        int: MCD de a y b
+    """
+    return math.gcd(a, b)
+
+
+def lcm(a: int, b: int) -> int:
+    """
+    Calcular el mínimo común múltiplo
+
+    Args:
+        a (int): Primer número
+        b (int): Segundo número
+
+    Returns:
+        int: MCM de a y b (0 si alguno es 0)
+    """
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math.gcd(a, b) * b)
+
+
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    """
+    Algoritmo extendido de Euclides (versión iterativa)
+
+    Produce exactamente los mismos coeficientes que la versión recursiva
+    clásica ``egcd(a, b) = egcd(b % a, a)``, pero en un único marco.
+
+    Args:
+        a (int): Primer número
+        b (int): Segundo número
+
+    Returns:
+        Tuple[int, int, int]: (gcd, x, y) donde ax + by = gcd
+    """
+    # Invariantes: old_r = a*old_x + b*old_y  y  r = a*x + b*y
+    old_r, r = b, a
+    old_x, x = 0, 1
+    old_y, y = 1, 0
+
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+
+    return old_r, old_x, old_y
+
+
+def mod_inverse(a: int, m: int) -> int:
+    """
+    Calcular el inverso modular de a módulo m
+
+    Usa ``pow(a, -1, m)`` (implementado en C) y recurre al algoritmo
+    extendido de Euclides en intérpretes que no lo soportan.
+
+    Args:
+        a (int): Número base
+        m (int): Módulo
+
+    Returns:
+        int: Inverso modular en el rango [0, m)
+
+    Raises:
+        ValueError: Si el inverso no existe
+    """
+    if _HAS_POW_INVERSE:
+        try:
+            return pow(a, -1, m)
+        except ValueError:
+            raise ValueError("El inverso modular no existe")
+
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError("El inverso modular no existe")
+    return x % m
+
+
+def carmichael_lambda(*primes: int) -> int:
+    """
+    Calcular la función de Carmichael λ(n) para n libre de cuadrados
+
+    Para n = p·q (RSA) es λ(n) = mcm(p - 1, q - 1), un divisor de φ(n)
+    que produce exponentes privados más pequeños.
+
+    Args:
+        *primes (int): Factores primos distintos de n
+
+    Returns:
+        int: λ(n)
+    """
+    result = 1
+    for p in primes:
+        result = lcm(result, p - 1)
+    return result
+
+
+def crt_params(d: int, p: int, q: int) -> CRTParams:
+    """
+    Precalcular los parámetros CRT de una clave privada RSA
+
+    Args:
+        d (int): Exponente privado
+        p (int): Primer factor de n
+        q (int): Segundo factor de n
+
+    Returns:
+        CRTParams: (p, q, dp, dq, q_inv)
+    """
+    return p, q, d % (p - 1), d % (q - 1), mod_inverse(q, p)
+
+
+def crt_pow(value: int, params: CRTParams) -> int:
+    """
+    Calcular value^d mod n con dos exponenciaciones de la mitad de tamaño
+
+    Exponenciar módulo p y módulo q por separado y recombinar (Garner)
+    es unas 3-4 veces más rápido que pow(value, d, n).
+
+    Args:
+        value (int): Base, 0 <= value < n
+        params (CRTParams): Parámetros de crt_params()
+
+    Returns:
+        int: value^d mod n
+    """
+    p, q, dp, dq, q_inv = params
+    m1 = pow(value, dp, p)
+    m2 = pow(value, dq, q)
+    return m2 + q * ((m1 - m2) * q_inv % p)
+
+
+def _supports_pow_inverse() -> bool:
+    """Detectar soporte de exponente negativo en pow() (Python 3.8+)"""
+    try:
+        return pow(3, -1, 7) == 5
+    except (TypeError, ValueError):
+        return False
+
+
+_HAS_POW_INVERSE = _supports_pow_inverse()
+
+# ===== EXPORTAR FUNCIONES =====
+__all__ = [
+    'gcd',
+    'lcm',
+    'extended_gcd',
+    'mod_inverse',
+    'carmichael_lambda',
+    'crt_params',
+    'crt_pow'
+]
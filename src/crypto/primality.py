@@ -0,0 +1,264 @@
+"""
+🔍 Tests de Primalidad - CryptoUNS
+================================
+
+Subsistema de primalidad usado en la generación de claves RSA:
+- Camino rápido para n pequeños: división por ``SMALL_PRIMES`` y
+  Miller-Rabin con bases fijas (determinista para n < 3.3·10^24)
+- Miller-Rabin con número de rondas según el tamaño del candidato
+- Test de Baillie-PSW (Miller-Rabin base 2 + Lucas fuerte) opcional
+
+El número de rondas adaptativo se obtiene de la cota de Damgård,
+Landrock y Pomerance para candidatos *aleatorios* impares de k bits, la
+misma en la que se basan las tablas del apéndice C de FIPS 186-4. Para
+números elegidos por un adversario conviene fijar las rondas o usar
+Baillie-PSW.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional
+
+# Importar constantes
+try:
+    from ..utils.constants import *
+    from .random_source import RandomSource, get_default_random
+except ImportError:
+    # Importación absoluta para cuando se ejecuta directamente
+    import sys
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from utils.constants import *
+    from crypto.random_source import RandomSource, get_default_random
+
+# ===== PARÁMETROS =====
+MILLER_RABIN = "miller-rabin"
+BAILLIE_PSW = "baillie-psw"
+PRIMALITY_TESTS = [MILLER_RABIN, BAILLIE_PSW]
+
+# Probabilidad de error objetivo: 2^-100 para candidatos aleatorios
+DEFAULT_ERROR_BITS = 100
+
+# Con estas bases Miller-Rabin es determinista para n < 3317044064679887385961981
+_DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+_SMALL_PRIMES = tuple(SMALL_PRIMES)
+_SMALL_PRIMES_SET = frozenset(SMALL_PRIMES)
+_TRIAL_LIMIT = SMALL_PRIMES[-1] ** 2
+# Producto de los primos pequeños impares: un único gcd reemplaza la división uno a uno
+_SMALL_PRIMES_PRODUCT = math.prod(_SMALL_PRIMES[1:])
+
+
+@lru_cache(maxsize=None)
+def miller_rabin_rounds(bits: int, error_bits: int = DEFAULT_ERROR_BITS) -> int:
+    """
+    Rondas de Miller-Rabin necesarias para un candidato aleatorio de k bits
+
+    Usa la cota p(k, t) ≤ k^(3/2) · 2^t · t^(-1/2) · 4^(2 - sqrt(t·k)),
+    válida para k ≥ 21 y 3 ≤ t ≤ k/9; fuera de ese rango se usa la cota
+    general 4^(-t).
+
+    Args:
+        bits (int): Tamaño del candidato en bits
+        error_bits (int): Probabilidad de error objetivo 2^(-error_bits)
+
+    Returns:
+        int: Número de rondas
+    """
+    worst_case = (error_bits + 1) // 2
+    if bits < 21:
+        return worst_case
+
+    for t in range(3, min(bits // 9, worst_case) + 1):
+        log2_bound = (1.5 * math.log2(bits) + t - 0.5 * math.log2(t)
+                      + 2 * (2 - math.sqrt(t * bits)))
+        if log2_bound <= -error_bits:
+            return t
+    return worst_case
+
+
+def _trial_division(n: int) -> Optional[bool]:
+    """
+    Descartar candidatos con factores pequeños
+
+    Returns:
+        Optional[bool]: True/False si se decidió, None si hace falta un test fuerte
+    """
+    if n < 2:
+        return False
+    if n in _SMALL_PRIMES_SET:
+        return True
+    if n & 1 == 0 or math.gcd(n, _SMALL_PRIMES_PRODUCT) != 1:
+        return False
+    if n < _TRIAL_LIMIT:
+        return True
+    return None
+
+
+def _decompose(n: int):
+    """Escribir n - 1 como d · 2^r con d impar"""
+    d = n - 1
+    r = (d & -d).bit_length() - 1
+    return d >> r, r
+
+
+def _strong_probable_prime(n: int, a: int, d: int, r: int) -> bool:
+    """Una ronda de Miller-Rabin con base a"""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(r - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def miller_rabin(n: int, rounds: Optional[int] = None, rng: Optional[RandomSource] = None) -> bool:
+    """
+    Test de Miller-Rabin con bases aleatorias
+
+    Args:
+        n (int): Número impar mayor que 3 a verificar
+        rounds (Optional[int]): Rondas; None = según el tamaño de n
+        rng (Optional[RandomSource]): Fuente de las bases aleatorias
+
+    Returns:
+        bool: True si es probablemente primo
+    """
+    if rounds is None:
+        rounds = miller_rabin_rounds(n.bit_length())
+    rng = rng if rng is not None else get_default_random()
+
+    d, r = _decompose(n)
+    for _ in range(rounds):
+        if not _strong_probable_prime(n, rng.randrange(2, n - 1), d, r):
+            return False
+    return True
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Símbolo de Jacobi (a/n) para n impar positivo"""
+    a %= n
+    result = 1
+    while a:
+        while a & 1 == 0:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_lucas(n: int) -> bool:
+    """
+    Test de Lucas fuerte con parámetros de Selfridge (método A)
+
+    Args:
+        n (int): Número impar mayor que 3 que no es cuadrado perfecto
+
+    Returns:
+        bool: True si n es un primo probable de Lucas fuerte
+    """
+    # Buscar D en 5, -7, 9, -11, ... con (D/n) = -1
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # n + 1 = d · 2^s con d impar
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    # Calcular U_d, V_d y Q^d recorriendo los bits de d
+    U, V, Qk = 1, P, Q % n
+    inv2 = (n + 1) // 2
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = (P * U + V) * inv2 % n, (D * U + P * V) * inv2 % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def baillie_psw(n: int) -> bool:
+    """
+    Test de Baillie-PSW (sin contraejemplos conocidos)
+
+    Args:
+        n (int): Número impar mayor que 3 sin factores pequeños
+
+    Returns:
+        bool: True si es probablemente primo
+    """
+    d, r = _decompose(n)
+    if not _strong_probable_prime(n, 2, d, r):
+        return False
+    if math.isqrt(n) ** 2 == n:
+        return False
+    return strong_lucas(n)
+
+
+def is_probable_prime(n: int, rounds: Optional[int] = None, rng: Optional[RandomSource] = None,
+                      method: str = MILLER_RABIN) -> bool:
+    """
+    Decidir si n es (probablemente) primo
+
+    Args:
+        n (int): Número a verificar
+        rounds (Optional[int]): Rondas de Miller-Rabin; None = según el tamaño
+        rng (Optional[RandomSource]): Fuente de las bases aleatorias
+        method (str): "miller-rabin" o "baillie-psw"
+
+    Returns:
+        bool: True si es primo (exacto para n < 3.3·10^24) o probablemente primo
+    """
+    if method not in PRIMALITY_TESTS:
+        raise ValueError(f"Test de primalidad no soportado: {method}")
+
+    decided = _trial_division(n)
+    if decided is not None:
+        return decided
+
+    if n < _DETERMINISTIC_LIMIT:
+        d, r = _decompose(n)
+        return all(_strong_probable_prime(n, a, d, r) for a in _DETERMINISTIC_BASES)
+
+    if method == BAILLIE_PSW:
+        return baillie_psw(n)
+    return miller_rabin(n, rounds, rng)
+
+# ===== EXPORTAR FUNCIONES =====
+__all__ = [
+    'MILLER_RABIN',
+    'BAILLIE_PSW',
+    'PRIMALITY_TESTS',
+    'miller_rabin_rounds',
+    'miller_rabin',
+    'strong_lucas',
+    'baillie_psw',
+    'is_probable_prime'
+]
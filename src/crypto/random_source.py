@@ -0,0 +1,168 @@
+"""
+🎲 Fuentes de Aleatoriedad - CryptoUNS
+====================================
+
+Capa de generación de números aleatorios usada por la generación de
+claves (RSA, firma digital) y de claves clásicas:
+- Modo del sistema (por defecto): basado en ``secrets``/``os.urandom``
+- Modo determinista: semilla explícita para benchmarks reproducibles
+- Flujos derivados: una instancia independiente por hilo o trabajador
+
+Ejemplo de uso reproducible::
+
+    rng = RandomSource(seed=2025)
+    rsa = RSACipher(2048, rng=rng)
+    rsa.generate_keys()            # Mismas claves en cada ejecución
+
+    workers = [rng.spawn(i) for i in range(4)]   # Un flujo por hilo
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import hashlib
+import random
+import secrets
+from typing import Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class RandomSource:
+    """
+    Fuente de números aleatorios intercambiable
+
+    Sin semilla usa el generador criptográfico del sistema operativo; con
+    semilla usa ``random.Random`` y produce siempre la misma secuencia.
+    Cada instancia tiene su propio estado, por lo que hilos distintos no
+    comparten (ni se pisan) el estado de un generador global.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inicializar fuente de aleatoriedad
+
+        Args:
+            seed (Optional[int]): Semilla para el modo determinista
+        """
+        self.seed = seed
+        self._rng = secrets.SystemRandom() if seed is None else random.Random(seed)
+
+    @property
+    def deterministic(self) -> bool:
+        """True si la secuencia es reproducible"""
+        return self.seed is not None
+
+    def getrandbits(self, bits: int) -> int:
+        """
+        Obtener un entero aleatorio de ``bits`` bits
+
+        Args:
+            bits (int): Número de bits
+
+        Returns:
+            int: Entero en el rango [0, 2^bits)
+        """
+        return self._rng.getrandbits(bits)
+
+    def randrange(self, start: int, stop: int) -> int:
+        """
+        Obtener un entero aleatorio en [start, stop)
+
+        Args:
+            start (int): Límite inferior (incluido)
+            stop (int): Límite superior (excluido)
+
+        Returns:
+            int: Entero aleatorio
+        """
+        return self._rng.randrange(start, stop)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        Elegir un elemento aleatorio de una secuencia
+
+        Args:
+            seq (Sequence[T]): Secuencia no vacía
+
+        Returns:
+            T: Elemento elegido
+        """
+        return self._rng.choice(seq)
+
+    def token_bytes(self, length: int) -> bytes:
+        """
+        Obtener bytes aleatorios
+
+        Args:
+            length (int): Número de bytes
+
+        Returns:
+            bytes: Bytes aleatorios
+        """
+        if self.seed is None:
+            return secrets.token_bytes(length)
+        return self._rng.getrandbits(length * 8).to_bytes(length, 'big')
+
+    def spawn(self, stream: int) -> 'RandomSource':
+        """
+        Derivar una fuente independiente (por ejemplo, una por hilo)
+
+        En modo determinista la semilla hija depende solo de la semilla
+        padre y del número de flujo, de modo que el resultado no varía
+        con el orden en que se planifiquen los hilos.
+
+        Args:
+            stream (int): Identificador del flujo derivado
+
+        Returns:
+            RandomSource: Nueva fuente con estado propio
+        """
+        if self.seed is None:
+            return RandomSource()
+
+        material = f"{self.seed}:{stream}".encode('utf-8')
+        child_seed = int.from_bytes(hashlib.sha256(material).digest()[:16], 'big')
+        return RandomSource(child_seed)
+
+    def __repr__(self) -> str:
+        mode = f"seed={self.seed}" if self.deterministic else "system"
+        return f"RandomSource({mode})"
+
+
+_default_source = RandomSource()
+
+
+def get_default_random() -> RandomSource:
+    """
+    Obtener la fuente de aleatoriedad por defecto de la aplicación
+
+    Returns:
+        RandomSource: Fuente por defecto (del sistema salvo que se cambie)
+    """
+    return _default_source
+
+
+def set_default_random(source: Optional[RandomSource] = None) -> RandomSource:
+    """
+    Reemplazar la fuente por defecto (None restaura la del sistema)
+
+    Solo afecta a los objetos creados después de la llamada.
+
+    Args:
+        source (Optional[RandomSource]): Nueva fuente por defecto
+
+    Returns:
+        RandomSource: Fuente por defecto activa
+    """
+    global _default_source
+    _default_source = source if source is not None else RandomSource()
+    return _default_source
+
+# ===== EXPORTAR CLASES =====
+__all__ = [
+    'RandomSource',
+    'get_default_random',
+    'set_default_random'
+]
@@ -14,9 +14,10 @@ Versión: 1.0.0
 
 import heapq
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, NamedTuple, Union, Iterable, Callable, BinaryIO, TextIO
 import json
-import hashlib
+import struct
+import tempfile
 import time
 import os
 
@@ -24,6 +25,7 @@ import os
 try:
     from ..utils.constants import *
     from ..utils.exceptions import *
+    from . import hashing
 except ImportError:
     # Importación absoluta para cuando se ejecuta directamente
     import sys
@@ -31,8 +33,75 @@ except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     from utils.constants import *
     from utils.exceptions import *
+    from crypto import hashing
 
 # ===== CODIFICACIÓN HUFFMAN =====
+# Caracteres que se empaquetan por iteración (acota las cadenas temporales)
+HUFFMAN_PACK_CHUNK = 64 * 1024
+# Bits que indexan la tabla principal del decodificador (2^k entradas)
+HUFFMAN_TABLE_BITS = 12
+# Bits a partir de los cuales decode usa el kernel NumPy (si está disponible)
+HUFFMAN_VECTOR_MIN_BITS = 1 << 16
+# Contenedor autodescriptivo: cabecera, pares (símbolo, longitud) y bits empaquetados
+HUFFMAN_MAGIC = b"CUHF"
+HUFFMAN_FORMAT_VERSION = 1
+HUFFMAN_KIND_TEXT = 0  # símbolos = puntos de código Unicode
+HUFFMAN_KIND_BYTES = 1  # símbolos = valores de byte (0-255)
+HUFFMAN_HEADER = struct.Struct(">4sBBIQ")  # magic, versión, tipo, nº de símbolos, bits válidos
+HUFFMAN_SYMBOL = struct.Struct(">IB")  # símbolo, longitud de su código canónico
+# Caracteres por lectura y bytes por escritura en los modos de archivo
+HUFFMAN_STREAM_CHUNK = 1024 * 1024
+# Caracteres por bloque en el modo de una pasada (cada bloque lleva su tabla)
+HUFFMAN_BLOCK_SIZE = 1024 * 1024
+
+
+def _huffman_kernels():
+    """Importar huffman_kernels bajo demanda (NumPy es opcional)"""
+    try:
+        from . import huffman_kernels
+    except ImportError:
+        from crypto import huffman_kernels
+    return huffman_kernels
+
+
+class HuffmanBits(NamedTuple):
+    """
+    Salida empaquetada del codificador Huffman: los bits en orden dentro
+    de cada byte (el primero en el bit más significativo) y el número de
+    bits válidos; los bits de relleno del último byte son cero
+    """
+    data: bytearray
+    bit_length: int
+    
+    @classmethod
+    def from_string(cls, bits: str) -> 'HuffmanBits':
+        """
+        Empaquetar una cadena de '0'/'1'
+        
+        Args:
+            bits (str): Bits como texto (vista de depuración)
+            
+        Returns:
+            HuffmanBits: Bits empaquetados
+        """
+        if bits.strip("01"):
+            raise InvalidInputError("El texto codificado solo puede contener '0' y '1'")
+        padding = -len(bits) % 8
+        data = bytearray(int(bits + "0" * padding, 2).to_bytes((len(bits) + padding) // 8, 'big')) if bits else bytearray()
+        return cls(data, len(bits))
+    
+    def to_string(self) -> str:
+        """
+        Vista de depuración: los bits como cadena de '0'/'1'
+        
+        Returns:
+            str: bit_length caracteres '0'/'1'
+        """
+        if not self.bit_length:
+            return ""
+        return format(int.from_bytes(self.data, 'big'), f"0{len(self.data) * 8}b")[:self.bit_length]
+
+
 class Node:
     """Nodo para el árbol de Huffman"""
     
@@ -58,6 +127,8 @@ class HuffmanCoding:
         self.root = None
         self.codes = {}
         self.reverse_codes = {}
+        self._decode_table = None  # (raíz, k, tabla, bits necesarios por consulta)
+        self._kernel_table = None  # (raíz, tabla del kernel NumPy o None si no aplica)
     
     def build_frequency_table(self, text: str) -> Dict[str, int]:
         """
@@ -143,7 +214,67 @@ class HuffmanCoding:
         dfs(root, "")
         return codes
     
-    def encode(self, text: str) -> Tuple[str, Dict[str, str], Node]:
+    @staticmethod
+    def canonical_codes(lengths: Dict[str, int]) -> Dict[str, str]:
+        """
+        Asignar códigos canónicos a partir de las longitudes
+        
+        Los símbolos se ordenan por (longitud, símbolo) y reciben códigos
+        consecutivos; basta con guardar las longitudes para reconstruirlos.
+        
+        Args:
+            lengths (Dict[str, int]): Longitud del código de cada carácter
+            
+        Returns:
+            Dict[str, str]: Código canónico de cada carácter (en ese orden)
+        """
+        codes = {}
+        code = previous = 0
+        for char, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+            code <<= length - previous
+            codes[char] = format(code, f"0{length}b")
+            code += 1
+            previous = length
+        return codes
+    
+    @staticmethod
+    def build_tree_from_codes(codes: Dict[str, str], frequency: Optional[Dict[str, int]] = None) -> Node:
+        """
+        Reconstruir el árbol de decodificación a partir de los códigos
+        
+        Args:
+            codes (Dict[str, str]): Código de cada carácter (libre de prefijos)
+            frequency (Optional[Dict[str, int]]): Frecuencias para los nodos (visualización)
+            
+        Returns:
+            Node: Raíz del árbol
+        """
+        root = Node()
+        for char, code in codes.items():
+            node = root
+            for bit in code:
+                if node.char is not None:
+                    raise HuffmanError("Los códigos no son libres de prefijos", "tree")
+                branch = "right" if bit == "1" else "left"
+                if getattr(node, branch) is None:
+                    setattr(node, branch, Node())
+                node = getattr(node, branch)
+            if node.char is not None or node.left or node.right:
+                raise HuffmanError("Los códigos no son libres de prefijos", "tree")
+            node.char = char
+            node.freq = frequency.get(char, 0) if frequency else 0
+        
+        def total(node: Optional[Node]) -> int:
+            if node is None:
+                return 0
+            if node.char is None:
+                node.freq = total(node.left) + total(node.right)
+            return node.freq
+        
+        total(root)
+        return root
+    
+    def encode(self, text: str) -> Tuple[HuffmanBits, Dict[str, str], Node]:
         """
         Codificar texto usando Huffman
         
@@ -151,7 +282,8 @@ class HuffmanCoding:
             text (str): Texto a codificar
             
         Returns:
-            Tuple[str, Dict[str, str], Node]: (texto_codificado, códigos, árbol)
+            Tuple[HuffmanBits, Dict[str, str], Node]: (bits empaquetados, códigos, árbol);
+            ``HuffmanBits.to_string()`` da la vista en '0'/'1'
         """
         if not text:
             raise InvalidInputError("El texto no puede estar vacío")
@@ -159,35 +291,116 @@ class HuffmanCoding:
         # Construir tabla de frecuencias
         frequency = self.build_frequency_table(text)
         
+        # Construir árbol y códigos
+        self.assign_codes(frequency)
+        
+        return self.pack(text, self.codes), self.codes, self.root
+    
+    def assign_codes(self, frequency: Dict[str, int]) -> Dict[str, str]:
+        """
+        Construir el árbol y los códigos canónicos a partir de frecuencias
+        
+        Args:
+            frequency (Dict[str, int]): Frecuencia de cada carácter
+            
+        Returns:
+            Dict[str, str]: Códigos canónicos (también en self.codes; el árbol en self.root)
+        """
         # Construir heap
         heap = self.build_heap(frequency)
         
         # Construir árbol
-        self.root = self.build_tree(heap)
+        tree = self.build_tree(heap)
         
-        # Construir códigos
-        self.codes = self.build_codes(self.root)
+        # Códigos canónicos: del árbol solo se conservan las longitudes
+        lengths = {char: len(code) for char, code in self.build_codes(tree).items()}
+        self.codes = self.canonical_codes(lengths)
+        self.root = self.build_tree_from_codes(self.codes, frequency)
         self.reverse_codes = {v: k for k, v in self.codes.items()}
+        return self.codes
+    
+    @staticmethod
+    def pack(text: str, codes: Dict[str, str]) -> HuffmanBits:
+        """
+        Empaquetar el texto con una tabla de códigos
         
-        # Codificar texto
-        encoded_text = ""
-        for char in text:
-            encoded_text += self.codes[char]
+        Args:
+            text (str): Texto a codificar
+            codes (Dict[str, str]): Código de cada carácter
+            
+        Returns:
+            HuffmanBits: Bits empaquetados
+        """
+        data = bytearray()
+        bit_length = HuffmanCoding.pack_chunks((text,), codes, data.extend)
+        return HuffmanBits(data, bit_length)
+    
+    @staticmethod
+    def pack_chunks(chunks: Iterable[str], codes: Dict[str, str], write: Callable[[bytes], Any]) -> int:
+        """
+        Empaquetar una secuencia de tramos de texto entregando bytes completos
         
-        return encoded_text, self.codes, self.root
+        Cada tramo se traduce en C (str.translate) a su cadena de bits y
+        se convierte a bytes de una vez; solo los bits que no completan un
+        byte pasan al tramo siguiente, así que la memoria no depende del
+        total. El último byte se completa con ceros.
+        
+        Args:
+            chunks (Iterable[str]): Tramos del texto, en orden
+            codes (Dict[str, str]): Código de cada carácter
+            write (Callable[[bytes], Any]): Destino de los bytes (p. ej. file.write)
+            
+        Returns:
+            int: Bits válidos escritos
+        """
+        table = str.maketrans(codes)
+        # Borra los caracteres con código: lo que quede no tiene código
+        # (translate dejaría pasar un '0', '1' o '_' literal como si fueran bits)
+        coded = dict.fromkeys(map(ord, codes))
+        carry = ""
+        written = 0
+        for chunk in chunks:
+            for start in range(0, len(chunk), HUFFMAN_PACK_CHUNK):
+                piece = chunk[start:start + HUFFMAN_PACK_CHUNK]
+                if piece.translate(coded):
+                    raise HuffmanError("El texto contiene caracteres sin código", "pack")
+                bits = carry + piece.translate(table)
+                whole = len(bits) & ~7
+                if whole:
+                    write(int(bits[:whole], 2).to_bytes(whole >> 3, 'big'))
+                    written += whole
+                carry = bits[whole:]
+        if carry:
+            write(bytes([int(carry.ljust(8, "0"), 2)]))
+        return written + len(carry)
     
-    def decode(self, encoded_text: str, root: Optional[Node] = None) -> str:
+    def decode(self, encoded: Union[HuffmanBits, str], root: Optional[Node] = None,
+               table_bits: int = HUFFMAN_TABLE_BITS, vectorized: Optional[bool] = None) -> str:
         """
         Decodificar texto usando Huffman
         
+        Cada consulta a una tabla indexada por los siguientes `table_bits`
+        bits resuelve todos los símbolos completos que caben en ellos; los
+        códigos más largos siguen en tablas secundarias. Solo los últimos
+        bits (menos que una consulta) recorren el árbol uno a uno.
+        
+        Con NumPy disponible y al menos ``HUFFMAN_VECTOR_MIN_BITS`` bits
+        usa ``huffman_kernels`` (segmentos decodificados en bloque). El
+        resultado es el mismo.
+        
         Args:
-            encoded_text (str): Texto codificado
+            encoded (Union[HuffmanBits, str]): Bits empaquetados o su vista en '0'/'1'
             root (Optional[Node]): Raíz del árbol (opcional)
+            table_bits (int): Bits por consulta de la tabla principal (1-16)
+            vectorized (Optional[bool]): Forzar (True) o desactivar (False) el kernel; None = automático
             
         Returns:
             str: Texto decodificado
         """
-        if not encoded_text:
+        if isinstance(encoded, str):
+            encoded = HuffmanBits.from_string(encoded)
+        
+        if not encoded.bit_length:
             return ""
         
         if root is None:
@@ -196,47 +409,613 @@ class HuffmanCoding:
         if not root:
             raise InvalidInputError("No hay árbol de Huffman disponible")
         
-        decoded_text = ""
-        current_node = root
+        if not 1 <= table_bits <= 16:
+            raise InvalidInputError("table_bits debe estar entre 1 y 16")
         
-        for bit in encoded_text:
-            if bit == "0":
-                current_node = current_node.left
-            elif bit == "1":
-                current_node = current_node.right
-            else:
-                raise InvalidInputError(f"Bit inválido en texto codificado: {bit}")
+        if vectorized is None:
+            vectorized = encoded.bit_length >= HUFFMAN_VECTOR_MIN_BITS
+        if vectorized:
+            kernel_table = self._vector_table(root)
+            if kernel_table is not None:
+                return _huffman_kernels().decode(kernel_table, encoded.data, encoded.bit_length)
+        
+        text, _ = self._decode_span(encoded.data, 0, encoded.bit_length, root, table_bits, True)
+        return text
+    
+    def _decode_span(self, data: Union[bytes, bytearray], start: int, total: int, root: Node,
+                     table_bits: int, final: bool) -> Tuple[str, int]:
+        """
+        Decodificar los bits [start, total) con las tablas de k bits
+        
+        Si `final` es False se detiene antes del último código que podría
+        quedar incompleto y devuelve hasta dónde llegó (decodificación por
+        tramos); si es True decodifica hasta el final.
+        
+        Returns:
+            Tuple[str, int]: (texto, bits consumidos desde el inicio de `data`)
+        """
+        table, window = self._lookup_table(root, table_bits)
+        
+        # Palabras de 64 bits con una de ceros al final: las recargas nunca se salen
+        data = bytes(data)
+        data += bytes(-len(data) % 8 + 8)
+        words = struct.unpack(f">{len(data) // 8}Q", data)
+        
+        decoded = []
+        append = decoded.append
+        mask = (1 << table_bits) - 1
+        index, skip = divmod(start, 64)
+        acc = words[index] & ((1 << (64 - skip)) - 1)
+        nacc = 64 - skip
+        index += 1
+        consumed = start
+        limit = total - window
+        
+        while consumed <= limit:
+            while nacc < window:
+                acc = ((acc & ((1 << nacc) - 1)) << 64) | words[index]
+                index += 1
+                nacc += 64
+            text, used = table[(acc >> (nacc - table_bits)) & mask]
+            while text is None:
+                # Código más largo que la consulta: seguir en la tabla secundaria
+                if used is None:
+                    raise InvalidInputError("Secuencia de bits inválida para este árbol")
+                sub, bits, offset = used
+                text, used = sub[(acc >> (nacc - offset - bits)) & ((1 << bits) - 1)]
+            append(text)
+            nacc -= used
+            consumed += used
+        
+        if not final:
+            return "".join(decoded), consumed
+        
+        # Últimos bits: recorrer el árbol bit a bit
+        first = consumed // 8
+        tail = data[first:(total + 7) // 8]
+        bits = format(int.from_bytes(tail, 'big'), f"0{len(tail) * 8}b")[consumed - first * 8:total - first * 8]
+        current_node = root
+        for bit in bits:
+            current_node = current_node.left if bit == "0" else current_node.right
+            if current_node is None:
+                raise InvalidInputError("Secuencia de bits inválida para este árbol")
             
             # Si llegamos a una hoja
             if current_node.char is not None:
-                decoded_text += current_node.char
+                append(current_node.char)
                 current_node = root
         
-        return decoded_text
+        if current_node is not root:
+            raise InvalidInputError("Los bits terminan a mitad de un código")
+        
+        return "".join(decoded), total
+    
+    def _lookup_table(self, root: Node, table_bits: int) -> Tuple[list, int]:
+        """Tabla de decodificación del árbol (se reutiliza mientras no cambien el árbol ni k)"""
+        cached = self._decode_table
+        if cached is not None and cached[0] is root and cached[1] == table_bits:
+            return cached[2], cached[3]
+        
+        # Profundidad de cada subárbol, calculada una sola vez por nodo
+        depths = {}
+        
+        def depth(node: Node) -> int:
+            if node is None or node.char is not None:
+                return 0
+            if node not in depths:
+                depths[node] = 1 + max(depth(node.left), depth(node.right))
+            return depths[node]
+        
+        def build(start: Node, bits: int, offset: int, multi: bool) -> list:
+            # Entradas (texto, bits usados desde el inicio del símbolo); (None, (tabla, bits, desplazamiento))
+            # si el código sigue más allá de la consulta y (None, None) si los bits no llevan a ninguna hoja
+            table = []
+            for value in range(1 << bits):
+                node, symbols, used = start, [], 0
+                for position in range(bits):
+                    node = node.right if (value >> (bits - 1 - position)) & 1 else node.left
+                    if node is None:
+                        break
+                    if node.char is not None:
+                        symbols.append(node.char)
+                        used = position + 1
+                        if not multi:
+                            break
+                        node = root
+                if symbols:
+                    table.append(("".join(symbols), offset + used))
+                elif node is None:
+                    table.append((None, None))
+                else:
+                    sub_bits = min(depth(node), table_bits)
+                    table.append((None, (build(node, sub_bits, offset + bits, False), sub_bits, offset + bits)))
+            return table
+        
+        table = build(root, table_bits, 0, True)
+        window = max(table_bits, depth(root))
+        self._decode_table = (root, table_bits, table, window)
+        return table, window
+    
+    def _vector_table(self, root: Node):
+        """Tabla del kernel NumPy para el árbol, o None si no aplica (se reutiliza por árbol)"""
+        cached = self._kernel_table
+        if cached is not None and cached[0] is root:
+            return cached[1]
+        
+        huffman_kernels = _huffman_kernels()
+        codes = self.build_codes(root)
+        table = huffman_kernels.build_table(codes) if huffman_kernels.supported(codes) else None
+        self._kernel_table = (root, table)
+        return table
+    
+    def pack_container(self, encoded: HuffmanBits, codes: Optional[Dict[str, str]] = None,
+                       kind: int = HUFFMAN_KIND_TEXT) -> bytes:
+        """
+        Serializar bits y códigos en un contenedor autodescriptivo
+        
+        Formato::
+        
+            HUFFMAN_HEADER | n × HUFFMAN_SYMBOL (símbolo, longitud) | bits empaquetados
+        
+        Solo se guardan las longitudes: los códigos canónicos se
+        reconstruyen al leer, sin necesidad del árbol.
+        
+        Args:
+            encoded (HuffmanBits): Bits empaquetados
+            codes (Optional[Dict[str, str]]): Códigos canónicos (por defecto, los últimos)
+            kind (int): HUFFMAN_KIND_TEXT o HUFFMAN_KIND_BYTES
+            
+        Returns:
+            bytes: Contenedor
+        """
+        codes = self.codes if codes is None else codes
+        if not codes:
+            raise HuffmanError("No hay códigos de Huffman disponibles", "pack")
+        if self.canonical_codes({char: len(code) for char, code in codes.items()}) != codes:
+            raise HuffmanError("Los códigos no son canónicos", "pack")
+        
+        return self._container_header(codes, encoded.bit_length, kind) + bytes(encoded.data)
+    
+    @staticmethod
+    def _container_header(codes: Dict[str, str], bit_length: int, kind: int = HUFFMAN_KIND_TEXT) -> bytes:
+        """Cabecera y tabla de longitudes de un contenedor"""
+        parts = [HUFFMAN_HEADER.pack(HUFFMAN_MAGIC, HUFFMAN_FORMAT_VERSION, kind, len(codes), bit_length)]
+        parts.extend(HUFFMAN_SYMBOL.pack(ord(char), len(code)) for char, code in codes.items())
+        return b"".join(parts)
     
-    def get_compression_stats(self, original_text: str, encoded_text: str) -> Dict[str, Any]:
+    def unpack_container(self, blob: bytes, kind: int = HUFFMAN_KIND_TEXT) -> Tuple[HuffmanBits, Dict[str, str]]:
+        """
+        Leer un contenedor de pack_container
+        
+        Args:
+            blob (bytes): Contenedor
+            kind (int): Tipo de símbolos esperado
+            
+        Returns:
+            Tuple[HuffmanBits, Dict[str, str]]: (bits empaquetados, códigos canónicos)
+        """
+        codes, bit_length, payload, found = self._unpack_header(blob)
+        if found != kind:
+            raise HuffmanError("El contenedor no tiene el tipo de símbolos esperado", "unpack")
+        if len(blob) != payload + (bit_length + 7) // 8:
+            raise HuffmanError("Contenedor Huffman truncado", "unpack")
+        return HuffmanBits(bytearray(blob[payload:]), bit_length), codes
+    
+    def _unpack_header(self, blob: bytes) -> Tuple[Dict[str, str], int, int, int]:
+        """
+        Leer la cabecera y la tabla de longitudes de un contenedor
+        
+        Returns:
+            Tuple[Dict[str, str], int, int, int]: (códigos canónicos, bits válidos,
+            inicio de los datos, tipo de símbolos)
+        """
+        try:
+            magic, version, kind, count, bit_length = HUFFMAN_HEADER.unpack_from(blob, 0)
+        except struct.error:
+            raise HuffmanError("Contenedor Huffman truncado", "unpack")
+        if magic != HUFFMAN_MAGIC or version != HUFFMAN_FORMAT_VERSION or \
+                kind not in (HUFFMAN_KIND_TEXT, HUFFMAN_KIND_BYTES):
+            raise HuffmanError("El contenedor no es de codificación Huffman compatible", "unpack")
+        
+        offset = HUFFMAN_HEADER.size
+        payload = offset + count * HUFFMAN_SYMBOL.size
+        if len(blob) < payload:
+            raise HuffmanError("Contenedor Huffman truncado", "unpack")
+        
+        lengths = {}
+        limit = 0xFF if kind == HUFFMAN_KIND_BYTES else 0x10FFFF
+        for symbol, length in HUFFMAN_SYMBOL.iter_unpack(blob[offset:payload]):
+            if symbol > limit or not length or chr(symbol) in lengths:
+                raise HuffmanError("Tabla de longitudes inválida", "unpack")
+            lengths[chr(symbol)] = length
+        if sum(2.0 ** -length for length in lengths.values()) > 1:
+            raise HuffmanError("Tabla de longitudes inválida", "unpack")
+        
+        return self.canonical_codes(lengths), bit_length, payload, kind
+    
+    def compress(self, text: str) -> bytes:
+        """
+        Codificar texto directamente al contenedor portátil
+        
+        Args:
+            text (str): Texto a codificar
+            
+        Returns:
+            bytes: Contenedor (ver pack_container)
+        """
+        encoded, codes, _ = self.encode(text)
+        return self.pack_container(encoded, codes)
+    
+    def decompress(self, blob: bytes) -> str:
+        """
+        Decodificar un contenedor sin necesidad del árbol original
+        
+        Args:
+            blob (bytes): Contenedor de pack_container/compress
+            
+        Returns:
+            str: Texto decodificado
+        """
+        encoded, codes = self.unpack_container(blob)
+        return self.decode(encoded, self.build_tree_from_codes(codes))
+    
+    def encode_file(self, input_path: str, output_path: str, one_pass: bool = False,
+                    block_size: int = HUFFMAN_BLOCK_SIZE) -> Dict[str, Any]:
+        """
+        Comprimir un archivo de texto UTF-8 con memoria acotada
+        
+        Por defecto hace dos pasadas por tramos: la primera cuenta las
+        frecuencias y la segunda empaqueta los bits directamente en un
+        único contenedor (la cabecera se completa al final). Con
+        `one_pass` usa encode_stream: bloques independientes, cada uno con
+        su tabla, para entradas que no pueden releerse. La salida se
+        escribe en un temporal que reemplaza al destino solo al terminar.
+        
+        Args:
+            input_path (str): Archivo de texto
+            output_path (str): Archivo comprimido
+            one_pass (bool): Usar el modo por bloques de una sola pasada
+            block_size (int): Caracteres por bloque en el modo de una pasada
+            
+        Returns:
+            Dict[str, Any]: Tamaños, modo, bloques y ratio de compresión
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {input_path}")
+        
+        if one_pass:
+            def write_blocks(target: BinaryIO) -> Dict[str, Any]:
+                with open(input_path, 'r', encoding='utf-8', newline='') as source:
+                    return self.encode_stream(source, target, block_size)
+            
+            stats = self._write_output(input_path, output_path, write_blocks, "encode_file")
+            return self._file_stats(input_path, output_path, stats)
+        
+        # Primera pasada: frecuencias por tramos
+        frequency = Counter()
+        with open(input_path, 'r', encoding='utf-8', newline='') as source:
+            for chunk in iter(lambda: source.read(HUFFMAN_STREAM_CHUNK), ""):
+                frequency.update(chunk)
+        
+        # Segunda pasada: bits empaquetados directamente al archivo
+        def write_container(target: BinaryIO) -> Dict[str, Any]:
+            if not frequency:
+                return {'mode': 'two-pass', 'blocks': 0}
+            codes = self.assign_codes(frequency)
+            target.write(self._container_header(codes, 0))
+            with open(input_path, 'r', encoding='utf-8', newline='') as source:
+                try:
+                    bit_length = self.pack_chunks(iter(lambda: source.read(HUFFMAN_STREAM_CHUNK), ""),
+                                                  codes, target.write)
+                except HuffmanError:
+                    raise HuffmanError("El archivo cambió entre las dos pasadas", "encode_file")
+            target.seek(0)
+            target.write(self._container_header(codes, bit_length))
+            return {'mode': 'two-pass', 'blocks': 1}
+        
+        stats = self._write_output(input_path, output_path, write_container, "encode_file")
+        return self._file_stats(input_path, output_path, stats)
+    
+    @staticmethod
+    def _write_output(input_path: str, output_path: str, write: Callable[[BinaryIO], Any], operation: str) -> Any:
+        """
+        Escribir en un temporal junto al destino y reemplazarlo solo si todo fue bien
+        
+        La entrada se lee mientras se escribe, así que un destino que es
+        el mismo archivo que la entrada se rechaza antes de abrir nada.
+        
+        Returns:
+            Any: Lo que devuelva write(destino)
+        """
+        if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+            raise HuffmanError("El archivo de salida no puede ser el de entrada", operation)
+        
+        directory = os.path.dirname(os.path.abspath(output_path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as target:
+                result = write(target)
+            os.replace(temporary, output_path)
+            return result
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    
+    def encode_stream(self, source: TextIO, target: BinaryIO, block_size: int = HUFFMAN_BLOCK_SIZE) -> Dict[str, Any]:
+        """
+        Comprimir un flujo de texto en una sola pasada, por bloques
+        
+        Cada bloque de `block_size` caracteres se codifica con su propia
+        tabla en un contenedor independiente y la salida es la
+        concatenación de los contenedores: la memoria depende del bloque y
+        no de la entrada, que se lee una sola vez.
+        
+        Args:
+            source (TextIO): Flujo de texto
+            target (BinaryIO): Flujo binario de salida
+            block_size (int): Caracteres por bloque
+            
+        Returns:
+            Dict[str, Any]: Modo, bloques, caracteres y bytes escritos
+        """
+        if block_size <= 0:
+            raise InvalidInputError("El tamaño de bloque debe ser positivo")
+        
+        blocks = characters = written = 0
+        for block in iter(lambda: source.read(block_size), ""):
+            blob = self.compress(block)
+            target.write(blob)
+            blocks += 1
+            characters += len(block)
+            written += len(blob)
+        return {'mode': 'block', 'blocks': blocks, 'characters': characters, 'compressed_bytes': written}
+    
+    def decode_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
+        """
+        Descomprimir un archivo de encode_file o compress_file
+        
+        Los contenedores de texto se escriben en UTF-8 y los de bytes tal
+        cual, de modo que sirve para cualquiera de los modos. Como en
+        encode_file, el destino se reemplaza solo al terminar.
+        
+        Args:
+            input_path (str): Archivo comprimido
+            output_path (str): Archivo restaurado
+            
+        Returns:
+            Dict[str, Any]: Tamaños, símbolos (caracteres o bytes) y ratio de compresión
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {input_path}")
+        
+        encodings = {HUFFMAN_KIND_TEXT: 'utf-8', HUFFMAN_KIND_BYTES: 'latin-1'}
+        
+        def write_decoded(target: BinaryIO) -> int:
+            with open(input_path, 'rb') as source:
+                return self._decode_containers(
+                    source, lambda kind, text: target.write(text.encode(encodings[kind])), HUFFMAN_STREAM_CHUNK)
+        
+        characters = self._write_output(input_path, output_path, write_decoded, "decode_file")
+        return self._file_stats(output_path, input_path, {'characters': characters})
+    
+    def decode_stream(self, source: BinaryIO, target: TextIO, chunk_size: int = HUFFMAN_STREAM_CHUNK) -> int:
+        """
+        Descomprimir una secuencia de contenedores de texto leyendo por tramos
+        
+        Args:
+            source (BinaryIO): Flujo con uno o más contenedores
+            target (TextIO): Flujo de texto de salida
+            chunk_size (int): Bytes leídos por tramo
+            
+        Returns:
+            int: Caracteres escritos
+        """
+        def emit(kind: int, text: str) -> None:
+            if kind != HUFFMAN_KIND_TEXT:
+                raise HuffmanError("Contenedor de bytes: use decode_file o decompress_bytes", "decode_stream")
+            target.write(text)
+        
+        return self._decode_containers(source, emit, chunk_size)
+    
+    def _decode_containers(self, source: BinaryIO, emit: Callable[[int, str], Any], chunk_size: int) -> int:
+        """
+        Decodificar contenedores consecutivos por tramos de `chunk_size` bytes
+        
+        Los bits del último código incompleto de un tramo pasan al
+        siguiente; cada trozo de texto se entrega con emit(tipo, texto).
+        
+        Returns:
+            int: Símbolos decodificados
+        """
+        characters = 0
+        while True:
+            header = source.read(HUFFMAN_HEADER.size)
+            if not header:
+                return characters
+            if len(header) == HUFFMAN_HEADER.size:
+                header += source.read(HUFFMAN_HEADER.unpack(header)[3] * HUFFMAN_SYMBOL.size)
+            codes, bit_length, _, kind = self._unpack_header(header)
+            root = self.build_tree_from_codes(codes)
+            
+            remaining = (bit_length + 7) // 8
+            buffer, start, available = b"", 0, bit_length
+            while True:
+                chunk = source.read(min(chunk_size, remaining))
+                if len(chunk) < min(chunk_size, remaining):
+                    raise HuffmanError("Contenedor Huffman truncado", "decode_stream")
+                remaining -= len(chunk)
+                
+                # Descartar los bytes ya decodificados del tramo anterior
+                drop = start // 8
+                buffer = buffer[drop:] + chunk
+                start -= drop * 8
+                available -= drop * 8
+                
+                text, start = self._decode_span(buffer, start, min(available, len(buffer) * 8),
+                                                root, HUFFMAN_TABLE_BITS, not remaining)
+                emit(kind, text)
+                characters += len(text)
+                if not remaining:
+                    break
+    
+    # ----- Modo de bytes (alfabeto de 256 símbolos) -----
+    @staticmethod
+    def build_byte_frequency_table(data: Union[bytes, bytearray, memoryview]) -> Dict[str, int]:
+        """
+        Construir tabla de frecuencias de bytes
+        
+        Cada byte se representa con el carácter latin-1 del mismo valor
+        (U+0000-U+00FF), así que el resto del codificador (códigos,
+        empaquetado, tablas de decodificación y contenedor) es el mismo
+        que para texto.
+        
+        Args:
+            data (Union[bytes, bytearray, memoryview]): Datos binarios
+            
+        Returns:
+            Dict[str, int]: Frecuencia de cada byte presente
+        """
+        return HuffmanCoding._byte_counts((data,))
+    
+    @staticmethod
+    def _byte_counts(chunks: Iterable[Union[bytes, bytearray, memoryview]]) -> Dict[str, int]:
+        """Frecuencias de bytes acumuladas sobre varios tramos (np.bincount si hay NumPy)"""
+        huffman_kernels = _huffman_kernels()
+        counts = [0] * 256
+        for chunk in chunks:
+            if huffman_kernels.NUMPY_AVAILABLE:
+                partial = huffman_kernels.byte_histogram(chunk)
+            else:
+                partial = [0] * 256
+                for value, count in Counter(bytes(chunk)).items():
+                    partial[value] = count
+            counts = [total + int(count) for total, count in zip(counts, partial)]
+        return {chr(value): count for value, count in enumerate(counts) if count}
+    
+    def compress_bytes(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Comprimir datos binarios arbitrarios en un contenedor de bytes
+        
+        Args:
+            data (Union[bytes, bytearray, memoryview]): Datos a comprimir
+            
+        Returns:
+            bytes: Contenedor (tipo HUFFMAN_KIND_BYTES)
+        """
+        if not len(data):
+            raise InvalidInputError("Los datos no pueden estar vacíos")
+        
+        codes = self.assign_codes(self.build_byte_frequency_table(data))
+        encoded = self.pack(str(data, 'latin-1'), codes)
+        return self.pack_container(encoded, codes, HUFFMAN_KIND_BYTES)
+    
+    def decompress_bytes(self, blob: bytes) -> bytes:
+        """
+        Descomprimir un contenedor de compress_bytes
+        
+        Args:
+            blob (bytes): Contenedor de bytes
+            
+        Returns:
+            bytes: Datos originales
+        """
+        encoded, codes = self.unpack_container(blob, HUFFMAN_KIND_BYTES)
+        return self.decode(encoded, self.build_tree_from_codes(codes)).encode('latin-1')
+    
+    def compress_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
+        """
+        Comprimir cualquier archivo byte a byte, en dos pasadas por tramos
+        
+        La primera pasada cuenta bytes con np.bincount sobre vistas
+        np.frombuffer de un búfer reutilizado; la segunda empaqueta los
+        bits directamente en un temporal que reemplaza al archivo de salida
+        solo al terminar. decode_file lo restaura.
+        
+        Args:
+            input_path (str): Archivo de entrada (cualquier contenido)
+            output_path (str): Archivo comprimido
+            
+        Returns:
+            Dict[str, Any]: Tamaños, modo y ratio de compresión
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {input_path}")
+        
+        with open(input_path, 'rb') as source:
+            frequency = self._byte_counts(self._read_chunks(source))
+        
+        def write_container(target: BinaryIO) -> Dict[str, Any]:
+            if not frequency:
+                return {'mode': 'bytes', 'blocks': 0}
+            codes = self.assign_codes(frequency)
+            target.write(self._container_header(codes, 0, HUFFMAN_KIND_BYTES))
+            with open(input_path, 'rb') as source:
+                try:
+                    bit_length = self.pack_chunks((str(chunk, 'latin-1') for chunk in self._read_chunks(source)),
+                                                  codes, target.write)
+                except HuffmanError:
+                    raise HuffmanError("El archivo cambió entre las dos pasadas", "compress_file")
+            target.seek(0)
+            target.write(self._container_header(codes, bit_length, HUFFMAN_KIND_BYTES))
+            return {'mode': 'bytes', 'blocks': 1}
+        
+        stats = self._write_output(input_path, output_path, write_container, "compress_file")
+        return self._file_stats(input_path, output_path, stats)
+    
+    @staticmethod
+    def _read_chunks(source: BinaryIO) -> Iterable[memoryview]:
+        """Leer un archivo binario por tramos de HUFFMAN_STREAM_CHUNK bytes sobre un único búfer"""
+        buffer = bytearray(HUFFMAN_STREAM_CHUNK)
+        view = memoryview(buffer)
+        while True:
+            size = source.readinto(buffer)
+            if not size:
+                return
+            yield view[:size]
+    
+    @staticmethod
+    def _file_stats(original_path: str, compressed_path: str, extra: Dict[str, Any]) -> Dict[str, Any]:
+        """Tamaños y ratio de compresión de un par de archivos"""
+        original_bytes = os.path.getsize(original_path)
+        compressed_bytes = os.path.getsize(compressed_path)
+        stats = dict(extra)
+        stats.update({
+            'original_bytes': original_bytes,
+            'compressed_bytes': compressed_bytes,
+            'compression_ratio': compressed_bytes / original_bytes if original_bytes else 0
+        })
+        return stats
+    
+    def get_compression_stats(self, original_text: str, encoded: Union[HuffmanBits, str]) -> Dict[str, Any]:
         """
         Obtener estadísticas de compresión
         
+        Los tamaños son los reales: el texto original en UTF-8 y los bytes
+        empaquetados de la salida.
+        
         Args:
             original_text (str): Texto original
-            encoded_text (str): Texto codificado
+            encoded (Union[HuffmanBits, str]): Bits empaquetados o su vista en '0'/'1'
             
         Returns:
-            Dict[str, Any]: Estadísticas de compresión
+            Dict[str, Any]: Estadísticas de compresión (space_saved en bytes)
         """
-        original_bits = len(original_text) * 8  # Asumiendo ASCII
-        encoded_bits = len(encoded_text)
+        if isinstance(encoded, str):
+            encoded = HuffmanBits.from_string(encoded)
+        original_bytes = len(original_text.encode('utf-8'))
+        encoded_bytes = len(encoded.data)
         
-        compression_ratio = encoded_bits / original_bits if original_bits > 0 else 0
-        space_saved = original_bits - encoded_bits
-        space_saved_percent = (space_saved / original_bits * 100) if original_bits > 0 else 0
+        compression_ratio = encoded_bytes / original_bytes if original_bytes > 0 else 0
+        space_saved = original_bytes - encoded_bytes
+        space_saved_percent = (space_saved / original_bytes * 100) if original_bytes > 0 else 0
         
         return {
             "original_length": len(original_text),
-            "original_bits": original_bits,
-            "encoded_length": len(encoded_text),
-            "encoded_bits": encoded_bits,
+            "original_bytes": original_bytes,
+            "original_bits": original_bytes * 8,
+            "encoded_length": encoded.bit_length,
+            "encoded_bits": encoded.bit_length,
+            "encoded_bytes": encoded_bytes,
             "compression_ratio": compression_ratio,
             "space_saved": space_saved,
             "space_saved_percent": space_saved_percent,
@@ -297,10 +1076,10 @@ class HuffmanCoding:
             Dict[str, Any]: Datos formateados para la GUI
         """
         # Codificar con el método original
-        encoded_text, codes, tree = self.encode(text)
+        encoded, codes, tree = self.encode(text)
         
         # Obtener estadísticas
-        stats = self.get_compression_stats(text, encoded_text)
+        stats = self.get_compression_stats(text, encoded)
         
         # Obtener frecuencias
         frequencies = self.build_frequency_table(text)
@@ -309,30 +1088,33 @@ class HuffmanCoding:
         tree_visualization = self.visualize_tree(tree)
         
         return {
-            'encoded': encoded_text,
+            'encoded': encoded.to_string(),  # Vista en '0'/'1' para mostrar
+            'packed': encoded,
+            'container': self.pack_container(encoded, codes),
             'codes': codes,
             'tree': tree,
             'frequencies': frequencies,
             'tree_visualization': tree_visualization,
-            'original_size': len(text) * 8,  # bits
-            'compressed_size': len(encoded_text),  # bits
-            'compression_ratio': (len(encoded_text) / (len(text) * 8)) * 100,
-            'space_saved': ((len(text) * 8 - len(encoded_text)) / (len(text) * 8)) * 100
+            'original_size': stats['original_bits'],  # bits
+            'compressed_size': encoded.bit_length,  # bits
+            'compression_ratio': encoded.bit_length / stats['original_bits'] * 100,
+            'space_saved': (stats['original_bits'] - encoded.bit_length) / stats['original_bits'] * 100
         }
     
-    def decode_for_gui(self, encoded_text: str, codes: Dict[str, str]) -> str:
+    def decode_for_gui(self, encoded: Union[HuffmanBits, str], codes: Dict[str, str]) -> str:
         """
         Decodificar texto para la GUI
         
         Args:
-            encoded_text (str): Texto codificado
+            encoded (Union[HuffmanBits, str]): Bits empaquetados o su vista en '0'/'1'
             codes (Dict[str, str]): Diccionario de códigos
             
         Returns:
             str: Texto decodificado
         """
-        # Usar el método de decodificación original
-        return self.decode(encoded_text, self.root)
+        # El árbol se reconstruye de los códigos: no depende del último encode
+        root = self.root if self.root and codes == self.codes else self.build_tree_from_codes(codes)
+        return self.decode(encoded, root)
 
 # ===== SIMULADOR BLOCKCHAIN =====
 class Block:
@@ -360,10 +1142,10 @@ class Block:
         Calcular hash del bloque
         
         Returns:
-            str: Hash SHA-256 del bloque
+            str: Hash del bloque (BLOCKCHAIN_HASH_ALGORITHM, SHA-256 por defecto)
         """
         block_string = f"{self.index}{self.data}{self.previous_hash}{self.timestamp}{self.nonce}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return hashing.new_hash(BLOCKCHAIN_HASH_ALGORITHM, block_string.encode()).hexdigest()
     
     def mine_block(self, difficulty: int = 4):
         """
@@ -590,9 +1372,26 @@ class IntegrityVerifier:
     Verificador de integridad para archivos y texto
     """
     
-    def __init__(self):
-        """Inicializar verificador"""
-        pass
+    def __init__(self, cache: Optional[hashing.DigestCache] = None):
+        """
+        Inicializar verificador
+        
+        Args:
+            cache (Optional[DigestCache]): Caché de resultados (por defecto la compartida)
+        """
+        self.cache = cache if cache is not None else hashing.get_default_digest_cache()
+    
+    def _new_hash(self, algorithm: str):
+        """
+        Crear un objeto hash incremental del registro de algoritmos
+        
+        Args:
+            algorithm (str): Cualquier nombre de hashing.HASH_REGISTRY (sha256, blake2b, custom256...)
+            
+        Returns:
+            Objeto con update()/hexdigest()
+        """
+        return hashing.new_hash(algorithm)
     
     def calculate_file_hash(self, file_path: str, algorithm: str = "sha256") -> str:
         """
@@ -608,21 +1407,79 @@ class IntegrityVerifier:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Archivo no encontrado: {file_path}")
         
-        if algorithm.lower() not in ["sha256", "sha1", "md5"]:
-            raise InvalidInputError(f"Algoritmo no soportado: {algorithm}")
-        
-        hash_func = getattr(hashlib, algorithm.lower())()
+        # Archivo sin cambios (ruta, tamaño, mtime, inodo): reutilizar el resultado
+        name = hashing.canonical_algorithm(algorithm)
+        key = self.cache.file_key(name, file_path)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         
         try:
             with open(file_path, 'rb') as f:
-                # Leer archivo en chunks para archivos grandes
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_func.update(chunk)
-            
-            return hash_func.hexdigest()
+                # Leer archivo en chunks: memoria constante para archivos grandes
+                file_hash = hashing.hash_stream(algorithm, f, PERFORMANCE_LIMITS['chunk_size']).hexdigest()
         
         except Exception as e:
             raise FileError(f"Error al leer archivo: {str(e)}")
+        
+        self._cache_file_hash(key, name, file_path, file_hash)
+        return file_hash
+    
+    def _cache_file_hash(self, key: Optional[Tuple], algorithm: str, file_path: str, file_hash: str) -> None:
+        """
+        Guardar el hash de un archivo si no cambió mientras se leía
+        
+        La clave se tomó antes de leer; si el archivo se modificó durante
+        la lectura, el hash no corresponde a ninguna de las dos versiones.
+        """
+        if key is not None and self.cache.file_key(algorithm, file_path) == key:
+            self.cache.put(key, file_hash)
+    
+    def calculate_file_hashes(self, file_path: str, algorithms: List[str]) -> Dict[str, str]:
+        """
+        Calcular varios hash de un archivo con una sola lectura
+        
+        Args:
+            file_path (str): Ruta del archivo
+            algorithms (List[str]): Algoritmos (nombres de HASH_ALGORITHMS)
+            
+        Returns:
+            Dict[str, str]: Hash por algoritmo (nombre canónico)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {file_path}")
+        
+        # Validar los nombres antes de abrir el archivo
+        algorithms = [hashing.canonical_algorithm(name) for name in algorithms]
+        
+        # Leer el archivo solo para los algoritmos que no están en caché
+        keys = {name: self.cache.file_key(name, file_path) for name in algorithms}
+        results = {name: self.cache.get(keys[name]) for name in algorithms}
+        missing = [name for name in algorithms if results[name] is None]
+        
+        if missing:
+            try:
+                computed = hashing.multi_digest_file(file_path, missing)
+            except Exception as e:
+                raise FileError(f"Error al leer archivo: {str(e)}")
+            for name, file_hash in computed.items():
+                self._cache_file_hash(keys[name], name, file_path, file_hash)
+                results[name] = file_hash
+        
+        return results
+    
+    def calculate_text_hashes(self, text: str, algorithms: List[str]) -> Dict[str, str]:
+        """
+        Calcular varios hash de un texto codificándolo una sola vez
+        
+        Args:
+            text (str): Texto a hashear
+            algorithms (List[str]): Algoritmos (nombres de HASH_ALGORITHMS)
+            
+        Returns:
+            Dict[str, str]: Hash por algoritmo (nombre canónico)
+        """
+        return hashing.multi_digest(text, algorithms)
     
     def calculate_text_hash(self, text: str, algorithm: str = "sha256") -> str:
         """
@@ -635,13 +1492,20 @@ class IntegrityVerifier:
         Returns:
             str: Hash del texto
         """
-        if algorithm.lower() not in ["sha256", "sha1", "md5"]:
-            raise InvalidInputError(f"Algoritmo no soportado: {algorithm}")
+        hash_func = self._new_hash(algorithm)
+        data = text.encode('utf-8')
         
-        hash_func = getattr(hashlib, algorithm.lower())()
-        hash_func.update(text.encode('utf-8'))
+        # Solo los hash en Python compensan el pre-hash de la clave de caché
+        if hashing.get_algorithm(algorithm).native or not self.cache.enabled:
+            hash_func.update(data)
+            return hash_func.hexdigest()
+        
+        def compute():
+            hash_func.update(data)
+            return hash_func.hexdigest()
         
-        return hash_func.hexdigest()
+        key = self.cache.text_key(hashing.canonical_algorithm(algorithm), data)
+        return self.cache.get_or_compute(key, compute)
     
     def verify_file_integrity(self, file_path: str, expected_hash: str, algorithm: str = "sha256") -> Dict[str, Any]:
         """
@@ -805,6 +1669,7 @@ class IntegrityVerifier:
 
 # ===== EXPORTAR CLASES =====
 __all__ = [
+    'HuffmanBits',
     'HuffmanCoding',
     'Blockchain',
     'Block',
@@ -94,6 +94,10 @@ class PathConfig:
     IMAGES_DIR = ASSETS_DIR / "images"
     TEMPLATES_DIR = ASSETS_DIR / "templates"
     
+    # Almacén de claves RSA
+    KEYS_DIR = BASE_DIR / "keys"
+    KEYSTORE_FILE = KEYS_DIR / "keystore.bin"
+    
     # Archivos de configuración
     CONFIG_FILE = BASE_DIR / "config.json"
     LOG_FILE = BASE_DIR / "crypto_uns.log"
@@ -115,14 +119,17 @@ class CryptoConfig:
     RSA_MIN_KEY_SIZE = 512
     RSA_DEFAULT_KEY_SIZE = 1024
     RSA_MAX_KEY_SIZE = 4096
+    SIGNATURE_KEY_TTL = 600  # Segundos que la demo de firma reutiliza sus claves
     
     # Configuración Hash
-    HASH_TYPES = ["MD5", "SHA1", "SHA256", "SHA512", "Custom64", "Custom128", "Custom256"]
+    HASH_TYPES = ["MD5", "SHA1", "SHA256", "SHA512", "BLAKE2b", "BLAKE2s", "SHA3_256", "SHA3_512",
+                  "Custom64", "Custom128", "Custom256"]
     DEFAULT_HASH_TYPE = "SHA256"
     
     # Configuración DES
     DES_KEY_SIZE = 8  # 8 bytes = 64 bits
-    DES_MODES = ["ECB", "CBC"]
+    TRIPLE_DES_KEY_SIZES = [16, 24]  # 3DES EDE con dos o tres claves
+    DES_MODES = ["ECB", "CBC", "CTR", "EAX"]
     DES_DEFAULT_MODE = "CBC"
 
 # ===== CONFIGURACIÓN DE INTERFAZ =====
@@ -11,6 +11,7 @@ Componentes:
 - modern_crypto: Pantallas de criptografía moderna
 - tools_gui: Herramientas adicionales
 - components: Componentes reutilizables
+- presentation: Conversión texto/hexadecimal para mostrar datos binarios
 
 Dependencias:
 - ttkbootstrap: Framework de interfaz gráfica moderna
@@ -27,6 +28,7 @@ try:
     from .modern_crypto import *
     from .tools_gui import *
     from .components import *
+    from .presentation import *
 except ImportError:
     # Los módulos se importarán cuando sean creados
     pass
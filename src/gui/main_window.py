@@ -9,15 +9,21 @@ import ttkbootstrap as ttb
 from ttkbootstrap.constants import *
 import sys
 import os
+import time
+from collections import deque
 
 # Agregar el directorio src al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.utils.exceptions import CryptoUNSError
-from src.data.config import ThemeConfig, WindowConfig
+from src.utils.constants import HUFFMAN_FILE_EXTENSION
+from src.data.config import ThemeConfig, WindowConfig, PerformanceConfig
 from src.crypto.classic import CaesarCipher, VigenereCipher, PlayfairCipher, KasiskiAnalysis
 from src.crypto.modern import RSACipher, CustomHash, DESCipher, DigitalSignature
 from src.crypto.tools import HuffmanCoding, Blockchain, IntegrityVerifier
+from src.crypto.hashing import available_algorithms, get_algorithm, new_hash
+from src.crypto.hash_quality import text_avalanche, AVALANCHE_SAMPLE_BYTES
+from src.gui.presentation import text_to_bytes, bytes_to_text, to_hex, from_hex, rsa_blocks
 
 
 class CryptoUNSApp:
@@ -1313,10 +1319,25 @@ class CryptoUNSApp:
         # Variables para almacenar las claves y datos cifrados
         self.current_public_key = None
         self.current_private_key = None
-        self.current_encrypted_data = None  # Para almacenar la lista de bloques cifrados
+        self.current_encrypted_data = None  # Bytes cifrados del último mensaje
         
-        # Generar claves iniciales
-        self.generate_rsa_keys()
+        # Cargar las claves guardadas (o generar las iniciales)
+        self.load_rsa_keys()
+    
+    def load_rsa_keys(self):
+        """Cargar el par de claves RSA guardado o generar uno nuevo"""
+        try:
+            key_size = int(self.rsa_key_size.get())
+            public_key, private_key = self.rsa.load_keys(f"gui-rsa-{key_size}")
+        except CryptoUNSError:
+            self.generate_rsa_keys()
+            return
+        except Exception as e:
+            self.show_error(f"Error al cargar claves RSA: {str(e)}")
+            return
+        
+        self.display_rsa_keys(public_key, private_key, key_size)
+        self.update_status(f"Claves RSA de {key_size} bits cargadas del almacén")
     
     def generate_rsa_keys(self):
         """Generar par de claves RSA"""
@@ -1324,8 +1345,20 @@ class CryptoUNSApp:
             key_size = int(self.rsa_key_size.get())
             self.update_status(f"Generando claves RSA de {key_size} bits...")
             
-            # Generar claves
+            # Generar claves y guardarlas para próximas sesiones
+            self.rsa.key_size = key_size
             public_key, private_key = self.rsa.generate_keys()
+            self.rsa.save_keys(f"gui-rsa-{key_size}")
+            
+            self.display_rsa_keys(public_key, private_key, key_size)
+            self.update_status(f"Claves RSA de {key_size} bits generadas exitosamente")
+            
+        except Exception as e:
+            self.show_error(f"Error al generar claves RSA: {str(e)}")
+    
+    def display_rsa_keys(self, public_key, private_key, key_size):
+        """Mostrar un par de claves RSA en la pantalla"""
+        try:
             self.current_public_key = public_key
             self.current_private_key = private_key
             
@@ -1370,10 +1403,8 @@ class CryptoUNSApp:
             self.rsa_info.insert("1.0", info_text)
             self.rsa_info.configure(state="disabled")
             
-            self.update_status(f"Claves RSA de {key_size} bits generadas exitosamente")
-            
         except Exception as e:
-            self.show_error(f"Error al generar claves RSA: {str(e)}")
+            self.show_error(f"Error al mostrar claves RSA: {str(e)}")
     
     def rsa_encrypt(self):
         """Cifrar mensaje con RSA"""
@@ -1389,8 +1420,9 @@ class CryptoUNSApp:
                 return
             
             # Cifrar mensaje
-            encrypted = self.rsa.encrypt(message, self.current_public_key)
-            self.current_encrypted_data = encrypted  # Almacenar la lista completa
+            ciphertext = self.rsa.encrypt_bytes(text_to_bytes(message), self.current_public_key)
+            self.current_encrypted_data = ciphertext  # Almacenar los bytes cifrados
+            encrypted = rsa_blocks(ciphertext, self.current_public_key)
             
             # Mostrar resultado
             self.rsa_result.configure(state="normal")
@@ -1437,21 +1469,22 @@ class CryptoUNSApp:
                 return
             
             # Descifrar mensaje usando la lista almacenada
-            decrypted = self.rsa.decrypt(self.current_encrypted_data, self.current_private_key)
+            decrypted = bytes_to_text(self.rsa.decrypt_bytes(self.current_encrypted_data, self.current_private_key))
+            blocks = rsa_blocks(self.current_encrypted_data, self.current_public_key)
             
             # Mostrar resultado
             self.rsa_result.configure(state="normal")
             self.rsa_result.delete("1.0", tk.END)
             
             result_text = f"Mensaje Descifrado:\n\n"
-            result_text += f"Bloques cifrados: {len(self.current_encrypted_data)}\n"
-            if len(self.current_encrypted_data) <= 3:
-                for i, block in enumerate(self.current_encrypted_data):
+            result_text += f"Bloques cifrados: {len(blocks)}\n"
+            if len(blocks) <= 3:
+                for i, block in enumerate(blocks):
                     result_text += f"Bloque {i+1}: {block}\n"
             else:
-                result_text += f"Primer bloque: {self.current_encrypted_data[0]}\n"
-                result_text += f"... ({len(self.current_encrypted_data)-2} bloques más) ...\n"
-                result_text += f"Último bloque: {self.current_encrypted_data[-1]}\n"
+                result_text += f"Primer bloque: {blocks[0]}\n"
+                result_text += f"... ({len(blocks)-2} bloques más) ...\n"
+                result_text += f"Último bloque: {blocks[-1]}\n"
             
             result_text += f"\nTexto descifrado: {decrypted}\n\n"
             result_text += f"Proceso:\n"
@@ -1537,12 +1570,12 @@ class CryptoUNSApp:
         ttb.Label(input_frame, text="Algoritmo de hash:").pack(anchor="w")
         self.hash_algorithm = ttb.Combobox(
             input_frame, 
-            values=["Hash-64", "Hash-128", "Hash-256", "SHA-256"], 
+            values=available_algorithms() + ["Todos"], 
             state="readonly", 
             width=15
         )
         self.hash_algorithm.pack(anchor="w", pady=(5, 10))
-        self.hash_algorithm.set("Hash-256")
+        self.hash_algorithm.set("Custom256")
         
         # Botones
         button_frame = ttb.Frame(input_frame)
@@ -1604,8 +1637,8 @@ class CryptoUNSApp:
         self.hash_comparison_result = tk.Text(comparison_frame, height=4, state="disabled")
         self.hash_comparison_result.pack(fill="both", expand=True)
         
-        # Lista para almacenar hashes calculados
-        self.calculated_hashes = []
+        # Historial acotado de hashes calculados
+        self.calculated_hashes = deque(maxlen=PerformanceConfig.CACHE_SIZE)
     
     def calculate_hash(self):
         """Calcular hash del texto"""
@@ -1617,23 +1650,14 @@ class CryptoUNSApp:
                 self.show_warning("Por favor ingrese un texto para hashear")
                 return
             
-            # Calcular hash según el algoritmo seleccionado
-            if algorithm == "Hash-64":
-                hash_value = self.hash.hash_64(text)
-                hash_length = 64
-            elif algorithm == "Hash-128":
-                hash_value = self.hash.hash_128(text)
-                hash_length = 128
-            elif algorithm == "Hash-256":
-                hash_value = self.hash.hash_256(text)
-                hash_length = 256
-            elif algorithm == "SHA-256":
-                hash_value = self.hash.sha256(text)
-                hash_length = 256
-            else:
-                self.show_error("Algoritmo no soportado")
+            if algorithm == "Todos":
+                self.calculate_all_hashes(text)
                 return
             
+            # Calcular hash con el algoritmo seleccionado del registro
+            hash_value = self.hash.hash_text(text, algorithm)
+            hash_length = get_algorithm(algorithm).bits
+            
             # Almacenar hash calculado
             hash_info = {
                 'text': text,
@@ -1659,14 +1683,22 @@ class CryptoUNSApp:
             
             # Análisis del hash
             result_text += f"Análisis:\n"
-            unique_chars = len(set(hash_value))
-            result_text += f"• Caracteres únicos: {unique_chars}\n"
-            result_text += f"• Distribución: {'Buena' if unique_chars > len(hash_value) * 0.5 else 'Regular'}\n"
+            # Contar caracteres hex distintos no dice nada de la calidad:
+            # medir cuántos bits del digest cambian al invertir bits del texto
+            # (solo sobre una muestra inicial: se ejecuta en el hilo de la GUI)
+            data = text.encode('utf-8')
+            avalanche = text_avalanche(algorithm, data)
+            sample = "" if len(data) <= AVALANCHE_SAMPLE_BYTES else f", primeros {AVALANCHE_SAMPLE_BYTES} bytes"
+            result_text += f"• Avalancha: {avalanche:.1%} de bits cambian por bit invertido (ideal 50%{sample})\n"
+            result_text += f"• Calidad estadística completa: scripts/hash_quality.py\n"
+            
+            cache_stats = self.hash.cache.stats()
+            result_text += f"• Caché: {cache_stats['hits']} aciertos / {cache_stats['misses']} fallos\n"
             
             # Mostrar algunos hashes anteriores
             if len(self.calculated_hashes) > 1:
                 result_text += f"\nÚltimos 3 hashes calculados:\n"
-                for i, prev_hash in enumerate(self.calculated_hashes[-3:], 1):
+                for i, prev_hash in enumerate(list(self.calculated_hashes)[-3:], 1):
                     result_text += f"{i}. {prev_hash['algorithm']}: {prev_hash['hash'][:32]}...\n"
             
             self.hash_results.insert("1.0", result_text)
@@ -1677,6 +1709,24 @@ class CryptoUNSApp:
         except Exception as e:
             self.show_error(f"Error al calcular hash: {str(e)}")
     
+    def calculate_all_hashes(self, text: str):
+        """Calcular todos los algoritmos registrados con una sola codificación del texto"""
+        hashes = self.integrity.calculate_text_hashes(text, available_algorithms())
+        
+        result_text = f"Resultado del Hash:\n\n"
+        result_text += f"Algoritmos: {len(hashes)} (una sola pasada)\n"
+        result_text += f"Texto original: {text[:100]}{'...' if len(text) > 100 else ''}\n"
+        result_text += f"Longitud del texto: {len(text)} caracteres\n\n"
+        for name, hash_value in hashes.items():
+            result_text += f"{name} ({get_algorithm(name).bits} bits):\n{hash_value}\n\n"
+        
+        self.hash_results.configure(state="normal")
+        self.hash_results.delete("1.0", tk.END)
+        self.hash_results.insert("1.0", result_text)
+        self.hash_results.configure(state="disabled")
+        
+        self.update_status(f"{len(hashes)} hashes calculados exitosamente")
+    
     def compare_hashes(self):
         """Comparar dos hashes"""
         try:
@@ -1726,7 +1776,7 @@ class CryptoUNSApp:
     def clear_hash_fields(self):
         """Limpiar campos de hash"""
         self.hash_text.delete("1.0", tk.END)
-        self.hash_algorithm.set("Hash-256")
+        self.hash_algorithm.set("Custom256")
         
         self.hash_results.configure(state="normal")
         self.hash_results.delete("1.0", tk.END)
@@ -1884,11 +1934,10 @@ class CryptoUNSApp:
                 self.show_warning("El IV debe tener exactamente 8 caracteres para modo CBC")
                 return
             
-            # Cifrar según el modo
-            if mode == "ECB":
-                encrypted = self.des.encrypt_ecb(text, key)
-            else:  # CBC
-                encrypted = self.des.encrypt_cbc(text, key, iv)
+            # Cifrar (el IV de CBC se escribe como texto de 8 caracteres)
+            ciphertext, _ = self.des.encrypt_bytes(text_to_bytes(text), key, mode,
+                                                   text_to_bytes(iv) if mode == "CBC" else None)
+            encrypted = to_hex(ciphertext)
             
             # Mostrar resultado
             self.display_result(self.des_result, encrypted)
@@ -1919,11 +1968,10 @@ class CryptoUNSApp:
                 self.show_warning("El IV debe tener exactamente 8 caracteres para modo CBC")
                 return
             
-            # Descifrar según el modo
-            if mode == "ECB":
-                decrypted = self.des.decrypt_ecb(text, key)
-            else:  # CBC
-                decrypted = self.des.decrypt_cbc(text, key, iv)
+            # Descifrar el texto hexadecimal con el mismo IV de texto usado al cifrar
+            plaintext = self.des.decrypt_bytes(from_hex(text), key, mode,
+                                               text_to_bytes(iv) if mode == "CBC" else None)
+            decrypted = bytes_to_text(plaintext)
             
             # Mostrar resultado
             self.display_result(self.des_result, decrypted)
@@ -2156,6 +2204,13 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
         
         # Mostrar información inicial
         self.show_signature_info()
+        
+        # Reutilizar las claves de firma de sesiones anteriores
+        try:
+            public_key, private_key = self.signature.load_keys("gui-signature")
+            self.display_signature_keys(public_key, private_key)
+        except CryptoUNSError:
+            pass
     
     def generate_signature_keys(self):
         """Generar claves para firma digital"""
@@ -2164,7 +2219,17 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
             
             # Generar claves RSA (devuelve tuplas)
             public_key, private_key = self.signature.generate_keys(1024)  # 1024 bits para rapidez
+            self.signature.save_keys("gui-signature")
+            
+            self.display_signature_keys(public_key, private_key)
+            self.update_status("Claves RSA para firma digital generadas exitosamente")
             
+        except Exception as e:
+            self.show_error(f"Error al generar claves: {str(e)}")
+    
+    def display_signature_keys(self, public_key, private_key):
+        """Mostrar las claves de firma digital en la pantalla"""
+        try:
             # Almacenar claves como tuplas
             self.signature_keys = {
                 'public_key': public_key,
@@ -2192,10 +2257,8 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
             self.signature_keys_info.insert("1.0", keys_text)
             self.signature_keys_info.configure(state="disabled")
             
-            self.update_status("Claves RSA para firma digital generadas exitosamente")
-            
         except Exception as e:
-            self.show_error(f"Error al generar claves: {str(e)}")
+            self.show_error(f"Error al mostrar claves: {str(e)}")
     
     def sign_message(self):
         """Firmar mensaje"""
@@ -2211,19 +2274,19 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
                 self.show_warning("Por favor genere las claves RSA primero")
                 return
             
-            # Firmar mensaje usando el método correcto
-            signature = self.signature.sign_message(message, self.signature_keys['private_key'])
-            
-            # Generar hash del mensaje para mostrar
-            message_hash = self.signature.hash_func.sha256_wrapper(message)
+            # Hashear una sola vez: el mismo hash se firma y se muestra
+            digest = new_hash("SHA256", text_to_bytes(message)).digest()
+            signature_bytes = self.signature.sign_digest(digest, self.signature_keys['private_key'])
+            signature = to_hex(signature_bytes)
+            message_hash = digest.hex()
             
-            self.current_signature = signature
+            self.current_signature = signature_bytes
             self.current_message_hash = message_hash
             
             # Mostrar firma
             self.signature_result.configure(state="normal")
             self.signature_result.delete("1.0", tk.END)
-            self.signature_result.insert("1.0", str(self.current_signature))
+            self.signature_result.insert("1.0", signature)
             self.signature_result.configure(state="disabled")
             
             # Mostrar proceso
@@ -2263,8 +2326,10 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
                 self.show_warning("Por favor firme el mensaje primero")
                 return
             
-            # Verificar firma usando el método correcto
-            is_valid = self.signature.verify_signature(message, self.current_signature, self.signature_keys['public_key'])
+            # Hash del mensaje actual (puede haber cambiado desde la firma)
+            digest = new_hash("SHA256", text_to_bytes(message)).digest()
+            is_valid = self.signature.verify_digest(digest, self.current_signature,
+                                                    self.signature_keys['public_key'])
             
             # Mostrar resultado de verificación
             self.signature_verification.configure(state="normal")
@@ -2282,8 +2347,8 @@ Uso recomendado: Solo para propósitos educativos y compatibilidad legacy."""
             
             # Mostrar proceso de verificación
             verification_data = {
-                'signature': self.current_signature,
-                'message_hash': self.current_message_hash,
+                'signature': to_hex(self.current_signature),
+                'message_hash': digest.hex(),
                 'is_valid': is_valid
             }
             self.display_signature_process("Verificación", message, hash_algo, verification_data)
@@ -2546,7 +2611,8 @@ Aplicaciones:
             result_text += f"• Tamaño original: {encoded_data['original_size']} bits\n"
             result_text += f"• Tamaño comprimido: {encoded_data['compressed_size']} bits\n"
             result_text += f"• Ratio de compresión: {encoded_data['compression_ratio']:.2f}%\n"
-            result_text += f"• Ahorro de espacio: {encoded_data['space_saved']:.2f}%\n\n"
+            result_text += f"• Ahorro de espacio: {encoded_data['space_saved']:.2f}%\n"
+            result_text += f"• Contenedor portátil (cabecera + datos): {len(encoded_data['container'])} bytes\n\n"
             result_text += f"El código binario ahora está en el campo de texto.\n"
             result_text += f"Presione 'Decodificar' para recuperar el texto original."
             
@@ -2597,7 +2663,7 @@ Aplicaciones:
             
             # Decodificar usando el método wrapper
             decoded_text = self.huffman.decode_for_gui(
-                self.last_encoded_data['encoded'], 
+                self.last_encoded_data['packed'], 
                 self.last_encoded_data['codes']
             )
             
@@ -3075,11 +3141,11 @@ Flujo correcto de Huffman:
         hash_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttb.Label(hash_frame, text="Algoritmo hash:").pack(anchor=tk.W)
-        self.integrity_hash_var = tk.StringVar(value="sha256")
+        self.integrity_hash_var = tk.StringVar(value="SHA256")
         hash_combo = ttb.Combobox(
             hash_frame,
             textvariable=self.integrity_hash_var,
-            values=["md5", "sha1", "sha256", "sha512"],
+            values=available_algorithms(),
             state="readonly",
             width=20
         )
@@ -3113,6 +3179,14 @@ Flujo correcto de Huffman:
         )
         verify_btn.pack(side=tk.LEFT, padx=5)
         
+        compress_btn = ttb.Button(
+            buttons_frame,
+            text="🗜️ Comprimir (Huffman)",
+            bootstyle=SECONDARY,
+            command=self.compress_integrity_file
+        )
+        compress_btn.pack(side=tk.LEFT, padx=5)
+        
         clear_btn = ttb.Button(
             buttons_frame,
             text="🗑️ Limpiar",
@@ -3284,16 +3358,10 @@ Flujo correcto de Huffman:
                 self.show_error("El archivo seleccionado no existe")
                 return
             
-            # Verificar con múltiples algoritmos
-            algorithms = ["md5", "sha1", "sha256", "sha512"]
-            results = []
-            
-            for algorithm in algorithms:
-                try:
-                    file_hash = self.integrity_verifier.calculate_file_hash(self.current_file_path, algorithm)
-                    results.append(f"{algorithm.upper()}: {file_hash}")
-                except Exception as e:
-                    results.append(f"{algorithm.upper()}: Error - {str(e)}")
+            # Verificar con todos los algoritmos nativos (una sola lectura del archivo)
+            algorithms = available_algorithms(native=True)
+            hashes = self.integrity_verifier.calculate_file_hashes(self.current_file_path, algorithms)
+            results = [f"{algorithm}: {file_hash}" for algorithm, file_hash in hashes.items()]
             
             # Mostrar resultados
             result_text = "📊 VERIFICACIÓN COMPLETA DE INTEGRIDAD\n"
@@ -3314,6 +3382,48 @@ Flujo correcto de Huffman:
         except Exception as e:
             self.show_error(f"Error en verificación de integridad: {str(e)}")
     
+    def compress_integrity_file(self):
+        """Comprimir el archivo seleccionado con Huffman byte a byte"""
+        try:
+            if not self.current_file_path:
+                self.show_warning("Por favor seleccione un archivo")
+                return
+            
+            if not os.path.exists(self.current_file_path):
+                self.show_error("El archivo seleccionado no existe")
+                return
+            
+            # Cualquier archivo: alfabeto de 256 bytes, junto al original
+            output_path = self.current_file_path + HUFFMAN_FILE_EXTENSION
+            if os.path.exists(output_path) and not messagebox.askyesno(
+                    "Sobrescribir", f"Ya existe {os.path.basename(output_path)}. ¿Desea reemplazarlo?"):
+                self.update_status("Compresión cancelada")
+                return
+            
+            start = time.perf_counter()
+            stats = self.huffman.compress_file(self.current_file_path, output_path)
+            elapsed = time.perf_counter() - start
+            
+            result_text = "🗜️ COMPRESIÓN HUFFMAN (BYTES)\n"
+            result_text += "=" * 50 + "\n"
+            result_text += f"Archivo: {os.path.basename(self.current_file_path)}\n"
+            result_text += f"Salida: {os.path.basename(output_path)}\n\n"
+            result_text += f"• Tamaño original: {stats['original_bytes']} bytes\n"
+            result_text += f"• Tamaño comprimido: {stats['compressed_bytes']} bytes\n"
+            result_text += f"• Ratio de compresión: {stats['compression_ratio'] * 100:.2f}%\n"
+            if elapsed > 0:
+                result_text += f"• Velocidad: {stats['original_bytes'] / elapsed / 1e6:.2f} MB/s\n"
+            
+            self.integrity_result_text.configure(state="normal")
+            self.integrity_result_text.delete(1.0, tk.END)
+            self.integrity_result_text.insert(tk.END, result_text)
+            self.integrity_result_text.configure(state="disabled")
+            
+            self.show_info(f"Archivo comprimido en {os.path.basename(output_path)}")
+            
+        except Exception as e:
+            self.show_error(f"Error al comprimir archivo: {str(e)}")
+    
     def clear_integrity_results(self):
         """Limpiar todos los resultados"""
         try:
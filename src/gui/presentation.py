@@ -0,0 +1,102 @@
+"""
+🖥️ Presentación - Conversión de datos para la interfaz
+=====================================================
+
+Conversiones entre el texto que escribe el usuario y los bytes con que
+trabajan los cifradores de ``src.crypto.modern``. Solo la interfaz
+gráfica las usa; las APIs criptográficas reciben y devuelven buffers.
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+from typing import List, Tuple
+
+try:
+    from ..utils.exceptions import InvalidInputError, InvalidFormatError
+except ImportError:
+    from src.utils.exceptions import InvalidInputError, InvalidFormatError
+
+
+# ===== TEXTO =====
+
+def text_to_bytes(text: str) -> bytes:
+    """
+    Codificar texto del usuario en UTF-8
+
+    Args:
+        text (str): Texto
+
+    Returns:
+        bytes: Texto codificado
+    """
+    return text.encode('utf-8')
+
+
+def bytes_to_text(data: bytes) -> str:
+    """
+    Decodificar bytes como texto UTF-8
+
+    Args:
+        data (bytes): Datos a mostrar
+
+    Returns:
+        str: Texto decodificado
+    """
+    try:
+        return bytes(data).decode('utf-8')
+    except UnicodeDecodeError:
+        raise InvalidInputError("Los datos no son texto UTF-8 válido")
+
+
+# ===== HEXADECIMAL =====
+
+def to_hex(data: bytes) -> str:
+    """
+    Representación hexadecimal de un buffer
+
+    Args:
+        data (bytes): Datos
+
+    Returns:
+        str: Hexadecimal en minúsculas
+    """
+    return bytes(data).hex()
+
+
+def from_hex(text: str) -> bytes:
+    """
+    Leer un valor hexadecimal escrito por el usuario
+
+    Args:
+        text (str): Hexadecimal (se ignoran los espacios)
+
+    Returns:
+        bytes: Datos
+    """
+    try:
+        return bytes.fromhex(text.strip())
+    except ValueError:
+        raise InvalidFormatError("El valor no es hexadecimal válido", "hex")
+
+
+# ===== RSA =====
+
+def rsa_blocks(ciphertext: bytes, public_key: Tuple[int, int]) -> List[int]:
+    """
+    Separar un texto cifrado RSA en sus bloques como enteros
+
+    Args:
+        ciphertext (bytes): Bloques de byte_length bytes concatenados
+        public_key (Tuple[int, int]): (e, n)
+
+    Returns:
+        List[int]: Valor de cada bloque
+    """
+    length = (public_key[1].bit_length() + 7) // 8
+    view = memoryview(ciphertext)
+    return [int.from_bytes(view[i:i + length], 'big') for i in range(0, len(view), length)]
+
+
+__all__ = ['text_to_bytes', 'bytes_to_text', 'to_hex', 'from_hex', 'rsa_blocks']
@@ -128,6 +128,9 @@ RSA_MIN_KEY_SIZE = 512
 RSA_MAX_KEY_SIZE = 4096
 RSA_PUBLIC_EXPONENT = 65537  # Comúnmente usado
 
+# Vigencia (segundos) del par de claves reutilizado por las demos de firma
+SIGNATURE_KEY_TTL = 600
+
 # Números primos pequeños para testing
 SMALL_PRIMES = [
     2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71,
@@ -142,6 +145,10 @@ HASH_ALGORITHMS = {
     'SHA1': 160,     # bits
     'SHA256': 256,   # bits
     'SHA512': 512,   # bits
+    'BLAKE2b': 512,  # bits
+    'BLAKE2s': 256,  # bits
+    'SHA3_256': 256, # bits
+    'SHA3_512': 512, # bits
     'Custom64': 64,  # bits
     'Custom128': 128, # bits
     'Custom256': 256  # bits
@@ -151,8 +158,10 @@ HASH_DEFAULT_ALGORITHM = 'SHA256'
 
 # ===== CONSTANTES DE DES =====
 DES_KEY_SIZE = 8  # bytes
+TRIPLE_DES_KEY_SIZES = [16, 24]  # bytes, 3DES EDE con dos o tres claves
 DES_BLOCK_SIZE = 8  # bytes
-DES_MODES = ['ECB', 'CBC']
+DES_TAG_SIZE = 8  # bytes, etiqueta de autenticación del modo EAX
+DES_MODES = ['ECB', 'CBC', 'CTR', 'EAX']
 DES_DEFAULT_MODE = 'CBC'
 
 # ===== CONSTANTES DE HUFFMAN =====
@@ -184,6 +193,11 @@ FILE_EXTENSIONS = {
     'archive': ['.zip', '.rar', '.7z', '.tar', '.gz']
 }
 
+# Extensión de las firmas separadas (junto al archivo firmado)
+SIGNATURE_FILE_EXTENSION = '.sig'
+# Extensión de los archivos comprimidos con Huffman (junto al original)
+HUFFMAN_FILE_EXTENSION = '.huf'
+
 DEFAULT_ENCODING = 'utf-8'
 BACKUP_ENCODING = 'latin-1'
 
@@ -298,7 +312,10 @@ def is_valid_key_size(algorithm: str, key_size: int) -> bool:
 
 def get_hash_bit_size(algorithm: str) -> int:
     """Obtener tamaño en bits del algoritmo hash"""
-    return HASH_ALGORITHMS.get(algorithm.upper(), 0)
+    for name, bits in HASH_ALGORITHMS.items():
+        if name.upper() == algorithm.upper():
+            return bits
+    return 0
 
 # ===== EXPORTAR CONSTANTES =====
 __all__ = [
@@ -308,10 +325,11 @@ __all__ = [
     'CAESAR_MIN_KEY', 'CAESAR_MAX_KEY', 'CAESAR_DEFAULT_KEY',
     'VIGENERE_MIN_KEY_LENGTH', 'VIGENERE_MAX_KEY_LENGTH',
     'PLAYFAIR_MATRIX_SIZE', 'PLAYFAIR_ALPHABET', 'PLAYFAIR_SUBSTITUTE_CHAR', 'PLAYFAIR_DUPLICATE_CHAR', 'PLAYFAIR_REPLACEMENT_CHAR',
-    'RSA_KEY_SIZES', 'RSA_DEFAULT_KEY_SIZE', 'SMALL_PRIMES',
+    'RSA_KEY_SIZES', 'RSA_DEFAULT_KEY_SIZE', 'SIGNATURE_KEY_TTL', 'SMALL_PRIMES',
     'HASH_ALGORITHMS', 'HASH_DEFAULT_ALGORITHM',
-    'DES_KEY_SIZE', 'DES_BLOCK_SIZE', 'DES_MODES',
-    'VALIDATION_RULES', 'FILE_EXTENSIONS', 'DEFAULT_ENCODING',
+    'DES_KEY_SIZE', 'TRIPLE_DES_KEY_SIZES', 'DES_BLOCK_SIZE', 'DES_TAG_SIZE', 'DES_MODES', 'DES_DEFAULT_MODE',
+    'BLOCKCHAIN_HASH_ALGORITHM',
+    'VALIDATION_RULES', 'FILE_EXTENSIONS', 'SIGNATURE_FILE_EXTENSION', 'HUFFMAN_FILE_EXTENSION', 'DEFAULT_ENCODING',
     'COLORS', 'REGEX_PATTERNS', 'TEST_CASES', 'PERFORMANCE_LIMITS',
     'LOG_LEVELS', 'LOG_FORMATS',
     'get_alphabet', 'get_alphabet_size', 'is_valid_key_size', 'get_hash_bit_size'
@@ -0,0 +1,144 @@
+"""
+🧪 Pruebas Unitarias - Calidad Estadística de Hash
+=================================================
+
+Conjunto de pruebas unitarias para el banco de calidad de los hash:
+- Generación de entradas y digests por matriz
+- Métricas de avalancha, sesgo, cubetas y colisiones
+- Independencia del resultado respecto al número de procesos
+- Detección de regresiones entre reportes
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import sys
+import os
+import json
+import copy
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto import hashing, hash_kernels, hash_quality
+from src.utils.exceptions import *
+
+
+@unittest.skipUnless(hash_kernels.NUMPY_AVAILABLE, "NumPy no disponible")
+class TestHashQualityHarness(unittest.TestCase):
+    """Pruebas para el banco de calidad estadística"""
+
+    SAMPLES = 4096
+
+    @classmethod
+    def setUpClass(cls):
+        """Un reporte pequeño compartido por las pruebas"""
+        cls.report = hash_quality.evaluate_quality(samples=cls.SAMPLES, chunk_size=1000, workers=1)
+
+    def test_digest_matrix_matches_hash_objects(self):
+        """Probar que los digests por matriz coinciden con los objetos hash"""
+        for family in hash_quality.INPUT_FAMILIES:
+            matrix = hash_quality.generate_inputs(family, 990, 20, 11, seed=1)
+            for name in ("Custom64", "Custom128", "Custom256", "SHA256"):
+                digests = hash_quality.digest_matrix(name, matrix)
+                for row, digest in zip(matrix, digests):
+                    self.assertEqual(digest.tobytes(), hashing.new_hash(name, row.tobytes()).digest())
+
+    def test_inputs_independent_of_chunking(self):
+        """Probar que las entradas aleatorias no dependen del bloque pedido"""
+        whole = hash_quality.generate_inputs(hash_quality.RANDOM_INPUTS, 0, 9000, 8, seed=3)
+        part = hash_quality.generate_inputs(hash_quality.RANDOM_INPUTS, 4000, 300, 8, seed=3)
+        self.assertTrue((whole[4000:4300] == part).all())
+
+    def test_counter_inputs(self):
+        """Probar las entradas de contador decimal"""
+        matrix = hash_quality.generate_inputs(hash_quality.COUNTER_INPUTS, 98, 3, 6, seed=0)
+        self.assertEqual([row.tobytes() for row in matrix], [b"000098", b"000099", b"000100"])
+
+    def test_report_is_json(self):
+        """Probar que el reporte es serializable y contiene la referencia"""
+        loaded = json.loads(json.dumps(self.report))
+        self.assertEqual(loaded["reference"], "SHA256")
+        self.assertEqual(set(loaded["algorithms"]), {"Custom64", "Custom128", "Custom256", "SHA256"})
+        for result in loaded["algorithms"].values():
+            self.assertEqual(set(result["families"]), set(hash_quality.INPUT_FAMILIES))
+            self.assertGreater(result["throughput_mb_s"], 0)
+
+    def test_reference_metrics_are_ideal(self):
+        """Probar que SHA-256 obtiene métricas cercanas a las ideales"""
+        for metrics in self.report["algorithms"]["SHA256"]["families"].values():
+            self.assertEqual(metrics["samples"], self.SAMPLES)
+            self.assertAlmostEqual(metrics["avalanche_mean"], 0.5, delta=0.01)
+            self.assertLess(metrics["bit_bias_max"], 6 * metrics["bit_bias_noise"])
+            self.assertEqual(metrics["collisions_64"], 0)
+            self.assertLess(metrics["collision_z_32"], 4)
+
+    def test_detects_weak_custom_hashes(self):
+        """Probar que se detectan las debilidades conocidas de los hash personalizados"""
+        for name in ("Custom64", "Custom128", "Custom256"):
+            result = self.report["algorithms"][name]
+            counter = result["families"][hash_quality.COUNTER_INPUTS]
+            self.assertGreater(counter["collisions_32"], 100 * (counter["collisions_32_expected"] + 1))
+            self.assertIn("counter:collision_z_32", result["regressions"])
+
+    def test_result_independent_of_chunking_and_workers(self):
+        """Probar que el resultado no depende de los bloques ni los procesos"""
+        options = dict(algorithms=["Custom64"], samples=3000, families=[hash_quality.RANDOM_INPUTS])
+        single = hash_quality.evaluate_quality(chunk_size=3000, workers=1, **options)
+        parallel = hash_quality.evaluate_quality(chunk_size=700, workers=2, **options)
+        for name in ("Custom64", "SHA256"):
+            self.assertEqual(single["algorithms"][name]["families"], parallel["algorithms"][name]["families"])
+
+    def test_compare_reports(self):
+        """Probar la detección de regresiones entre dos reportes"""
+        self.assertEqual(hash_quality.compare_reports(self.report, self.report), [])
+
+        faster = copy.deepcopy(self.report)
+        faster["algorithms"]["Custom256"]["throughput_mb_s"] *= 2
+        self.assertTrue(any("Custom256: rendimiento" in line
+                            for line in hash_quality.compare_reports(self.report, faster)))
+
+        better = copy.deepcopy(self.report)
+        better["algorithms"]["Custom64"]["families"]["random"]["avalanche_bias"] = 0.0
+        self.assertIn("Custom64: random:avalanche_bias",
+                      " ".join(hash_quality.compare_reports(self.report, better)))
+
+    def test_invalid_arguments(self):
+        """Probar argumentos inválidos"""
+        with self.assertRaises(InvalidInputError):
+            hash_quality.evaluate_quality(samples=0)
+        with self.assertRaises(InvalidInputError):
+            hash_quality.evaluate_quality(samples=10, families=["binario"])
+        with self.assertRaises(InvalidInputError):
+            hash_quality.evaluate_quality(algorithms=["MD4"], samples=10)
+
+
+class TestTextAvalanche(unittest.TestCase):
+    """Pruebas para la medida de avalancha de un texto"""
+
+    def test_text_avalanche(self):
+        """Probar la avalancha de un texto concreto"""
+        self.assertAlmostEqual(hash_quality.text_avalanche("SHA256", b"hola mundo"), 0.5, delta=0.05)
+        self.assertTrue(0.0 < hash_quality.text_avalanche("Custom64", b"a" * 64) < 1.0)
+
+    def test_text_avalanche_sample(self):
+        """Probar que solo se analiza la muestra inicial de textos largos"""
+        head = bytes(range(256)) * 4
+        long_text = head + b"x" * (1 << 20)
+        self.assertEqual(hash_quality.text_avalanche("SHA256", long_text, max_bytes=len(head)),
+                         hash_quality.text_avalanche("SHA256", head))
+
+    def test_empty_text(self):
+        """Probar que un texto vacío es rechazado"""
+        with self.assertRaises(InvalidInputError):
+            hash_quality.text_avalanche("SHA256", b"")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
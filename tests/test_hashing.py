@@ -0,0 +1,412 @@
+"""
+🧪 Pruebas Unitarias - Objetos Hash Incrementales
+================================================
+
+Conjunto de pruebas unitarias para los hash personalizados incrementales:
+- Equivalencia con las funciones de una sola llamada
+- Procesamiento por partes y copia del estado
+- Kernels vectorizados para lotes de mensajes
+- Varios algoritmos en una sola pasada
+- Caché de resultados por contenido
+- Registro central de algoritmos
+- Hash de archivos con el verificador de integridad
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import hashlib
+import io
+from unittest import mock
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto import hashing, hash_kernels
+from src.crypto.modern import CustomHash
+from src.crypto.tools import IntegrityVerifier
+from src.utils.exceptions import *
+from src.utils.constants import HASH_ALGORITHMS, get_hash_bit_size
+
+
+# ===== IMPLEMENTACIONES DE REFERENCIA (una sola llamada, byte a byte) =====
+def reference_64(data: bytes) -> str:
+    hash_val = 0x811c9dc5
+    for byte in data:
+        hash_val ^= byte
+        hash_val *= 0x01000193
+        hash_val &= 0xFFFFFFFFFFFFFFFF
+    hash_val ^= hash_val >> 32
+    hash_val ^= hash_val >> 16
+    hash_val ^= hash_val >> 8
+    hash_val &= 0xFFFFFFFFFFFFFFFF
+    return f"{hash_val:016x}"
+
+
+def reference_128(data: bytes) -> str:
+    hash1 = 0x811c9dc5
+    for i, byte in enumerate(data):
+        hash1 ^= byte
+        hash1 *= 0x01000193
+        hash1 ^= i
+        hash1 &= 0xFFFFFFFFFFFFFFFF
+    hash2 = 0x811c9dc5
+    for i, byte in enumerate(reversed(data)):
+        hash2 ^= byte
+        hash2 *= 0x01000193
+        hash2 ^= (i * 3)
+        hash2 &= 0xFFFFFFFFFFFFFFFF
+    return f"{hash1:016x}{hash2:016x}"
+
+
+def reference_256(data: bytes) -> str:
+    hashes = []
+    seeds = [0x811c9dc5, 0x9E3779B9, 0x85ebca6b, 0xc2b2ae35]
+    multipliers = [0x01000193, 0x40014141, 0x27d4eb2d, 0x165667b1]
+    for seed, mult in zip(seeds, multipliers):
+        hash_val = seed
+        for i, byte in enumerate(data):
+            hash_val ^= byte
+            hash_val *= mult
+            hash_val ^= (i * seed) & 0xFF
+            hash_val &= 0xFFFFFFFFFFFFFFFF
+        hash_val ^= hash_val >> 32
+        hash_val ^= hash_val >> 16
+        hash_val &= 0xFFFFFFFFFFFFFFFF
+        hashes.append(f"{hash_val:016x}")
+    return ''.join(hashes)
+
+
+REFERENCES = {
+    "custom64": reference_64,
+    "custom128": reference_128,
+    "custom256": reference_256,
+}
+
+
+class TestHashObjects(unittest.TestCase):
+    """Pruebas unitarias para los objetos hash incrementales"""
+
+    def setUp(self):
+        """Configurar el entorno de pruebas"""
+        self.data = "Integridad de datos — ñandú ✓ ".encode('utf-8') * 300 + bytes(range(256))
+
+    def test_matches_reference(self):
+        """Probar que el resultado coincide con la implementación original"""
+        for name, reference in REFERENCES.items():
+            for sample in (b"a", b"hello world", self.data):
+                self.assertEqual(hashing.new(name, sample).hexdigest(), reference(sample), name)
+
+    def test_custom_hash_unchanged(self):
+        """Probar que CustomHash conserva su salida"""
+        hasher = CustomHash()
+        text = "Mensaje de prueba ñ"
+        expected = text.encode('utf-8')
+        self.assertEqual(hasher.hash_64(text), reference_64(expected))
+        self.assertEqual(hasher.hash_128(text), reference_128(expected))
+        self.assertEqual(hasher.hash_256(text), reference_256(expected))
+
+    def test_chunked_updates(self):
+        """Probar que el resultado no depende de cómo se parten los datos"""
+        for name, reference in REFERENCES.items():
+            for size in (1, 7, 1000, 8192):
+                h = hashing.new(name)
+                for start in range(0, len(self.data), size):
+                    h.update(memoryview(self.data)[start:start + size])
+                self.assertEqual(h.hexdigest(), reference(self.data), (name, size))
+                self.assertEqual(len(h.digest()), h.digest_size)
+
+    def test_copy_and_continue(self):
+        """Probar copia del estado y digest() sin efectos secundarios"""
+        for name, reference in REFERENCES.items():
+            h = hashing.new(name, b"prefijo-")
+            clone = h.copy()
+            self.assertEqual(h.hexdigest(), h.hexdigest())
+
+            h.update(b"uno")
+            clone.update(b"dos")
+            self.assertEqual(h.hexdigest(), reference(b"prefijo-uno"))
+            self.assertEqual(clone.hexdigest(), reference(b"prefijo-dos"))
+
+    def test_large_input_spools(self):
+        """Probar la pasada inversa cuando los datos superan el búfer en memoria"""
+        data = os.urandom(hashing.SPOOL_MAX_SIZE // 4) * 5
+        h = hashing.custom128()
+        for start in range(0, len(data), 65536):
+            h.update(data[start:start + 65536])
+        self.assertEqual(h.hexdigest(), reference_128(data))
+
+    def test_close_releases_spool(self):
+        """Probar que close() y with cierran el archivo temporal"""
+        with hashing.custom128(b"datos") as h:
+            self.assertEqual(h.hexdigest(), reference_128(b"datos"))
+        self.assertTrue(h._spool.closed)
+
+        # La interfaz es abstracta: una subclase incompleta no se instancia
+        with self.assertRaises(TypeError):
+            type("Incompleto", (hashing._CustomHashObject,), {})()
+
+    def test_invalid_input(self):
+        """Probar entradas no soportadas"""
+        with self.assertRaises(TypeError):
+            hashing.custom64().update("texto")
+        with self.assertRaises(InvalidInputError):
+            hashing.new("custom512")
+
+
+@unittest.skipUnless(hash_kernels.NUMPY_AVAILABLE, "NumPy no disponible")
+class TestHashKernels(unittest.TestCase):
+    """Pruebas de los kernels vectorizados"""
+
+    def test_kernels_match_reference(self):
+        """Probar mensajes de longitudes distintas (incluido el vacío)"""
+        messages = [os.urandom(size) for size in (0, 1, 5, 255, 256, 257, 1000, 3)]
+        for name, reference in REFERENCES.items():
+            digests = hash_kernels.hash_many(name, messages)
+            self.assertEqual([d.hex() for d in digests], [reference(m) for m in messages], name)
+
+    def test_block_boundaries(self):
+        """Probar mensajes que cruzan varios bloques de posiciones"""
+        messages = [os.urandom(700), os.urandom(1500)]
+        original = hash_kernels.BLOCK_BYTES
+        try:
+            hash_kernels.BLOCK_BYTES = 8 * 2 * 64
+            digests = hash_kernels.hash_many("custom128", messages)
+        finally:
+            hash_kernels.BLOCK_BYTES = original
+        self.assertEqual([d.hex() for d in digests], [reference_128(m) for m in messages])
+
+    def test_dispatch(self):
+        """Probar que ambas rutas de hash_many coinciden"""
+        messages = [f"registro {i}".encode('utf-8') for i in range(40)]
+        self.assertEqual(hashing.hash_many("custom256", messages, vectorized=True),
+                         hashing.hash_many("custom256", messages, vectorized=False))
+        self.assertEqual(CustomHash().hash_many(["a", "bc"], "64"), [reference_64(b"a"), reference_64(b"bc")])
+
+
+class TestMultiDigest(unittest.TestCase):
+    """Pruebas del hash múltiple en una sola pasada"""
+
+    ALGORITHMS = ["SHA256", "SHA1", "MD5", "SHA512", "Custom64", "Custom128", "Custom256"]
+
+    def setUp(self):
+        """Configurar el entorno de pruebas"""
+        self.data = os.urandom(300000)
+
+    def expected(self, data: bytes) -> dict:
+        return {
+            "SHA256": hashlib.sha256(data).hexdigest(),
+            "SHA1": hashlib.sha1(data).hexdigest(),
+            "MD5": hashlib.md5(data).hexdigest(),
+            "SHA512": hashlib.sha512(data).hexdigest(),
+            "Custom64": reference_64(data),
+            "Custom128": reference_128(data),
+            "Custom256": reference_256(data),
+        }
+
+    def test_multi_digest_matches_single(self):
+        """Probar que cada resultado coincide con el cálculo individual"""
+        result = hashing.multi_digest(self.data, self.ALGORITHMS, chunk_size=65536)
+        self.assertEqual(result, self.expected(self.data))
+
+    def test_without_threads(self):
+        """Probar el modo sin hilos y la entrada de texto"""
+        text = "texto ñ" * 100
+        with hashing.MultiHasher(["sha256", "custom-64"], max_threads=0) as hasher:
+            hasher.update(text.encode('utf-8'))
+            result = hasher.hexdigests()
+        self.assertEqual(result, hashing.multi_digest(text, ["SHA256", "Custom64"]))
+        self.assertEqual(list(result), ["SHA256", "Custom64"])
+
+    def test_stream(self):
+        """Probar lectura de un flujo por bloques"""
+        result = hashing.multi_digest_stream(io.BytesIO(self.data), ["MD5", "SHA1"], chunk_size=4096)
+        self.assertEqual(result, {"MD5": hashlib.md5(self.data).hexdigest(),
+                                  "SHA1": hashlib.sha1(self.data).hexdigest()})
+
+    def test_invalid_usage(self):
+        """Probar algoritmos desconocidos y uso tras finalizar"""
+        with self.assertRaises(InvalidInputError):
+            hashing.MultiHasher(["SHA256", "SHA-999"])
+        with self.assertRaises(InvalidInputError):
+            hashing.MultiHasher([])
+        hasher = hashing.MultiHasher(["SHA256", "MD5"])
+        hasher.hexdigests()
+        with self.assertRaises(HashError):
+            hasher.update(b"tarde")
+
+
+class TestDigestCache(unittest.TestCase):
+    """Pruebas de la caché de resultados"""
+
+    def setUp(self):
+        """Configurar el entorno de pruebas"""
+        self.cache = hashing.DigestCache(max_size=2, enabled=True)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "datos.bin")
+
+    def tearDown(self):
+        """Limpiar después de las pruebas"""
+        self.temp_dir.cleanup()
+
+    def write(self, data: bytes, age_seconds: int = 60) -> None:
+        """Escribir el archivo con una fecha de modificación en el pasado"""
+        with open(self.path, 'wb') as f:
+            f.write(data)
+        stamp = os.stat(self.path).st_mtime - age_seconds
+        os.utime(self.path, (stamp, stamp))
+
+    def test_lru_and_counters(self):
+        """Probar expulsión LRU y contadores de aciertos"""
+        for name in ("a", "b", "c"):
+            self.cache.put(name, name.upper())
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("c"), "C")
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_custom_hash_uses_cache(self):
+        """Probar que CustomHash reutiliza resultados de textos repetidos"""
+        hasher = CustomHash(cache=self.cache)
+        first = hasher.hash_256("texto repetido")
+        self.assertEqual(hasher.hash_256("texto repetido"), first)
+        self.assertTrue(hasher.verify_integrity("texto repetido", first, "256"))
+        self.assertEqual(self.cache.stats()["hits"], 2)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_disabled_cache(self):
+        """Probar que una caché desactivada no guarda nada"""
+        cache = hashing.DigestCache(enabled=False)
+        hasher = CustomHash(cache=cache)
+        self.assertEqual(hasher.hash_64("abc"), reference_64(b"abc"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (0, 0))
+
+    def test_file_cache_invalidation(self):
+        """Probar que un archivo modificado se vuelve a calcular"""
+        verifier = IntegrityVerifier(cache=self.cache)
+        self.write(b"version 1")
+        self.assertEqual(verifier.calculate_file_hash(self.path), hashlib.sha256(b"version 1").hexdigest())
+        result = verifier.verify_file_integrity(self.path, hashlib.sha256(b"version 1").hexdigest())
+        self.assertTrue(result["is_valid"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+        # Mismo tamaño, contenido distinto y otra fecha de modificación
+        self.write(b"version 2", age_seconds=30)
+        self.assertEqual(verifier.calculate_file_hash(self.path), hashlib.sha256(b"version 2").hexdigest())
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_recent_files_are_not_cached(self):
+        """Probar que no se guardan archivos modificados hace muy poco"""
+        verifier = IntegrityVerifier(cache=self.cache)
+        self.write(b"reciente", age_seconds=0)
+        verifier.calculate_file_hash(self.path)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_file_changed_while_hashing(self):
+        """Probar que no se guarda el hash de un archivo modificado durante la lectura"""
+        verifier = IntegrityVerifier(cache=self.cache)
+        self.write(b"version 1")
+        hash_stream = hashing.hash_stream
+
+        def modify_while_reading(*args):
+            result = hash_stream(*args)
+            self.write(b"version 2", age_seconds=30)
+            return result
+
+        with mock.patch.object(hashing, "hash_stream", side_effect=modify_while_reading):
+            verifier.calculate_file_hash(self.path)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(verifier.calculate_file_hash(self.path), hashlib.sha256(b"version 2").hexdigest())
+
+    def test_multi_file_hashes_partial_cache(self):
+        """Probar que el hash múltiple solo calcula lo que falta"""
+        verifier = IntegrityVerifier(cache=hashing.DigestCache(max_size=10, enabled=True))
+        self.write(b"contenido")
+        verifier.calculate_file_hash(self.path, "md5")
+        hashes = verifier.calculate_file_hashes(self.path, ["md5", "sha1"])
+        self.assertEqual(verifier.cache.stats()["hits"], 1)
+        self.assertEqual(hashes, {"MD5": hashlib.md5(b"contenido").hexdigest(),
+                                  "SHA1": hashlib.sha1(b"contenido").hexdigest()})
+
+
+class TestHashRegistry(unittest.TestCase):
+    """Pruebas del registro central de algoritmos"""
+
+    def test_all_configured_algorithms_registered(self):
+        """Probar que cada algoritmo configurado tiene su fábrica"""
+        self.assertEqual(set(hashing.available_algorithms()), set(HASH_ALGORITHMS))
+        for name, bits in HASH_ALGORITHMS.items():
+            hasher = hashing.new_hash(name, b"abc")
+            self.assertEqual(len(hasher.digest()) * 8, bits, name)
+            self.assertEqual(get_hash_bit_size(name), bits)
+
+    def test_matches_hashlib(self):
+        """Probar los algoritmos modernos frente a hashlib"""
+        data = os.urandom(5000)
+        for name, module_name in (("BLAKE2b", "blake2b"), ("BLAKE2s", "blake2s"),
+                                  ("SHA3_256", "sha3_256"), ("SHA3_512", "sha3_512"), ("SHA512", "sha512")):
+            self.assertEqual(hashing.new_hash(name, data).hexdigest(),
+                             hashlib.new(module_name, data).hexdigest())
+
+    def test_name_normalization(self):
+        """Probar nombres con mayúsculas, guiones y guiones bajos"""
+        self.assertEqual(hashing.canonical_algorithm("sha-256"), "SHA256")
+        self.assertEqual(hashing.canonical_algorithm("sha3-256"), "SHA3_256")
+        self.assertEqual(hashing.canonical_algorithm("blake2b"), "BLAKE2b")
+        self.assertEqual(hashing.available_algorithms(native=False), ["Custom64", "Custom128", "Custom256"])
+        with self.assertRaises(InvalidInputError):
+            hashing.get_algorithm("whirlpool")
+
+    def test_used_by_custom_hash_and_verifier(self):
+        """Probar CustomHash e IntegrityVerifier con algoritmos del registro"""
+        hasher = CustomHash()
+        expected = hashlib.sha512(b"datos").hexdigest()
+        self.assertEqual(hasher.hash_text("datos", "SHA512"), expected)
+        self.assertTrue(hasher.verify_integrity("datos", expected, "sha512"))
+        self.assertTrue(hasher.verify_integrity("datos", reference_128(b"datos"), "128"))
+        with self.assertRaises(InvalidInputError):
+            hasher.verify_integrity("datos", expected, "512")
+
+        verifier = IntegrityVerifier()
+        self.assertEqual(verifier.calculate_text_hash("datos", "blake2s"), hashlib.blake2s(b"datos").hexdigest())
+
+
+class TestFileHashing(unittest.TestCase):
+    """Pruebas del hash de archivos por bloques"""
+
+    def test_file_hash_custom_algorithms(self):
+        """Probar hash de archivos con los algoritmos personalizados"""
+        verifier = IntegrityVerifier()
+        data = bytes(range(256)) * 100
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "datos.bin")
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            for name, reference in REFERENCES.items():
+                self.assertEqual(verifier.calculate_file_hash(path, name), reference(data))
+
+            result = verifier.verify_file_integrity(path, reference_256(data), "custom256")
+            self.assertTrue(result["is_valid"])
+
+            hashes = verifier.calculate_file_hashes(path, ["sha256", "md5", "custom128"])
+            self.assertEqual(hashes, {"SHA256": hashlib.sha256(data).hexdigest(),
+                                      "MD5": hashlib.md5(data).hexdigest(),
+                                      "Custom128": reference_128(data)})
+            with self.assertRaises(FileNotFoundError):
+                verifier.calculate_file_hashes(os.path.join(temp_dir, "no.bin"), ["md5"])
+
+if __name__ == '__main__':
+    # Configurar el entorno de pruebas
+    unittest.main(verbosity=2)
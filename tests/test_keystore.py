@@ -0,0 +1,176 @@
+"""
+🧪 Pruebas Unitarias - Almacén de Claves
+=======================================
+
+Conjunto de pruebas unitarias para el almacén persistente de claves RSA:
+- Serialización binaria de pares de claves
+- Persistencia y carga por nombre
+- Caché LRU
+- Integración con RSACipher y DigitalSignature
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto.keystore import KeyStore, encode_key_pair, decode_key_pair, COMPACT_MIN_BYTES
+from src.crypto.modern import RSACipher, DigitalSignature
+from src.utils.exceptions import *
+
+
+class TestKeyStore(unittest.TestCase):
+    """Pruebas unitarias para el almacén de claves"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generar un par de claves compartido por las pruebas"""
+        cls.rsa = RSACipher(key_size=512)
+        cls.public_key, cls.private_key = cls.rsa.generate_keys()
+
+    def setUp(self):
+        """Configurar el entorno de pruebas"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "keys", "keystore.bin")
+        self.store = KeyStore(self.path, cache_size=2)
+
+    def tearDown(self):
+        """Limpiar después de las pruebas"""
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_encode_decode_roundtrip(self):
+        """Probar serialización binaria de claves"""
+        body = encode_key_pair(self.public_key, self.private_key, 512, self.rsa.primes)
+        entry = decode_key_pair(body)
+
+        self.assertEqual(entry["public_key"], self.public_key)
+        self.assertEqual(entry["private_key"], self.private_key)
+        self.assertEqual(entry["primes"], self.rsa.primes)
+        self.assertEqual(entry["key_size"], 512)
+
+    def test_save_and_load_from_disk(self):
+        """Probar persistencia entre instancias del almacén"""
+        self.store.save("demo", self.public_key, self.private_key, 512)
+        self.store.close()
+
+        reopened = KeyStore(self.path)
+        try:
+            self.assertIn("demo", reopened)
+            self.assertEqual(reopened.load("demo"), (self.public_key, self.private_key))
+        finally:
+            reopened.close()
+
+    def test_overwrite_and_delete(self):
+        """Probar reemplazo y eliminación de claves"""
+        other = RSACipher(key_size=512)
+        other_public, other_private = other.generate_keys()
+
+        self.store.save("demo", self.public_key, self.private_key)
+        self.store.save("demo", other_public, other_private)
+        self.assertEqual(self.store.load("demo"), (other_public, other_private))
+
+        self.store.delete("demo")
+        self.assertNotIn("demo", self.store)
+        with self.assertRaises(RSAError):
+            self.store.load("demo")
+
+        # El estado también debe persistir tras reabrir el archivo
+        self.store.close()
+        self.assertEqual(len(self.store), 0)
+
+    def test_lru_eviction(self):
+        """Probar que la caché respeta su capacidad"""
+        for name in ("a", "b", "c"):
+            self.store.save(name, self.public_key, self.private_key)
+
+        self.assertEqual(len(self.store._cache), 2)
+        self.assertNotIn("a", self.store._cache)
+
+        # Cargar desde disco una clave expulsada de la caché
+        self.assertEqual(self.store.load("a"), (self.public_key, self.private_key))
+        self.assertEqual(self.store.names(), ["a", "b", "c"])
+
+    def test_invalid_file(self):
+        """Probar archivo que no es un almacén de claves"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'wb') as f:
+            f.write(b"not a keystore")
+
+        with self.assertRaises(FileFormatError):
+            self.store.names()
+
+    @unittest.skipIf(os.name == 'nt', "Permisos POSIX")
+    def test_file_permissions(self):
+        """Probar que el archivo se crea legible solo por el propietario"""
+        self.store.save("demo", self.public_key, self.private_key)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_truncated_tail_record(self):
+        """Probar recuperación tras un registro final incompleto"""
+        self.store.save("a", self.public_key, self.private_key)
+        self.store.save("b", self.public_key, self.private_key)
+        self.store.close()
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size - 10)
+
+        reopened = KeyStore(self.path)
+        try:
+            self.assertEqual(reopened.names(), ["a"])
+            reopened.save("c", self.public_key, self.private_key)
+            reopened.close()
+            self.assertEqual(reopened.names(), ["a", "c"])
+            self.assertEqual(reopened.load("c"), (self.public_key, self.private_key))
+        finally:
+            reopened.close()
+
+    def test_compaction(self):
+        """Probar compactación manual y automática del archivo"""
+        self.store.save("a", self.public_key, self.private_key)
+        for _ in range(5):
+            self.store.save("b", self.public_key, self.private_key)
+        size = os.path.getsize(self.path)
+
+        self.store.compact()
+        self.assertLess(os.path.getsize(self.path), size)
+        self.assertEqual(self.store.load("b"), (self.public_key, self.private_key))
+        self.store.close()
+        self.assertEqual(self.store.names(), ["a", "b"])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["keystore.bin"])
+
+        # Muchas regeneraciones de la misma clave no hacen crecer el archivo sin límite
+        for _ in range(500):
+            self.store.save("b", self.public_key, self.private_key)
+        self.assertLess(os.path.getsize(self.path), 3 * COMPACT_MIN_BYTES)
+        self.assertEqual(self.store.load("a"), (self.public_key, self.private_key))
+
+    def test_cipher_and_signature_integration(self):
+        """Probar carga de claves en RSACipher y DigitalSignature"""
+        self.rsa.save_keys("shared", self.store)
+
+        rsa = RSACipher()
+        public_key, private_key = rsa.load_keys("shared", self.store)
+        self.assertEqual(rsa.key_size, 512)
+        self.assertEqual(rsa.primes, self.rsa.primes)
+        self.assertEqual(rsa.decrypt(rsa.encrypt("Hola", public_key)), "Hola")
+
+        signature = DigitalSignature()
+        public_key, private_key = signature.load_keys("shared", self.store)
+        signed = signature.sign_message("Mensaje", private_key)
+        self.assertTrue(signature.verify_signature("Mensaje", signed, public_key))
+
+if __name__ == '__main__':
+    # Configurar el entorno de pruebas
+    unittest.main(verbosity=2)
@@ -16,6 +16,10 @@ Versión: 1.0.0
 import unittest
 import sys
 import os
+import io
+import hashlib
+import math
+import tempfile
 
 # Agregar el directorio src al path para importar módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -24,10 +28,26 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Importar las clases necesarias
-from src.crypto.modern import RSACipher, CustomHash, DESCipher, DigitalSignature
+from src.crypto.modern import RSACipher, CustomHash, DESCipher, DigitalSignature, PreparedPublicKey, prepare_public_key, pkcs1_encode
 from src.utils.constants import *
 from src.utils.exceptions import *
 
+class TrickleStream(io.RawIOBase):
+    """Flujo que entrega como mucho unos pocos bytes por lectura"""
+    
+    def __init__(self, data: bytes, step: int = 5):
+        self.data = memoryview(data)
+        self.step = step
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        size = min(len(buffer), self.step, len(self.data))
+        buffer[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
 class TestRSACipher(unittest.TestCase):
     """Pruebas unitarias para el algoritmo RSA"""
     
@@ -116,6 +136,27 @@ class TestRSACipher(unittest.TestCase):
         with self.assertRaises(InvalidInputError):
             self.rsa.encrypt("", None)
     
+    def test_rsa_bytes_roundtrip(self):
+        """Probar RSA con datos binarios, incluidos ceros iniciales"""
+        public_key, private_key = self.rsa.generate_keys()
+        length = (public_key[1].bit_length() + 7) // 8
+        block = (public_key[1].bit_length() - 1) // 8
+        
+        for data in (b"", b"\x00", b"\x00\x00\xff" * 50, bytes(range(256)), b"\x00" * block):
+            ciphertext = self.rsa.encrypt_bytes(data, public_key)
+            self.assertEqual(len(ciphertext) % length, 0)
+            self.assertEqual(self.rsa.decrypt_bytes(ciphertext, private_key), data)
+        
+        # Acepta cualquier buffer sin convertir a str
+        data = bytearray(os.urandom(300))
+        ciphertext = self.rsa.encrypt_bytes(memoryview(data), public_key)
+        self.assertEqual(self.rsa.decrypt_bytes(bytearray(ciphertext), private_key), data)
+        
+        with self.assertRaises(InvalidInputError):
+            self.rsa.encrypt_bytes("texto", public_key)
+        with self.assertRaises(DecryptionError):
+            self.rsa.decrypt_bytes(ciphertext[:-1], private_key)
+    
     def test_rsa_key_info(self):
         """Probar información de claves RSA"""
         # Generar claves
@@ -314,6 +355,263 @@ class TestDESCipher(unittest.TestCase):
         ciphertext_cbc, iv = self.des.encrypt_cbc(plaintext, self.valid_key)
         decrypted_cbc = self.des.decrypt_cbc(ciphertext_cbc, self.valid_key, iv)
         self.assertEqual(decrypted_cbc, plaintext)
+    
+    def test_des_context_is_cached(self):
+        """Probar que el contexto se reutiliza para la misma clave y modo"""
+        context = self.des.context(self.valid_key, "cbc")
+        self.assertIs(context, self.des.context(self.valid_key.encode('utf-8'), "CBC"))
+        self.assertIsNot(context, self.des.context(self.valid_key, "ECB"))
+        
+        # La caché de contextos (y de claves en claro) está acotada
+        from src.crypto.modern import des_context, DES_CONTEXT_CACHE_SIZE
+        for index in range(2 * DES_CONTEXT_CACHE_SIZE):
+            self.des.context(f"clave{index:03d}")
+        self.assertEqual(des_context.cache_info().currsize, DES_CONTEXT_CACHE_SIZE)
+        
+        with self.assertRaises(InvalidKeyError):
+            self.des.context(b"1234567")
+        with self.assertRaises(InvalidInputError):
+            self.des.context(self.valid_key, "CFB")
+    
+    def test_des_many_matches_single(self):
+        """Probar que el cifrado en lote coincide con DES de pycryptodome"""
+        from Crypto.Cipher import DES
+        from Crypto.Util.Padding import pad
+        key = self.valid_key.encode('utf-8')
+        # Más mensajes que DES_BATCH_MIN_MESSAGES y longitudes distintas
+        messages = [bytes(range(i % 7, i % 7 + 1 + (i * 5) % 41)) for i in range(40)]
+        ivs = [bytes([i]) * 8 for i in range(40)]
+        
+        ecb = self.des.context(key, "ECB")
+        encrypted = ecb.encrypt_many(messages)
+        for message, (ciphertext, iv) in zip(messages, encrypted):
+            self.assertIsNone(iv)
+            self.assertEqual(ciphertext, DES.new(key, DES.MODE_ECB).encrypt(pad(message, 8)))
+        self.assertEqual(ecb.decrypt_many([c for c, _ in encrypted]), messages)
+        
+        cbc = self.des.context(key, "CBC")
+        encrypted = cbc.encrypt_many(messages, ivs)
+        for message, iv, (ciphertext, used_iv) in zip(messages, ivs, encrypted):
+            self.assertEqual(used_iv, iv)
+            self.assertEqual(ciphertext, DES.new(key, DES.MODE_CBC, iv).encrypt(pad(message, 8)))
+        self.assertEqual(cbc.decrypt_many([c for c, _ in encrypted], ivs), messages)
+    
+    def test_des_many_text_api(self):
+        """Probar encrypt_many/decrypt_many con textos y hexadecimal"""
+        texts = [f"mensaje {i} ñ" for i in range(20)]
+        for mode in ("ECB", "CBC"):
+            encrypted = self.des.encrypt_many(texts, self.valid_key, mode)
+            ivs = None if mode == "ECB" else [iv for _, iv in encrypted]
+            decrypted = self.des.decrypt_many([c for c, _ in encrypted], self.valid_key, mode, ivs)
+            self.assertEqual(decrypted, texts)
+        
+        # El descifrado individual lee lo cifrado en lote
+        ciphertext, iv = encrypted[3]
+        self.assertEqual(self.des.decrypt_cbc(ciphertext, self.valid_key, iv), texts[3])
+    
+    def test_des_many_errors(self):
+        """Probar errores del cifrado en lote"""
+        cbc = self.des.context(self.valid_key, "CBC")
+        ciphertext, iv = cbc.encrypt(b"hola")
+        
+        with self.assertRaises(InvalidInputError):
+            cbc.decrypt_many([ciphertext])  # Falta el IV
+        with self.assertRaises(DecryptionError):
+            cbc.decrypt_many([ciphertext[:-1]], [iv])  # Longitud inválida
+        with self.assertRaises(DecryptionError):
+            self.des.context(self.valid_key, "ECB").decrypt_many([b"\x00" * 8])  # Relleno inválido
+        with self.assertRaises(InvalidInputError):
+            cbc.encrypt_many([b"hola", b""])
+    
+    def test_des_stream_matches_in_memory(self):
+        """Probar que el cifrado por flujo coincide con el cifrado en memoria"""
+        iv = b"vector01"
+        for size in (0, 7, 8, 64, 1000):
+            data = bytes(range(256)) * 4
+            data = data[:size]
+            for mode in ("ECB", "CBC"):
+                context = self.des.context(self.valid_key, mode)
+                output = io.BytesIO()
+                written = context.encrypt_stream(io.BytesIO(data), output, iv if mode == "CBC" else None, chunk_size=64)
+                
+                expected = context.encrypt(data or b"\x00", iv if mode == "CBC" else None)[0] if data else None
+                encrypted = output.getvalue()
+                self.assertEqual(written, len(encrypted))
+                if mode == "CBC":
+                    self.assertEqual(encrypted[:8], iv)
+                if expected is not None:
+                    self.assertEqual(encrypted[8 if mode == "CBC" else 0:], expected)
+                
+                decrypted = io.BytesIO()
+                self.assertEqual(context.decrypt_stream(io.BytesIO(encrypted), decrypted, chunk_size=16), size)
+                self.assertEqual(decrypted.getvalue(), data)
+    
+    def test_des_stream_short_reads(self):
+        """Probar flujos que devuelven lecturas cortas"""
+        data = os.urandom(333)
+        context = self.des.context(self.valid_key, "CBC")
+        encrypted = io.BytesIO()
+        context.encrypt_stream(TrickleStream(data), encrypted, chunk_size=24)
+        decrypted = io.BytesIO()
+        context.decrypt_stream(TrickleStream(encrypted.getvalue(), step=3), decrypted, chunk_size=24)
+        self.assertEqual(decrypted.getvalue(), data)
+    
+    def test_des_file_roundtrip(self):
+        """Probar cifrado y descifrado de archivos"""
+        with tempfile.TemporaryDirectory() as directory:
+            plain = os.path.join(directory, "plano.bin")
+            encrypted = os.path.join(directory, "cifrado.des")
+            restored = os.path.join(directory, "restaurado.bin")
+            data = os.urandom(3 * 1024 * 1024 + 5)
+            with open(plain, 'wb') as f:
+                f.write(data)
+            
+            for mode in ("ECB", "CBC"):
+                size = self.des.encrypt_file(plain, encrypted, self.valid_key, mode)
+                self.assertEqual(size, os.path.getsize(encrypted))
+                self.assertEqual(size, (len(data) // 8 + 1) * 8 + (8 if mode == "CBC" else 0))
+                self.assertEqual(self.des.decrypt_file(encrypted, restored, self.valid_key, mode), len(data))
+                with open(restored, 'rb') as f:
+                    self.assertEqual(f.read(), data)
+            
+            # Un archivo truncado falla sin dejar salida a medias
+            with open(encrypted, 'r+b') as f:
+                f.truncate(os.path.getsize(encrypted) - 3)
+            with self.assertRaises(DecryptionError):
+                self.des.decrypt_file(encrypted, os.path.join(directory, "roto.bin"), self.valid_key, "CBC")
+            self.assertEqual(sorted(os.listdir(directory)), ["cifrado.des", "plano.bin", "restaurado.bin"])
+            
+            with self.assertRaises(FileNotFoundError):
+                self.des.encrypt_file(os.path.join(directory, "no_existe"), encrypted, self.valid_key)
+
+    def test_des_bytes_api(self):
+        """Probar cifrado DES de datos binarios"""
+        data = b"\x00\xff" * 20 + b"\x80"
+        for mode in ("ECB", "CBC"):
+            ciphertext, iv = self.des.encrypt_bytes(memoryview(data), self.valid_key, mode)
+            self.assertEqual(len(ciphertext), 48)
+            self.assertEqual(iv is None, mode == "ECB")
+            self.assertEqual(self.des.decrypt_bytes(bytearray(ciphertext), self.valid_key, mode, iv), data)
+        
+        # Mismo resultado que la API de texto con un IV fijo
+        ciphertext, _ = self.des.encrypt_bytes(b"hola", b"12345678", "CBC", b"abcdefgh")
+        self.assertEqual(ciphertext.hex(), self.des.encrypt_cbc("hola", self.valid_key, "abcdefgh")[0])
+        
+        with self.assertRaises(InvalidInputError):
+            self.des.encrypt_bytes("texto", self.valid_key)
+        with self.assertRaises(InvalidInputError):
+            self.des.decrypt_bytes(ciphertext, self.valid_key, "CBC")
+    
+    def test_des_parallel_matches_sequential(self):
+        """Probar que ECB y el descifrado CBC por segmentos en hilos dan el mismo resultado"""
+        from src.crypto.modern import DES_PARALLEL_SEGMENT_SIZE
+        iv = b"abcdefgh"
+        for size in (3 * DES_PARALLEL_SEGMENT_SIZE - 5, 4 * DES_PARALLEL_SEGMENT_SIZE, 2 * DES_PARALLEL_SEGMENT_SIZE + 8):
+            data = os.urandom(size)
+            for mode in ("ECB", "CBC"):
+                mode_iv = iv if mode == "CBC" else None
+                ciphertext, _ = self.des.encrypt_bytes(data, self.valid_key, mode, mode_iv)
+                parallel, _ = self.des.encrypt_bytes(data, self.valid_key, mode, mode_iv, workers=3)
+                self.assertEqual(parallel, ciphertext)
+                self.assertEqual(self.des.decrypt_bytes(ciphertext, self.valid_key, mode, mode_iv, workers=3), data)
+                self.assertEqual(self.des.decrypt_bytes(ciphertext, self.valid_key, mode, mode_iv, workers=None), data)
+        
+        text = "DES en paralelo " * 40000
+        ciphertext_hex, iv_hex = self.des.encrypt_cbc(text, self.valid_key, "abcdefgh")
+        self.assertEqual(self.des.decrypt_cbc(ciphertext_hex, self.valid_key, iv_hex, workers=4), text)
+        self.assertEqual(self.des.decrypt_ecb(self.des.encrypt_ecb(text, self.valid_key), self.valid_key, workers=4), text)
+        
+        # El relleno se sigue validando en el último segmento
+        corrupted = bytearray.fromhex(ciphertext_hex)
+        corrupted[-1] ^= 1
+        with self.assertRaises(DecryptionError):
+            self.des.decrypt_bytes(corrupted, self.valid_key, "CBC", iv, workers=4)
+        with self.assertRaises(InvalidInputError):
+            self.des.decrypt_bytes(corrupted, self.valid_key, "CBC", iv, workers=0)
+    
+    def test_triple_des_and_stream_modes(self):
+        """Probar 3DES y los modos CTR y EAX"""
+        from Crypto.Cipher import DES3
+        keys = (b"12345678", b"0123456789abcdef", b"0123456789abcdefFEDCBA98")
+        for key in keys:
+            for mode in DES_MODES:
+                for data in (b"x", b"\x00" * 8, os.urandom(1001)):
+                    ciphertext, iv = self.des.encrypt_bytes(data, key, mode)
+                    expected = {"CTR": len(data), "EAX": len(data) + DES_TAG_SIZE}.get(mode, (len(data) // 8 + 1) * 8)
+                    self.assertEqual(len(ciphertext), expected)
+                    self.assertEqual(self.des.decrypt_bytes(ciphertext, key, mode, iv), data)
+        
+        self.assertEqual(self.des.context(keys[2], "ECB").algorithm, "3DES")
+        ciphertext, _ = self.des.encrypt_bytes(b"bloque 8", keys[2], "ECB")
+        self.assertEqual(ciphertext[:8], DES3.new(keys[2], DES3.MODE_ECB).encrypt(b"bloque 8"))
+        self.assertTrue(self.des.validate_key("0123456789abcdef"))
+        with self.assertRaises(InvalidKeyError):
+            self.des.context(b"12345678" * 2, "CBC")  # 3DES que se reduce a DES simple
+        
+        # EAX detecta datos alterados y claves incorrectas
+        ciphertext, iv = self.des.encrypt_bytes(b"mensaje autenticado", keys[1], "EAX")
+        tampered = bytearray(ciphertext)
+        tampered[0] ^= 1
+        with self.assertRaises(DecryptionError):
+            self.des.decrypt_bytes(tampered, keys[1], "EAX", iv)
+        with self.assertRaises(DecryptionError):
+            self.des.decrypt_bytes(ciphertext, keys[2], "EAX", iv)
+        with self.assertRaises(DecryptionError):
+            self.des.decrypt_bytes(ciphertext[:DES_TAG_SIZE], keys[1], "EAX", iv)
+        
+        # Lotes en CTR y EAX
+        messages = [b"uno", b"dos" * 10, b"tres"]
+        for mode in ("CTR", "EAX"):
+            encrypted = self.des.context(keys[1], mode).encrypt_many(messages)
+            self.assertEqual(self.des.context(keys[1], mode).decrypt_many(
+                [ciphertext for ciphertext, _ in encrypted], [iv for _, iv in encrypted]), messages)
+    
+    def test_ctr_parallel_matches_sequential(self):
+        """Probar CTR por segmentos en hilos, incluido el desbordamiento del contador"""
+        from src.crypto.modern import DES_PARALLEL_SEGMENT_SIZE
+        data = os.urandom(3 * DES_PARALLEL_SEGMENT_SIZE + 3)
+        for key in (self.valid_key, "0123456789abcdef"):
+            for iv in (b"nonc\x00\x00\x00\x00", b"nonc\xff\xff\xff\xf0"):
+                ciphertext, _ = self.des.encrypt_bytes(data, key, "CTR", iv)
+                parallel, _ = self.des.encrypt_bytes(data, key, "CTR", iv, workers=4)
+                self.assertEqual(parallel, ciphertext)
+                # En paralelo se devuelve el búfer de salida, sin copia final
+                self.assertIsInstance(parallel, bytearray)
+                plaintext = self.des.decrypt_bytes(ciphertext, key, "CTR", iv, workers=4)
+                self.assertEqual(plaintext, data)
+                self.assertIsInstance(plaintext, bytearray)
+    
+    def test_stream_modes_files(self):
+        """Probar flujos y archivos en CTR y EAX"""
+        data = os.urandom(70000)
+        for mode in ("CTR", "EAX"):
+            context = self.des.context(self.valid_key, mode)
+            encrypted = io.BytesIO()
+            context.encrypt_stream(TrickleStream(data, 13), encrypted, chunk_size=64)
+            self.assertEqual(len(encrypted.getvalue()), 8 + len(data) + (DES_TAG_SIZE if mode == "EAX" else 0))
+            self.assertEqual(encrypted.getvalue()[8:8 + len(data)],
+                             context.encrypt(data, encrypted.getvalue()[:8])[0][:len(data)])
+        
+            restored = io.BytesIO()
+            context.decrypt_stream(TrickleStream(encrypted.getvalue(), 11), restored, chunk_size=8)
+            self.assertEqual(restored.getvalue(), data)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            plain = os.path.join(directory, "plano.bin")
+            encrypted = os.path.join(directory, "cifrado.des")
+            with open(plain, 'wb') as f:
+                f.write(data)
+            self.des.encrypt_file(plain, encrypted, "0123456789abcdef", "EAX")
+        
+            # Una etiqueta inválida no deja archivo de salida
+            with open(encrypted, 'r+b') as f:
+                f.seek(100)
+                byte = f.read(1)[0]
+                f.seek(100)
+                f.write(bytes([byte ^ 1]))
+            with self.assertRaises(DecryptionError):
+                self.des.decrypt_file(encrypted, os.path.join(directory, "roto.bin"), "0123456789abcdef", "EAX")
+            self.assertEqual(sorted(os.listdir(directory)), ["cifrado.des", "plano.bin"])
 
 class TestDigitalSignature(unittest.TestCase):
     """Pruebas unitarias para firma digital"""
@@ -369,6 +667,25 @@ class TestDigitalSignature(unittest.TestCase):
         with self.assertRaises(InvalidInputError):
             self.signature.sign_message("", None)
     
+    def test_signature_bytes(self):
+        """Probar firma y verificación de datos binarios"""
+        public_key, private_key = self.signature.generate_keys(1024)
+        data = bytes(range(256)) * 4
+        
+        signature = self.signature.sign_bytes(memoryview(data), private_key)
+        self.assertEqual(len(signature), (public_key[1].bit_length() + 7) // 8)
+        self.assertTrue(self.signature.verify_bytes(bytearray(data), signature, public_key))
+
+        tampered = bytearray(data)
+        tampered[0] ^= 1
+        self.assertFalse(self.signature.verify_bytes(tampered, signature, public_key))
+        self.assertFalse(self.signature.verify_bytes(data, signature[1:], public_key))
+        self.assertTrue(self.signature.verify_signature("hola", self.signature.sign_bytes(b"hola", private_key).hex(),
+                                                        public_key))
+        
+        with self.assertRaises(InvalidInputError):
+            self.signature.sign_bytes("texto", private_key)
+    
     def test_signature_demo(self):
         """Probar demostración completa de firma"""
         message = "Demo message for signature"
@@ -383,6 +700,32 @@ class TestDigitalSignature(unittest.TestCase):
         self.assertTrue(result["verification"])
         self.assertEqual(result["message"], message)
     
+    def test_signature_demo_reuses_keys(self):
+        """Probar que la demo reutiliza las claves hasta que caducan y pasa el hash entre etapas"""
+        signature = DigitalSignature(key_ttl=math.inf)
+        first = signature.sign_and_verify_demo("primero", key_size=1024)
+        second = signature.sign_and_verify_demo("segundo", key_size=1024)
+        
+        self.assertFalse(first["keys_reused"])
+        self.assertTrue(second["keys_reused"])
+        self.assertEqual(first["public_key"], second["public_key"])
+        self.assertEqual(second["message_hash"], CustomHash().sha256_wrapper("segundo"))
+        self.assertTrue(signature.verify_signature("segundo", second["signature"],
+                                                   (second["public_key"]["e"], second["public_key"]["n"])))
+        self.assertEqual(set(second["timings"]), {"keys", "hash", "sign", "verify"})
+        
+        # Otro tamaño, TTL vencido o rotación explícita generan claves nuevas
+        self.assertFalse(signature.sign_and_verify_demo("otro", key_size=512)["keys_reused"])
+        self.assertFalse(signature.sign_and_verify_demo("otro", key_size=512, ttl=0)["keys_reused"])
+        public_key, _ = signature.cached_keys(512)
+        self.assertNotEqual(signature.rotate_keys()[0], public_key)
+        self.assertEqual(signature.rsa.key_size, 512)
+        self.assertLess(signature.key_age(), 60)
+        self.assertEqual(DigitalSignature().key_age(), math.inf)
+        
+        with self.assertRaises(InvalidInputError):
+            signature.sign_and_verify_demo("")
+    
     def test_signature_different_keys(self):
         """Probar firma con diferentes claves"""
         message = "Test message"
@@ -402,6 +745,171 @@ class TestDigitalSignature(unittest.TestCase):
         is_valid2 = self.signature.verify_signature(message, signature, public_key2)
         self.assertFalse(is_valid2)
 
+class TestPreparedPublicKey(unittest.TestCase):
+    """Pruebas unitarias para claves públicas preparadas"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Generar claves compartidas por las pruebas"""
+        cls.signature = DigitalSignature()
+        cls.public_key, cls.private_key = cls.signature.generate_keys(1024)
+    
+    def test_prepared_key_is_cached(self):
+        """Probar que la precomputación se reutiliza por clave"""
+        key = prepare_public_key(self.public_key)
+        self.assertIs(prepare_public_key(self.public_key), key)
+        self.assertEqual(key.key, self.public_key)
+        self.assertEqual(key.byte_length, 128)
+    
+    def test_prepared_key_encrypt(self):
+        """Probar cifrado RSA con clave preparada"""
+        rsa = RSACipher(1024)
+        public_key, private_key = rsa.generate_keys()
+        message = "Mensaje cifrado con clave preparada " * 4
+        
+        encrypted = rsa.encrypt(message, PreparedPublicKey(public_key))
+        self.assertEqual(encrypted, rsa.encrypt(message, public_key))
+        self.assertEqual(rsa.decrypt(encrypted, private_key), message)
+    
+    def test_verify_batch(self):
+        """Probar verificación por lotes con estado por elemento"""
+        messages = [f"registro {i}" for i in range(8)]
+        signatures = [self.signature.sign_message(m, self.private_key) for m in messages]
+        signatures[3] = signatures[4]
+        signatures[5] = "no-es-hex"
+        
+        results = self.signature.verify_batch(messages, signatures, self.public_key)
+        expected = [True] * 8
+        expected[3] = expected[5] = False
+        self.assertEqual(list(results), expected)
+    
+    def test_sign_batch(self):
+        """Probar firma por lotes con hilos y procesos"""
+        messages = [f"registro {i}".encode() for i in range(600)]
+        messages[7] = "texto".encode()
+        batch = self.signature.sign_batch(messages, self.private_key, workers=2, hash_workers=2)
+        
+        self.assertEqual(batch.size, 128)
+        self.assertEqual(len(batch.signatures), 600 * 128)
+        self.assertEqual(batch.status, bytearray(b"\x01") * 600)
+        for index in (0, 7, 255, 256, 599):
+            self.assertEqual(batch.signature(index), self.signature.sign_bytes(messages[index], self.private_key))
+        
+        self.assertEqual(self.signature.verify_batch(messages, batch, self.public_key, workers=2), bytearray(b"\x01") * 600)
+        
+        # Entradas mal formadas y firmas alteradas quedan marcadas sin abortar el lote
+        batch = self.signature.sign_batch([b"a", None, "b", bytearray(b"c")], self.private_key, workers=1)
+        self.assertEqual(list(batch.status), [1, 0, 1, 1])
+        self.assertIsNone(batch.signature(1))
+        signatures = [batch.signature(0), b"corta", batch.signature(2), memoryview(batch.signature(0))]
+        self.assertEqual(list(self.signature.verify_batch([b"a", b"x", "b", b"c"], signatures, self.public_key)),
+                         [1, 0, 1, 0])
+    
+    def test_sign_batch_without_primes(self):
+        """Probar que sin los primos de n se firma sin CRT con el mismo resultado"""
+        signer = DigitalSignature()
+        batch = signer.sign_batch([b"uno", b"dos"], self.private_key, workers=1)
+        self.assertEqual(batch.signature(1), self.signature.sign_bytes(b"dos", self.private_key))
+        with self.assertRaises(KeyGenerationError):
+            signer.sign_batch([b"uno"])
+        with self.assertRaises(InvalidInputError):
+            self.signature.sign_batch([b"uno"], self.private_key, workers=0)
+    
+    def test_sign_stream(self):
+        """Probar que firmar por flujo equivale a firmar los bytes completos"""
+        data = bytes(range(256)) * 257
+        signature = self.signature.sign_stream(io.BytesIO(data), self.private_key, chunk_size=1000)
+        self.assertEqual(signature, self.signature.sign_bytes(data, self.private_key))
+        self.assertTrue(self.signature.verify_stream(TrickleStream(data, 97), signature, self.public_key))
+        self.assertFalse(self.signature.verify_stream(io.BytesIO(data + b"x"), signature, self.public_key))
+        self.assertFalse(self.signature.verify_stream(io.BytesIO(data), signature[1:], self.public_key))
+        with self.assertRaises(InvalidInputError):
+            self.signature.sign_digest(b"corto", self.private_key)
+    
+    def test_sign_and_verify_digest(self):
+        """Probar firma y verificación sobre un hash SHA-256 ya calculado"""
+        digest = hashlib.sha256(b"mensaje").digest()
+        signature = self.signature.sign_digest(digest, self.private_key)
+        self.assertEqual(signature, self.signature.sign_bytes(b"mensaje", self.private_key))
+        self.assertTrue(self.signature.verify_digest(digest, signature, self.public_key))
+        self.assertFalse(self.signature.verify_digest(hashlib.sha256(b"otro").digest(), signature, self.public_key))
+    
+    def test_sign_file(self):
+        """Probar firmas separadas de archivos"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "datos.bin")
+            with open(path, 'wb') as f:
+                f.write(os.urandom(3 * 1024 * 1024 + 5))
+        
+            signature_path = self.signature.sign_file(path, self.private_key)
+            self.assertEqual(signature_path, path + SIGNATURE_FILE_EXTENSION)
+            self.assertEqual(sorted(os.listdir(directory)), ["datos.bin", "datos.bin.sig"])
+            self.assertTrue(self.signature.verify_file(path, self.public_key))
+        
+            with open(path, 'r+b') as f:
+                f.seek(1024 * 1024)
+                byte = f.read(1)
+                f.seek(1024 * 1024)
+                f.write(bytes([byte[0] ^ 1]))
+            self.assertFalse(self.signature.verify_file(path, self.public_key))
+        
+            custom = os.path.join(directory, "firma")
+            self.signature.sign_file(path, self.private_key, custom)
+            self.assertTrue(self.signature.verify_file(path, self.public_key, custom))
+            with open(custom, 'ab') as f:
+                f.write(b"\0")
+            self.assertFalse(self.signature.verify_file(path, self.public_key, custom))
+        
+            with self.assertRaises(FileNotFoundError):
+                self.signature.sign_file(os.path.join(directory, "no_existe"), self.private_key)
+            with self.assertRaises(FileNotFoundError):
+                self.signature.verify_file(path, self.public_key, os.path.join(directory, "no_existe"))
+    
+    def test_verify_batch_length_mismatch(self):
+        """Probar lotes con distinta cantidad de mensajes y firmas"""
+        with self.assertRaises(InvalidInputError):
+            self.signature.verify_batch(["a", "b"], ["01"], self.public_key)
+    
+    def test_invalid_public_key(self):
+        """Probar preparación de una clave inválida"""
+        with self.assertRaises(InvalidKeyError):
+            PreparedPublicKey((1, 15))
+    
+    def test_pkcs1_signature_encoding(self):
+        """Probar que la firma cubre un bloque PKCS#1 v1.5 completo del tamaño de n"""
+        e, n = self.public_key
+        data = b"bloque codificado"
+        signature = self.signature.sign_bytes(data, self.private_key)
+        block = pow(int.from_bytes(signature, 'big'), e, n).to_bytes(128, 'big')
+        digest = hashlib.sha256(data).digest()
+        self.assertEqual(block, pkcs1_encode(digest, 128))
+        self.assertEqual(block[:2], b"\x00\x01")
+        self.assertEqual(block[2:128 - 52], b"\xff" * 74)
+        self.assertEqual(block[-32:], digest)
+        
+        # Un bloque sin codificar (el hash en crudo) ya no es una firma válida
+        raw = pow(int.from_bytes(digest, 'big'), self.private_key[0], n).to_bytes(128, 'big')
+        self.assertFalse(self.signature.verify_bytes(data, raw, self.public_key))
+        with self.assertRaises(InvalidInputError):
+            pkcs1_encode(digest[:-1], 128)
+    
+    def test_signature_leading_zero_digest(self):
+        """Probar hashes y firmas con ceros iniciales"""
+        message = next(f"mensaje {i}" for i in range(10000)
+                       if hashlib.sha256(f"mensaje {i}".encode()).digest()[0] == 0)
+        signature_hex = self.signature.sign_message(message, self.private_key)
+        self.assertEqual(len(signature_hex), 256)
+        self.assertTrue(self.signature.verify_signature(message, signature_hex, self.public_key))
+        
+        # La firma debe tener exactamente byte_length bytes
+        self.assertFalse(self.signature.verify_signature(message, signature_hex[2:], self.public_key))
+        self.assertFalse(self.signature.verify_signature(message, "00" + signature_hex, self.public_key))
+    
+    def test_signature_key_too_small(self):
+        """Probar que una clave sin espacio para el bloque PKCS#1 se rechaza"""
+        with self.assertRaises(SignatureError):
+            self.signature.sign_bytes(b"datos", (3, (1 << 480) + 1))
+
 class TestModernCryptoIntegration(unittest.TestCase):
     """Pruebas de integración para criptografía moderna"""
     
@@ -0,0 +1,115 @@
+"""
+🧪 Pruebas Unitarias - Teoría de Números
+=======================================
+
+Conjunto de pruebas unitarias para las funciones de aritmética modular:
+- Algoritmo extendido de Euclides iterativo
+- Inverso modular
+- Mínimo común múltiplo y función de Carmichael
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto import number_theory
+from src.crypto.modern import RSACipher
+
+
+def recursive_extended_gcd(a: int, b: int):
+    """Implementación recursiva original usada como referencia"""
+    if a == 0:
+        return b, 0, 1
+    gcd, x1, y1 = recursive_extended_gcd(b % a, a)
+    return gcd, y1 - (b // a) * x1, x1
+
+
+class TestNumberTheory(unittest.TestCase):
+    """Pruebas unitarias para las funciones de teoría de números"""
+
+    def setUp(self):
+        """Configurar el entorno de pruebas"""
+        self.rng = random.Random(2025)
+
+    def test_extended_gcd_matches_recursive(self):
+        """Probar que la versión iterativa coincide con la recursiva"""
+        for _ in range(500):
+            a = self.rng.getrandbits(self.rng.randint(0, 256))
+            b = self.rng.getrandbits(self.rng.randint(0, 256))
+            self.assertEqual(number_theory.extended_gcd(a, b), recursive_extended_gcd(a, b))
+
+    def test_extended_gcd_bezout_identity(self):
+        """Probar la identidad de Bézout en operandos grandes"""
+        for _ in range(50):
+            a = self.rng.getrandbits(4096)
+            b = self.rng.getrandbits(4096)
+            g, x, y = number_theory.extended_gcd(a, b)
+            self.assertEqual(a * x + b * y, g)
+            self.assertEqual(g, number_theory.gcd(a, b))
+
+    def test_extended_gcd_no_recursion_limit(self):
+        """Probar que no depende del límite de recursión"""
+        # Números de Fibonacci consecutivos: peor caso de Euclides
+        a, b = 0, 1
+        for _ in range(5000):
+            a, b = b, a + b
+        g, x, y = number_theory.extended_gcd(a, b)
+        self.assertEqual(g, 1)
+        self.assertEqual(a * x + b * y, 1)
+
+    def test_mod_inverse(self):
+        """Probar cálculo de inverso modular"""
+        self.assertEqual(number_theory.mod_inverse(3, 10), 7)
+        self.assertEqual(number_theory.mod_inverse(5, 7), 3)
+
+        for _ in range(200):
+            m = self.rng.getrandbits(512) | 1
+            a = self.rng.randrange(1, m)
+            if number_theory.gcd(a, m) != 1:
+                continue
+            inv = number_theory.mod_inverse(a, m)
+            self.assertTrue(0 <= inv < m)
+            self.assertEqual(a * inv % m, 1)
+
+    def test_mod_inverse_not_exists(self):
+        """Probar inverso modular inexistente"""
+        with self.assertRaises(ValueError):
+            number_theory.mod_inverse(4, 8)
+
+    def test_lcm_and_carmichael(self):
+        """Probar MCM y función de Carmichael"""
+        self.assertEqual(number_theory.lcm(4, 6), 12)
+        self.assertEqual(number_theory.lcm(0, 6), 0)
+        # λ(61·53) = mcm(60, 52) = 780
+        self.assertEqual(number_theory.carmichael_lambda(61, 53), 780)
+
+    def test_rsa_uses_carmichael_exponent(self):
+        """Probar que las claves derivadas de λ(n) descifran correctamente"""
+        rsa = RSACipher(key_size=512)
+        (e, n), (d, _) = rsa.generate_keys()
+        message = self.rng.randrange(2, n)
+        self.assertEqual(pow(pow(message, e, n), d, n), message)
+
+    def test_crt_pow_matches_pow(self):
+        """Probar que la exponenciación CRT coincide con pow(value, d, n)"""
+        rsa = RSACipher(key_size=512)
+        (_, n), (d, _) = rsa.generate_keys()
+        params = number_theory.crt_params(d, *rsa.primes)
+        for value in [0, 1, n - 1] + [self.rng.randrange(n) for _ in range(20)]:
+            self.assertEqual(number_theory.crt_pow(value, params), pow(value, d, n))
+
+if __name__ == '__main__':
+    # Configurar el entorno de pruebas
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+"""
+🧪 Pruebas Unitarias - Tests de Primalidad
+=========================================
+
+Conjunto de pruebas unitarias para el subsistema de primalidad:
+- Camino rápido para números pequeños
+- Miller-Rabin con rondas adaptativas
+- Test de Baillie-PSW
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import sys
+import os
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto import primality
+from src.crypto.modern import RSACipher
+from src.crypto.random_source import RandomSource
+from src.utils.exceptions import *
+
+
+def sieve(limit: int) -> bytearray:
+    """Criba de Eratóstenes usada como referencia"""
+    flags = bytearray([1]) * limit
+    flags[0] = flags[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytearray(len(flags[i * i::i]))
+    return flags
+
+
+class TestPrimality(unittest.TestCase):
+    """Pruebas unitarias para los tests de primalidad"""
+
+    # Primos de Mersenne y un producto de dos de ellos
+    LARGE_PRIMES = [2 ** 127 - 1, 2 ** 521 - 1]
+    LARGE_COMPOSITE = (2 ** 127 - 1) * (2 ** 89 - 1)
+
+    def test_small_numbers_are_exact(self):
+        """Probar el camino rápido contra una criba"""
+        flags = sieve(20000)
+        for n in range(len(flags)):
+            self.assertEqual(primality.is_probable_prime(n), bool(flags[n]), n)
+
+    def test_carmichael_numbers(self):
+        """Probar números de Carmichael y pseudoprimos fuertes en base 2"""
+        for n in (561, 1105, 1729, 2047, 3277, 4033, 8321, 3215031751, 3825123056546413051):
+            self.assertFalse(primality.is_probable_prime(n), n)
+
+    def test_large_numbers(self):
+        """Probar ambos métodos con números grandes"""
+        for method in primality.PRIMALITY_TESTS:
+            for p in self.LARGE_PRIMES:
+                self.assertTrue(primality.is_probable_prime(p, method=method))
+            self.assertFalse(primality.is_probable_prime(self.LARGE_COMPOSITE, method=method))
+
+    def test_strong_lucas_pseudoprimes(self):
+        """Probar que Baillie-PSW rechaza pseudoprimos de Lucas fuertes"""
+        for n in (5459, 5777, 10877, 16109, 18971):
+            self.assertTrue(primality.strong_lucas(n))
+            self.assertFalse(primality.baillie_psw(n))
+
+    def test_baillie_psw_matches_sieve(self):
+        """Probar Baillie-PSW contra una criba"""
+        flags = sieve(20000)
+        for n in range(5, len(flags), 2):
+            if int(n ** 0.5) ** 2 != n:
+                self.assertEqual(primality.baillie_psw(n), bool(flags[n]), n)
+
+    def test_rounds_decrease_with_size(self):
+        """Probar que las rondas dependen del tamaño del candidato"""
+        rounds = [primality.miller_rabin_rounds(bits) for bits in (256, 512, 1024, 2048)]
+        self.assertEqual(rounds, sorted(rounds, reverse=True))
+        self.assertLess(primality.miller_rabin_rounds(1024), 10)
+        self.assertGreaterEqual(primality.miller_rabin_rounds(2048), 3)
+
+    def test_unknown_method(self):
+        """Probar método de primalidad no soportado"""
+        with self.assertRaises(ValueError):
+            primality.is_probable_prime(101, method="fermat")
+        with self.assertRaises(InvalidInputError):
+            RSACipher(primality_test="fermat")
+
+    def test_rsa_with_baillie_psw(self):
+        """Probar generación de claves RSA con Baillie-PSW"""
+        rsa = RSACipher(512, rng=RandomSource(seed=3), primality_test=primality.BAILLIE_PSW)
+        public_key, private_key = rsa.generate_keys()
+        p, q = rsa.primes
+        self.assertTrue(primality.is_probable_prime(p))
+        self.assertTrue(primality.is_probable_prime(q))
+        self.assertEqual(rsa.decrypt(rsa.encrypt("primo", public_key), private_key), "primo")
+
+if __name__ == '__main__':
+    # Configurar el entorno de pruebas
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+"""
+🧪 Pruebas Unitarias - Fuentes de Aleatoriedad
+=============================================
+
+Conjunto de pruebas unitarias para la capa de aleatoriedad:
+- Modo determinista con semilla
+- Flujos derivados por hilo
+- Integración con RSA, firma digital y cifrados clásicos
+
+Autor: CryptoUNS Team
+Fecha: 06 de julio, 2025
+Versión: 1.0.0
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Importar módulos del sistema
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar las clases necesarias
+from src.crypto.random_source import RandomSource, get_default_random, set_default_random
+from src.crypto.modern import RSACipher, DigitalSignature
+from src.crypto.classic import VigenereCipher, PlayfairCipher
+
+
+class TestRandomSource(unittest.TestCase):
+    """Pruebas unitarias para la fuente de aleatoriedad"""
+
+    def test_seeded_sequence_is_repeatable(self):
+        """Probar que la misma semilla produce la misma secuencia"""
+        first = RandomSource(seed=42)
+        second = RandomSource(seed=42)
+
+        self.assertTrue(first.deterministic)
+        self.assertEqual([first.getrandbits(64) for _ in range(10)],
+                         [second.getrandbits(64) for _ in range(10)])
+        self.assertEqual(first.token_bytes(16), second.token_bytes(16))
+
+    def test_system_source(self):
+        """Probar el modo del sistema"""
+        source = RandomSource()
+        self.assertFalse(source.deterministic)
+        self.assertEqual(len(source.token_bytes(8)), 8)
+        self.assertTrue(2 <= source.randrange(2, 10) < 10)
+
+    def test_spawn_streams(self):
+        """Probar que los flujos derivados son independientes y reproducibles"""
+        parent = RandomSource(seed=7)
+        self.assertEqual(parent.spawn(1).getrandbits(128), RandomSource(seed=7).spawn(1).getrandbits(128))
+        self.assertNotEqual(parent.spawn(1).getrandbits(128), parent.spawn(2).getrandbits(128))
+        self.assertFalse(RandomSource().spawn(1).deterministic)
+
+    def test_spawn_per_thread(self):
+        """Probar que el resultado por hilo no depende de la planificación"""
+        parent = RandomSource(seed=99)
+        results = {}
+
+        def worker(index):
+            rng = parent.spawn(index)
+            results[index] = [rng.getrandbits(32) for _ in range(100)]
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index in range(4):
+            expected = parent.spawn(index)
+            self.assertEqual(results[index], [expected.getrandbits(32) for _ in range(100)])
+
+    def test_default_source(self):
+        """Probar el reemplazo de la fuente por defecto"""
+        try:
+            seeded = set_default_random(RandomSource(seed=5))
+            self.assertIs(get_default_random(), seeded)
+            self.assertIs(RSACipher().rng, seeded)
+        finally:
+            set_default_random()
+        self.assertFalse(get_default_random().deterministic)
+
+    def test_reproducible_rsa_keys(self):
+        """Probar generación de claves RSA reproducible"""
+        first = RSACipher(512, rng=RandomSource(seed=2025)).generate_keys()
+        second = RSACipher(512, rng=RandomSource(seed=2025)).generate_keys()
+        self.assertEqual(first, second)
+
+        signature = DigitalSignature(rng=RandomSource(seed=2025))
+        self.assertEqual(signature.generate_keys(512), first)
+
+    def test_reproducible_classic_keys(self):
+        """Probar generación de claves clásicas reproducible"""
+        self.assertEqual(VigenereCipher(rng=RandomSource(seed=1)).generate_key(12),
+                         VigenereCipher(rng=RandomSource(seed=1)).generate_key(12))
+        self.assertEqual(PlayfairCipher(rng=RandomSource(seed=1)).generate_key(12),
+                         PlayfairCipher(rng=RandomSource(seed=1)).generate_key(12))
+
+if __name__ == '__main__':
+    # Configurar el entorno de pruebas
+    unittest.main(verbosity=2)
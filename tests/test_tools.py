@@ -15,8 +15,10 @@ Versión: 1.0.0
 import unittest
 import sys
 import os
+import random
 import tempfile
 import time
+from unittest import mock
 
 # Agregar el directorio src al path para importar módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -25,7 +27,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Importar las clases necesarias
-from src.crypto.tools import HuffmanCoding, Blockchain, Block, IntegrityVerifier
+from src.crypto.tools import HuffmanCoding, HuffmanBits, HUFFMAN_PACK_CHUNK, Blockchain, Block, IntegrityVerifier
+from src.crypto import huffman_kernels
 from src.utils.constants import *
 from src.utils.exceptions import *
 
@@ -49,8 +52,8 @@ class TestHuffmanCoding(unittest.TestCase):
         text = "hello world"
         encoded, codes, tree = self.huffman.encode(text)
         
-        # Verificar que el texto codificado es binario
-        self.assertTrue(all(bit in '01' for bit in encoded))
+        # Verificar que la vista de depuración es binaria
+        self.assertTrue(all(bit in '01' for bit in encoded.to_string()))
         
         # Verificar que todos los caracteres tienen códigos
         unique_chars = set(text)
@@ -97,7 +100,9 @@ class TestHuffmanCoding(unittest.TestCase):
         
         # Verificar valores lógicos
         self.assertEqual(stats["original_length"], len(text))
-        self.assertEqual(stats["encoded_length"], len(encoded))
+        self.assertEqual(stats["encoded_length"], encoded.bit_length)
+        self.assertEqual(stats["encoded_bytes"], len(encoded.data))
+        self.assertEqual(stats["original_bytes"], len(text))
         self.assertGreaterEqual(stats["compression_ratio"], 0)
     
     def test_huffman_empty_text(self):
@@ -128,6 +133,297 @@ class TestHuffmanCoding(unittest.TestCase):
         # Verificar compresión
         stats = self.huffman.get_compression_stats(text, encoded)
         self.assertLess(stats["compression_ratio"], 1.0)  # Debería haber compresión
+    
+    def test_huffman_packed_output(self):
+        """Probar que la salida está empaquetada en bytes con el número de bits"""
+        text = "ñandú " * 500 + "texto con acentos: áéíóú"
+        encoded, codes, tree = self.huffman.encode(text)
+        
+        self.assertIsInstance(encoded, HuffmanBits)
+        self.assertIsInstance(encoded.data, bytearray)
+        self.assertEqual(encoded.bit_length, sum(len(codes[c]) for c in text))
+        self.assertEqual(len(encoded.data), (encoded.bit_length + 7) // 8)
+        
+        # La vista de depuración es la concatenación de los códigos
+        bits = encoded.to_string()
+        self.assertEqual(bits, "".join(codes[c] for c in text))
+        self.assertEqual(HuffmanBits.from_string(bits), encoded)
+        self.assertEqual(self.huffman.decode(encoded, tree), text)
+        self.assertEqual(self.huffman.decode(bits, tree), text)
+        
+        # Los bits de relleno del último byte son cero
+        padding = len(encoded.data) * 8 - encoded.bit_length
+        self.assertEqual(encoded.data[-1] & ((1 << padding) - 1), 0)
+        
+        with self.assertRaises(InvalidInputError):
+            HuffmanBits.from_string("0102")
+    
+    def test_huffman_pack_across_chunks(self):
+        """Probar textos mayores que un tramo de empaquetado"""
+        text = "".join(chr(97 + (i * i) % 7) for i in range(HUFFMAN_PACK_CHUNK * 2 + 13))
+        encoded, codes, tree = self.huffman.encode(text)
+        self.assertEqual(encoded.to_string(), "".join(codes[c] for c in text))
+        self.assertEqual(self.huffman.decode(encoded, tree), text)
+        
+        stats = self.huffman.get_compression_stats(text, encoded)
+        self.assertEqual(stats["encoded_bytes"], len(encoded.data))
+        self.assertLess(stats["compression_ratio"], 0.5)
+    
+    def test_huffman_pack_rejects_uncoded(self):
+        """Probar que '0', '1', '_' o espacios sin código no pasan como bits literales"""
+        codes = {'a': '01', 'b': '1', 'c': '00'}
+        for text in ("a1a0", "a_b", "ab 0", "0", "1", "_"):
+            with self.assertRaises(HuffmanError, msg=text):
+                HuffmanCoding.pack(text, codes)
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding.pack_chunks(("abc", "c1"), codes, lambda data: None)
+        self.assertEqual(HuffmanCoding.pack("abca", codes).to_string(), "0110001")
+
+    def test_huffman_table_decoder(self):
+        """Probar el decodificador por tablas con códigos largos y colas de cualquier longitud"""
+        # Frecuencias de Fibonacci: árbol degenerado con códigos más largos que la tabla principal
+        counts = [1, 1]
+        while len(counts) < 22:
+            counts.append(counts[-1] + counts[-2])
+        symbols = [chr(0x41 + i) * count for i, count in enumerate(counts)]
+        text = list("".join(symbols))
+        random.Random(47).shuffle(text)
+        text = "".join(text)
+        encoded, codes, tree = self.huffman.encode(text)
+        self.assertGreater(max(len(code) for code in codes.values()), 16)
+        
+        for table_bits in (1, 3, 8, 12, 16):
+            self.assertEqual(self.huffman.decode(encoded, tree, table_bits), text)
+        
+        # Todas las longitudes de la cola final
+        for length in range(1, 40):
+            encoded, codes, tree = self.huffman.encode(text[:length])
+            self.assertEqual(self.huffman.decode(encoded, tree), text[:length])
+        
+        with self.assertRaises(InvalidInputError):
+            self.huffman.decode(encoded, tree, 0)
+    
+    def test_huffman_decoder_invalid_bits(self):
+        """Probar bits que no llevan a ninguna hoja del árbol"""
+        encoded, codes, tree = self.huffman.encode("a" * 40)
+        self.assertEqual(self.huffman.decode(encoded, tree), "a" * 40)
+        with self.assertRaises(InvalidInputError):
+            self.huffman.decode(HuffmanBits.from_string("0" * 20 + "1" + "0" * 20), tree)
+        with self.assertRaises(InvalidInputError):
+            self.huffman.decode(HuffmanBits.from_string("001"), tree)
+    
+    def test_huffman_canonical_codes(self):
+        """Probar que los códigos son canónicos y conservan las longitudes del árbol"""
+        text = "this is a test message for huffman coding"
+        encoded, codes, tree = self.huffman.encode(text)
+        
+        ordered = sorted(codes.items(), key=lambda item: (len(item[1]), item[0]))
+        self.assertEqual(list(codes.items()), ordered)
+        values = [int(code, 2) << (16 - len(code)) for _, code in ordered]
+        self.assertEqual(values, sorted(set(values)))
+        self.assertEqual(sum(2 ** -len(code) for code in codes.values()), 1)
+        self.assertEqual(self.huffman.build_codes(tree), codes)
+        
+        self.assertEqual(HuffmanCoding.canonical_codes({'a': 1, 'b': 2, 'c': 3, 'd': 3}),
+                         {'a': '0', 'b': '10', 'c': '110', 'd': '111'})
+    
+    def test_huffman_container(self):
+        """Probar el contenedor autodescriptivo en otra instancia, sin árbol"""
+        text = "contenedor portátil: ¿ñandú? " * 20
+        blob = self.huffman.compress(text)
+        symbols = len(set(text))
+        self.assertEqual(blob[:4], b"CUHF")
+        self.assertEqual(len(blob), 18 + 5 * symbols + len(self.huffman.encode(text)[0].data))
+        self.assertEqual(HuffmanCoding().decompress(blob), text)
+        
+        encoded, codes = HuffmanCoding().unpack_container(blob)
+        self.assertEqual(codes, self.huffman.codes)
+        self.assertEqual(HuffmanCoding().decode_for_gui(encoded, codes), text)
+        
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding().decompress(b"XXXX" + blob[4:])
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding().decompress(blob[:-1])
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding().decompress(blob[:10])
+    
+    def test_huffman_file_two_pass(self):
+        """Probar la compresión de archivos en dos pasadas por tramos"""
+        text = "línea con acentos: ñandú, ¿qué?\r\nsegunda línea\n" * 300
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "entrada.txt")
+            packed = os.path.join(directory, "entrada.huf")
+            restored = os.path.join(directory, "salida.txt")
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            
+            with mock.patch('src.crypto.tools.HUFFMAN_STREAM_CHUNK', 1000):
+                stats = self.huffman.encode_file(source, packed)
+            self.assertEqual(stats['mode'], 'two-pass')
+            self.assertLess(stats['compression_ratio'], 1.0)
+            
+            # Un único contenedor, igual al de la codificación en memoria
+            with open(packed, 'rb') as f:
+                blob = f.read()
+            self.assertEqual(blob, HuffmanCoding().compress(text))
+            
+            self.assertEqual(self.huffman.decode_file(packed, restored)['characters'], len(text))
+            with open(restored, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), text)
+            
+            # Decodificación por tramos muy pequeños
+            with open(packed, 'rb') as f, open(restored, 'w', encoding='utf-8', newline='') as out:
+                self.huffman.decode_stream(f, out, chunk_size=7)
+            with open(restored, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), text)
+            
+            with open(packed, 'wb') as f:
+                f.write(blob[:-3])
+            with self.assertRaises(HuffmanError):
+                self.huffman.decode_file(packed, restored)
+    
+    def test_huffman_file_atomic_output(self):
+        """Probar que la salida nunca queda a medias ni pisa la entrada"""
+        text = "texto de prueba para el archivo\n" * 40
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "entrada.txt")
+            packed = os.path.join(directory, "entrada.huf")
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            
+            # Mismo archivo de entrada y salida (también por otra ruta)
+            for output in (source, os.path.join(directory, ".", "entrada.txt")):
+                with self.assertRaises(HuffmanError):
+                    self.huffman.encode_file(source, output)
+            self.huffman.encode_file(source, packed)
+            with self.assertRaises(HuffmanError):
+                self.huffman.decode_file(packed, packed)
+            with open(source, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), text)
+            
+            # Un fallo a mitad de la segunda pasada conserva el destino anterior
+            with open(packed, 'rb') as f:
+                previous = f.read()
+            with mock.patch.object(HuffmanCoding, 'pack_chunks', side_effect=OSError("disco lleno")):
+                with self.assertRaises(OSError):
+                    self.huffman.encode_file(source, packed)
+            with open(packed, 'rb') as f:
+                self.assertEqual(f.read(), previous)
+            self.assertEqual(sorted(os.listdir(directory)), ["entrada.huf", "entrada.txt"])
+    
+    def test_huffman_file_one_pass(self):
+        """Probar el modo por bloques de una sola pasada"""
+        text = "bloque " * 50 + "distinto: ΩЖ " * 40 + "x" * 130
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "entrada.txt")
+            packed = os.path.join(directory, "entrada.huf")
+            restored = os.path.join(directory, "salida.txt")
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            
+            stats = self.huffman.encode_file(source, packed, one_pass=True, block_size=100)
+            self.assertEqual(stats['blocks'], -(-len(text) // 100))
+            self.assertEqual(stats['characters'], len(text))
+            
+            self.huffman.decode_file(packed, restored)
+            with open(restored, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), text)
+            
+            # Archivo vacío: sin contenedores
+            open(source, 'w').close()
+            self.assertEqual(self.huffman.encode_file(source, packed)['compressed_bytes'], 0)
+            self.assertEqual(self.huffman.decode_file(packed, restored)['characters'], 0)
+            
+            with self.assertRaises(InvalidInputError):
+                self.huffman.encode_file(source, packed, one_pass=True, block_size=0)
+    
+    def test_huffman_bytes(self):
+        """Probar el modo de bytes con datos binarios arbitrarios"""
+        rng = random.Random(50)
+        data = bytes(range(256)) + bytes(rng.choices(range(256), [1 + (value < 16) * 40 for value in range(256)],
+                                                     k=20000))
+        
+        frequency = self.huffman.build_byte_frequency_table(data)
+        self.assertEqual(len(frequency), 256)
+        self.assertEqual(frequency[chr(0)], data.count(0))
+        with mock.patch.object(huffman_kernels, 'NUMPY_AVAILABLE', False):
+            self.assertEqual(self.huffman.build_byte_frequency_table(data), frequency)
+        
+        blob = self.huffman.compress_bytes(data)
+        self.assertLess(len(blob), len(data))
+        self.assertEqual(HuffmanCoding().decompress_bytes(blob), data)
+        self.assertEqual(HuffmanCoding().decompress_bytes(self.huffman.compress_bytes(b"\x00" * 9)), b"\x00" * 9)
+        
+        # Un contenedor de bytes no se confunde con uno de texto
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding().decompress(blob)
+        with self.assertRaises(HuffmanError):
+            HuffmanCoding().decompress_bytes(self.huffman.compress("texto"))
+        with self.assertRaises(InvalidInputError):
+            self.huffman.compress_bytes(b"")
+    
+    def test_huffman_compress_file(self):
+        """Probar la compresión de archivos binarios por tramos"""
+        rng = random.Random(7)
+        data = bytes(rng.choices(range(256), [2 ** (value % 9) for value in range(256)], k=30000))
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "datos.bin")
+            packed = os.path.join(directory, "datos.huf")
+            restored = os.path.join(directory, "restaurado.bin")
+            with open(source, 'wb') as f:
+                f.write(data)
+            
+            with mock.patch('src.crypto.tools.HUFFMAN_STREAM_CHUNK', 4096):
+                stats = self.huffman.compress_file(source, packed)
+            self.assertEqual(stats['mode'], 'bytes')
+            self.assertLess(stats['compression_ratio'], 1.0)
+            with open(packed, 'rb') as f:
+                self.assertEqual(f.read(), HuffmanCoding().compress_bytes(data))
+            
+            self.assertEqual(self.huffman.decode_file(packed, restored)['characters'], len(data))
+            with open(restored, 'rb') as f:
+                self.assertEqual(f.read(), data)
+            
+            with open(packed, 'rb') as f, open(restored, 'w') as out:
+                with self.assertRaises(HuffmanError):
+                    self.huffman.decode_stream(f, out)
+            
+            # Mismo archivo de entrada y salida; un fallo conserva el .huf anterior
+            with self.assertRaises(HuffmanError):
+                self.huffman.compress_file(source, source)
+            with open(source, 'rb') as f:
+                self.assertEqual(f.read(), data)
+            with mock.patch.object(HuffmanCoding, 'pack_chunks', side_effect=OSError("disco lleno")):
+                with self.assertRaises(OSError):
+                    self.huffman.compress_file(source, packed)
+            with open(packed, 'rb') as f:
+                self.assertEqual(f.read(), HuffmanCoding().compress_bytes(data))
+            self.assertEqual(sorted(os.listdir(directory)), ["datos.bin", "datos.huf", "restaurado.bin"])
+    
+    @unittest.skipUnless(huffman_kernels.NUMPY_AVAILABLE, "NumPy no disponible")
+    def test_huffman_vector_decoder(self):
+        """Probar que el kernel NumPy y el decodificador por tablas coinciden"""
+        rng = random.Random(2025)
+        alphabet = "aaaaaeeeeiioouu    nnssrrtlcdmpáéñ¿?ΩЖ"
+        text = "".join(rng.choice(alphabet) for _ in range(60000)) + "Ж"
+        encoded, codes, tree = self.huffman.encode(text)
+        self.assertEqual(self.huffman.decode(encoded, tree, vectorized=True), text)
+        self.assertEqual(self.huffman.decode(encoded, tree, vectorized=False), text)
+        
+        # Bloques pequeños y sin solapamiento: obliga a recorrer de nuevo segmentos no sincronizados
+        with mock.patch.object(huffman_kernels, 'BLOCK_SEGMENTS', 7), \
+                mock.patch.object(huffman_kernels, 'OVERLAP_BITS', 0):
+            self.assertEqual(self.huffman.decode(encoded, tree, vectorized=True), text)
+        
+        for length in (2, 9, 1000, 4099):
+            encoded, codes, tree = self.huffman.encode(text[-length:])
+            self.assertEqual(self.huffman.decode(encoded, tree, vectorized=True), text[-length:])
+        
+        # Flujo cortado a mitad del último código
+        truncated = HuffmanBits(encoded.data, encoded.bit_length - 1)
+        for vectorized in (True, False):
+            with self.assertRaises(InvalidInputError):
+                self.huffman.decode(truncated, tree, vectorized=vectorized)
 
 class TestBlockchain(unittest.TestCase):
     """Pruebas unitarias para simulador Blockchain"""
@@ -436,7 +732,8 @@ class TestToolsIntegration(unittest.TestCase):
         huffman = HuffmanCoding()
         original_data = "Transaction data to be compressed and stored in blockchain"
         
-        compressed_data, codes, tree = huffman.encode(original_data)
+        compressed, codes, tree = huffman.encode(original_data)
+        compressed_data = compressed.to_string()
         
         # Almacenar datos comprimidos en blockchain
         blockchain = Blockchain(difficulty=1)
@@ -478,7 +775,8 @@ class TestToolsIntegration(unittest.TestCase):
         huffman = HuffmanCoding()
         original_message = "Important document that needs to be compressed, stored securely, and verified for integrity"
         
-        compressed_data, codes, tree = huffman.encode(original_message)
+        compressed, codes, tree = huffman.encode(original_message)
+        compressed_data = compressed.to_string()
         
         # 2. Almacenar en blockchain
         blockchain = Blockchain(difficulty=1)